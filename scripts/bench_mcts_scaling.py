@@ -0,0 +1,39 @@
+from dlgo.goboard_fast import GameState
+from dlgo.mcts.mcts import MCTSAgent
+from dlgo.mcts.rollout import ProcessPoolRollouts
+import contextlib
+import io
+import os
+import time
+
+_BOARD_SIZE = 9
+_ROUNDS = 2000
+
+
+def rounds_per_second(search_mode: str, num_workers: int) -> float:
+    agent = MCTSAgent(_ROUNDS, temperature=1.4, rollout_backend='local', search_mode=search_mode)
+    agent.rollouts = ProcessPoolRollouts(num_workers)
+    agent.leaves_in_flight = 2 * num_workers
+    game = GameState.new_game(_BOARD_SIZE)
+    agent.rollouts.run(sum, []).result()  # start the workers before the clock
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.time()
+        agent.select_move(game)
+        elapsed = time.time() - start
+    agent.close()
+    return _ROUNDS / elapsed
+
+
+def main():
+    print('{:<8}{:>8}{:>16}'.format('mode', 'workers', 'rounds/sec'))
+    num_workers = 1
+    while True:
+        for search_mode in ('serial', 'tree', 'root'):
+            print('{:<8}{:>8}{:>16.1f}'.format(search_mode, num_workers, rounds_per_second(search_mode, num_workers)))
+        if num_workers == os.cpu_count():
+            break
+        num_workers = min(2 * num_workers, os.cpu_count() or 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+from dlgo.goboard_fast import GameState
+from dlgo.agent.random_bot import FastRandomAgent
+from dlgo.playout.batch import play_out_batch
+from dlgo.playout.patterns import HeavyPolicy
+from dlgo.playout.playout import play_out
+import time
+
+_BATCH_SIZE = 256
+_HEAVY = HeavyPolicy()
+
+
+def agent_playout(game: GameState) -> int:
+    """Rollout the way MCTSAgent used to do it: FastRandomAgent moves on full GameState objects"""
+    bot = FastRandomAgent()
+    while not game.is_over():
+        game = game.apply_move(bot.select_move(game))
+    return 1
+
+
+def light_playout(game: GameState) -> int:
+    play_out(game)
+    return 1
+
+
+def heavy_playout(game: GameState) -> int:
+    play_out(game, policy=_HEAVY)
+    return 1
+
+
+def batch_playout(game: GameState) -> int:
+    return len(play_out_batch(game, _BATCH_SIZE))
+
+
+def playouts_per_second(playout, board_size: int, seconds: float = 3.0) -> float:
+    """playout(game) plays some games from game and returns how many"""
+    game: GameState = GameState.new_game(board_size)
+    count = 0
+    start = time.time()
+    while time.time() - start < seconds:
+        count += playout(game)
+    return count / (time.time() - start)
+
+
+def main():
+    print('{:<12}{:>8}{:>16}'.format('engine', 'board', 'playouts/sec'))
+    for board_size in (9, 19):
+        for name, playout in (('GameState', agent_playout), ('play_out', light_playout), ('heavy', heavy_playout),
+                               ('batch', batch_playout)):
+            print('{:<12}{:>8}{:>16.1f}'.format(name, '%dx%d' % (board_size, board_size),
+                                                playouts_per_second(playout, board_size)))
+
+
+if __name__ == '__main__':
+    main()
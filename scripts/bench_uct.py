@@ -0,0 +1,64 @@
+from dlgo.goboard_fast import GameState
+from dlgo.gotypes import Player
+from dlgo.mcts.mcts import MCTSAgent, MCTSNode
+from dlgo.mcts.tree import TreeStore
+import math
+import random
+import timeit
+
+_CALLS = 2000
+
+
+def loop_select_child(node: MCTSNode, temperature: float) -> MCTSNode:
+    """select_child as it was: sums the children and scores them one by one"""
+    total_rollouts = sum(child.num_rollouts + child.virtual_losses for child in node.children)
+    log_rollouts = math.log(total_rollouts)
+    best_score = -1.0
+    best_child = node.children[0]
+    for child in node.children:
+        num_rollouts = child.num_rollouts + child.virtual_losses
+        win_percentage = child.win_counts[node.game_state.next_player] / num_rollouts
+        uct_score = win_percentage + temperature * math.sqrt(log_rollouts / num_rollouts)
+        if uct_score > best_score:
+            best_score = uct_score
+            best_child = child
+    return best_child
+
+
+def build(num_children: int):
+    game = GameState.new_game(19)
+    node = MCTSNode(game)
+    store = TreeStore(game.next_player)
+    moves = game.legal_moves()
+    for i in range(num_children):
+        child = MCTSNode(game, node, moves[i])
+        node.add_child(child, moves[i])
+        store_child = store.add_child(0, i)
+        rollouts = random.randint(1, 100)
+        wins = random.randint(0, rollouts)
+        child.num_rollouts = rollouts
+        child.win_counts[Player.black] = wins
+        node.edge_rollouts[i] = rollouts
+        node.edge_wins[i] = wins
+        node.num_rollouts += rollouts
+        store.visits[store_child] = rollouts
+        store.black_wins[store_child] = wins
+    store.visits[0] = node.num_rollouts
+    return node, store
+
+
+def main():
+    agent = MCTSAgent(1, temperature=1.4, rollout_backend='local')
+    print('{:>9}{:>14}{:>14}{:>14}'.format('children', 'loop us', 'MCTSNode us', 'TreeStore us'))
+    for num_children in (50, 100, 361):
+        node, store = build(num_children)
+        assert loop_select_child(node, 1.4) is agent.select_child(node)
+        loop = timeit.timeit(lambda: loop_select_child(node, 1.4), number=_CALLS)
+        vectorized = timeit.timeit(lambda: agent.select_child(node), number=_CALLS)
+        compact = timeit.timeit(lambda: store.select_child(0, 1.4), number=_CALLS)
+        print('{:>9}{:>14.1f}{:>14.1f}{:>14.1f}'.format(num_children, *(1e6 * t / _CALLS for t in (loop, vectorized,
+                                                                                                      compact))))
+
+
+if __name__ == '__main__':
+    main()
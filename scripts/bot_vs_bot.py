@@ -1,4 +1,4 @@
-from dlgo.goboard import GameState
+from dlgo.goboard_fast import GameState
 import dlgo.gotypes as gotypes
 from dlgo.scoring import compute_game_result
 from dlgo.agent.random_bot import RandomAgent, FastRandomAgent
@@ -22,7 +22,7 @@ def main():
         # gotypes.Player.white: FastRandomAgent(),
         # gotypes.Player.black: FastRandomAgent(),
         # gotypes.Player.black: AlphaBetaAgent(max_depth=1, ev_fn=eval_fn),
-        gotypes.Player.black: MCTSAgent(2500, temperature=1.4, parallel_rollouts=True),
+        gotypes.Player.black: MCTSAgent(2500, temperature=1.4, parallel_rollouts=True, search_mode='tree'),
         gotypes.Player.white: AlphaBetaAgent(max_depth=3, ev_fn=eval_fn2),
     }
     while not game.is_over():
@@ -1,4 +1,4 @@
-from dlgo.goboard import GameState
+from dlgo.goboard_fast import GameState
 import dlgo.gotypes as gotypes
 from dlgo.scoring import compute_game_result
 from dlgo.mcts.mcts import MCTSAgent
@@ -12,8 +12,8 @@ def main():
     game: GameState = GameState.new_game(board_size)
     bots = {
         # gotypes.Player.white: MCTSAgent(4000, temperature=1.4),
-        gotypes.Player.white: MCTSAgent(5000, temperature=1.4, parallel_rollouts=True),
-        gotypes.Player.black: MCTSAgent(5000, temperature=1.1, parallel_rollouts=True),
+        gotypes.Player.white: MCTSAgent(5000, temperature=1.4, rollout_backend='process', search_mode='tree'),
+        gotypes.Player.black: MCTSAgent(5000, temperature=1.1, rollout_backend='process', search_mode='tree'),
     }
     while not game.is_over():
         bot_move = bots[game.next_player].select_move(game)
@@ -25,6 +25,8 @@ def main():
         print(compute_game_result(game))
 
     print(compute_game_result(game))
+    for bot in bots.values():
+        bot.close()
 
 
 if __name__ == '__main__':
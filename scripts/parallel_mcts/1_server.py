@@ -1,7 +1,11 @@
 import zmq
 import sys
 
-_NUMBER_OF_PARALLEL_RUNS = 4
+from dlgo.config.config import config
+from dlgo.mcts.wire import encode_task
+
+_NUMBER_OF_PARALLEL_RUNS = 4  # tasks per request, spread over the workers
+_GAMES_PER_TASK = int(config['ENGINE'].get('MCTS_ROLLOUTS_PER_TASK', '1'))  # games a worker plays per task
 
 
 def main():
@@ -24,8 +28,9 @@ def main():
     print("[Rollout Server] started...")
     sys.stdout.flush()
     while True:
-        # Wait for next set of tasks from client
-        task = sim_games_server.recv_pyobj()
+        # Wait for next set of tasks from client: an encoded game state (dlgo.mcts.wire)
+        game_state_data = sim_games_server.recv()
+        task = encode_task(game_state_data, _GAMES_PER_TASK)
 
         tasks_count = _NUMBER_OF_PARALLEL_RUNS
         # print("Received task".format(task))
@@ -35,11 +40,11 @@ def main():
 
         for i in range(tasks_count):
             # print("Sending to worker a task")
-            sender_to_workers.send_pyobj(task)
+            sender_to_workers.send(task)
 
-        solutions = collector_server.recv_pyobj()
+        solutions = collector_server.recv()
         # print("Received {} solutions, sending back...".format(len(solutions)))
-        sim_games_server.send_pyobj(solutions)
+        sim_games_server.send(solutions)
 
 
 if __name__ == '__main__':
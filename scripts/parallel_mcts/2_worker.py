@@ -2,9 +2,15 @@ from __future__ import annotations
 import zmq
 import sys
 
-from dlgo.mcts.mcts import MCTSAgent
+from dlgo.config.config import config
+from dlgo.mcts.rollout import simulate_rollouts
+from dlgo.mcts.wire import decode_task
 from dlgo.goboard import GameState
-from dlgo.gotypes import Player
+from dlgo.playout.patterns import create_playout_policy
+from dlgo.playout.playout import RolloutStats
+
+_BATCHED_PLAYOUTS = False  # play the games of a task as one NumPy batch (see scripts/bench_playouts.py)
+_PLAYOUT_POLICY = config['ENGINE'].get('MCTS_PLAYOUT_POLICY', 'light')  # light or heavy (dlgo.playout.patterns)
 
 
 def main():
@@ -17,18 +23,22 @@ def main():
     collector = context.socket(zmq.PUSH)
     collector.connect("tcp://localhost:5558")
 
+    policy = create_playout_policy(_PLAYOUT_POLICY)
+
     print("[Worker] started...")
     sys.stdout.flush()
     # Process tasks forever
     while True:
-        task: GameState = receiver.recv_pyobj()
+        task: GameState
+        num_games: int
+        task, num_games = decode_task(receiver.recv())
         # print("Received task")
 
         # Do the work
-        winner: Player = MCTSAgent.simulate_random_game(task)
+        stats: RolloutStats = simulate_rollouts(task, num_games, _BATCHED_PLAYOUTS, policy)
 
         # Send results to collector
-        collector.send_pyobj(winner)
+        collector.send(stats.to_bytes())
 
 
 if __name__ == '__main__':
@@ -1,9 +1,8 @@
 import zmq
 import sys
 from time import time
-from typing import List
 
-from dlgo.gotypes import Player
+from dlgo.playout.playout import RolloutStats
 
 
 def main():
@@ -23,24 +22,20 @@ def main():
     sys.stdout.flush()
     start = time()  # seconds
     while True:
-        solutions: List[Player] = []
         # Received signal about the start of batch
         tasks_count = int(collector_server.recv_string())
         # print("Collector received signal that {} tasks' solutions are coming soon...")
 
         # Collect tasks solutions
-        for i in range(tasks_count):
-            s = receiver.recv_pyobj()
+        solutions = RolloutStats.from_bytes(receiver.recv())
+        for i in range(1, tasks_count):
             # print("Received solution number {}".format(i + 1))
-            solutions.append(s)
-
-        collector_server.send_pyobj(solutions)
-        j += tasks_count
-        for winner in solutions:
-            if winner == Player.white:
-                white_wins += 1
-            else:
-                black_wins += 1
+            solutions.merge(RolloutStats.from_bytes(receiver.recv()))
+
+        collector_server.send(solutions.to_bytes())
+        j += solutions.num_games
+        white_wins += solutions.white_wins
+        black_wins += solutions.black_wins
         if j >= 1000:
             end = time()  # seconds
             delta = end - start
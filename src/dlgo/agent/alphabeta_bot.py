@@ -17,12 +17,16 @@ class AlphaBetaAgent(Agent):
     def select_move(self, game_state: GameState):
         best_moves: List[Move] = []
         best_score = float("-inf")
+        player = game_state.next_player
+        # Search on a private copy, walking the tree in place with make_move / unmake_move.
+        search_state = game_state.clone()
         # Loop over all legal moves.
         for possible_move in game_state.legal_moves():
-            if possible_move.point and is_point_an_eye(game_state.board, possible_move.point, game_state.next_player):
+            if possible_move.point and is_point_an_eye(game_state.board, possible_move.point, player):
                 continue  # skip the eye
-            next_state = game_state.apply_move(possible_move)
-            result = alphabeta(next_state, False, game_state.next_player, self.max_depth, ev_fn=self.ev_fn)
+            search_state.make_move(possible_move)
+            result = alphabeta(search_state, False, player, self.max_depth, ev_fn=self.ev_fn)
+            search_state.unmake_move()
             if (not best_moves) or result > best_score:
                 best_moves = [possible_move]
                 best_score = result
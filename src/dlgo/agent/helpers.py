@@ -1,4 +1,5 @@
 from dlgo.gotypes import Point, Player
+from dlgo import goboard_fast
 from dlgo.goboard import Board
 from typing import List
 
@@ -13,7 +14,10 @@ def is_point_an_eye(board: Board, point: Point, color: Player):
     adjacent points are filled with friendly stones.
     NOTE Experienced Go players may notice that the preceding definition of eye will miss a valid eye in some cases.
     We’ll accept those errors to keep the implementation simple.
+    On a dlgo.goboard_fast board this is a lookup in the board's neighbor counters.
     """
+    if isinstance(board, goboard_fast.Board):
+        return board.is_eye(color.value, point.row * board.layout.stride + point.col)
     if board.get(point) is not None:
         return False
     for neighbor in board.neighbors(point):
@@ -4,7 +4,7 @@ from dlgo.gotypes import Player, Point
 from dlgo.scoring import compute_game_result
 from dlgo import zobrist
 from dlgo.utils.utils import MoveAge
-from typing import Tuple, Dict, List, Iterable, Optional, FrozenSet, cast
+from typing import Tuple, Dict, List, Iterable, Optional, Union, cast
 
 from dlgo.utils.profiling import timing
 
@@ -12,7 +12,8 @@ __all__ = [
     'Board',
     'GameState',
     'Move',
-    'GoString'
+    'GoString',
+    'SituationHistory',
 ]
 
 neighbor_tables = {}
@@ -97,6 +98,14 @@ class Board:
         self.num_cols = num_cols
         self._grid: Dict[Point, Optional[GoString]] = {}
         self._hash = zobrist.EMPTY_BOARD
+        self._zobrist = zobrist.get_codes(num_rows, num_cols)
+        # Point where an immediate recapture would be a simple ko (set by the last place_stone)
+        self.ko_point: Optional[Point] = None
+        # make_move / undo / redo support
+        # Overwritten grid entries: a GoString to put back on its stones, or a Point to empty
+        self._journal: Optional[List[Union[GoString, Point]]] = None
+        self._undo_stack: List[Tuple] = []
+        self._redo_stack: List[Tuple[Player, Point]] = []
 
         dim = (num_rows, num_cols)
         if dim not in neighbor_tables:
@@ -122,7 +131,6 @@ class Board:
         adjacent_same_color: List[GoString] = []
         adjacent_opposite_color: List[GoString] = []
         liberties: List[Point] = []
-        self.move_ages.increment_all()
         self.move_ages.add(point)
         for neighbor in self.neighbor_table[point]:
             neighbor_string = self._grid.get(neighbor)
@@ -139,23 +147,38 @@ class Board:
 
         for same_color_string in adjacent_same_color:
             new_string = new_string.merged_with(same_color_string)
+        if self._journal is not None:
+            self._journal.append(point)
+            self._journal.extend(adjacent_same_color)
         for new_string_point in new_string.stones:
             self._grid[new_string_point] = new_string
 
-        self._hash ^= zobrist.HASH_CODE[point, player]
+        self._hash ^= self._zobrist.stone(point, player)
 
+        captured: List[Point] = []
         for other_color_string in adjacent_opposite_color:
             replacement = other_color_string.without_liberty(point)
             if replacement.num_liberties:
                 self._replace_string(replacement)
             else:
                 self._remove_string(other_color_string)
+                captured.extend(other_color_string.stones)
+
+        self.ko_point = None
+        if len(captured) == 1:
+            played_string = cast(GoString, self._grid[point])
+            if len(played_string.stones) == 1 and played_string.num_liberties == 1:
+                self.ko_point = captured[0]
 
     def _replace_string(self, new_string: GoString):
+        if self._journal is not None:
+            self._journal.append(cast(GoString, self._grid[next(iter(new_string.stones))]))
         for point in new_string.stones:
             self._grid[point] = new_string
 
     def _remove_string(self, string: GoString):
+        if self._journal is not None:
+            self._journal.append(string)
         for point in string.stones:
             self.move_ages.reset_age(point)
             # Removing a string can create liberties for other strings.
@@ -166,7 +189,55 @@ class Board:
                 if neighbor_string is not string:
                     self._replace_string(neighbor_string.with_liberty(point))
             self._grid[point] = None
-            self._hash ^= zobrist.HASH_CODE[point, string.color]
+            self._hash ^= self._zobrist.stone(point, string.color)
+
+    def make_move(self, player: Player, point: Point):
+        """
+        Place a stone in place, without copying the board, and remember how to take it back with undo().
+        Only the strings overwritten by the move are recorded; GoStrings are immutable so they can be put back
+        as they are.
+        """
+        self._make_move(player, point)
+        self._redo_stack.clear()
+
+    def _make_move(self, player: Player, point: Point):
+        journal: List[Union[GoString, Point]] = []
+        age_journal: List[Tuple[int, int, int]] = []
+        frame = (player, point, journal, self._hash, self.ko_point, age_journal)
+        self._journal = journal
+        self.move_ages.journal = age_journal
+        try:
+            self.place_stone(player, point)
+        finally:
+            self._journal = None
+            self.move_ages.journal = None
+        self._undo_stack.append(frame)
+
+    def undo(self):
+        """Take back the last make_move()"""
+        self._redo_stack.append(self._undo_move())
+
+    def _undo_move(self) -> Tuple[Player, Point]:
+        player, point, journal, self._hash, self.ko_point, age_journal = self._undo_stack.pop()
+        self.move_ages.undo_add(point, age_journal)
+        for entry in reversed(journal):
+            if isinstance(entry, GoString):
+                for p in entry.stones:
+                    self._grid[p] = entry
+            else:
+                self._grid[entry] = None
+        return player, point
+
+    def redo(self):
+        """Replay the last move taken back by undo()"""
+        player, point = self._redo_stack.pop()
+        self._make_move(player, point)
+
+    def can_undo(self) -> bool:
+        return len(self._undo_stack) > 0
+
+    def can_redo(self) -> bool:
+        return len(self._redo_stack) > 0
 
     def is_self_capture(self, player: Player, point: Point) -> bool:
         friendly_strings = []
@@ -199,6 +270,19 @@ class Board:
                     return True
         return False
 
+    def hash_after(self, player: Player, point: Point) -> int:
+        """Zobrist hash of the board once player has played at point, computed without playing it"""
+        new_hash = self._hash ^ self._zobrist.stone(point, player)
+        captured: List[GoString] = []
+        for neighbor in self.neighbor_table[point]:
+            neighbor_string = self._grid.get(neighbor)
+            if neighbor_string is not None and neighbor_string.color != player and \
+                    neighbor_string.num_liberties == 1 and neighbor_string not in captured:
+                captured.append(neighbor_string)
+                for stone in neighbor_string.stones:
+                    new_hash ^= self._zobrist.stone(stone, neighbor_string.color)
+        return new_hash
+
     def is_on_grid(self, point: Point) -> bool:
         return 1 <= point.row <= self.num_rows and 1 <= point.col <= self.num_cols
 
@@ -223,6 +307,8 @@ class Board:
         # (immutable) to GoStrings (also immutable)
         copied._grid = self._grid.copy()
         copied._hash = self._hash
+        copied.ko_point = self.ko_point
+        copied.move_ages = self.move_ages.copy()
         return copied
 
     def zobrist_hash(self) -> int:
@@ -268,18 +354,87 @@ class Move:
                (other.is_play, other.is_pass, other.is_resign, other.point)
 
 
+class _Line:
+    """Situations of one unbranched run of SituationHistory nodes, each with the length at which it first entered"""
+    __slots__ = ('situations', 'length', 'base')
+
+    def __init__(self, base: SituationHistory):
+        self.situations: Dict[Tuple[Player, int], int] = {}
+        self.length = base.length  # of the last node of the line
+        self.base = base  # node the line grew from; its situations are not in this line
+
+
+class SituationHistory:
+    """
+    Immutable history of (next player, board hash) situations, linked to the history it was extended from.
+    Game states of the same line (or of the same search tree) share their common prefix, so extending the history is
+    O(1) and a game of N moves keeps N small nodes.
+    Nodes extended one after the other share a dict of their situations, so membership is a lookup per branch point
+    on the way back to the start rather than a walk over every situation.
+    """
+    __slots__ = ('situation', 'parent', 'length', '_line')
+
+    def __init__(self, situation: Optional[Tuple[Player, int]] = None, parent: Optional[SituationHistory] = None):
+        self.situation = situation
+        self.parent = parent
+        self.length: int = 0 if parent is None else parent.length + 1
+        self._line: Optional[_Line] = None
+        if parent is not None:
+            line = parent._line
+            if line is None or line.length != parent.length:
+                # parent is the empty history or was extended before: branch off
+                line = _Line(parent)
+            line.length = self.length
+            line.situations.setdefault(cast(Tuple[Player, int], situation), self.length)
+            self._line = line
+
+    def extended(self, situation: Tuple[Player, int]) -> SituationHistory:
+        return SituationHistory(situation, self)
+
+    def __contains__(self, situation) -> bool:
+        node: SituationHistory = self
+        while node._line is not None:
+            line = node._line
+            length = line.situations.get(situation)
+            if length is not None and length <= node.length:
+                return True
+            node = line.base
+        return False
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self):
+        node = self
+        while node.length:
+            yield node.situation
+            node = cast(SituationHistory, node.parent)
+
+
+EMPTY_HISTORY = SituationHistory()
+
+
 class GameState:
+    board_class = Board
+
     def __init__(self, board: Board, next_player: Player, previous_state: Optional[GameState],
                  last_move: Optional[Move]):
         self.board = board
         self.next_player = next_player
         self.previous_state = previous_state
         self.last_move = last_move
+        self._second_last_move: Optional[Move] = None if previous_state is None else previous_state.last_move
+        self._made_moves: List[Tuple] = []  # make_move() undo records
+        # Simple ko: the point the previous play made illegal for us
+        self.ko_point: Optional[Point] = board.ko_point if last_move is not None and last_move.is_play else None
         if previous_state is None:
-            self.previous_states: FrozenSet[Tuple[Player, int]] = frozenset()
+            self.previous_states: SituationHistory = EMPTY_HISTORY
+            # Situational superko. When off, only the simple ko rule (ko_point) is enforced
+            self.superko: bool = True
         else:
-            self.previous_states = frozenset(
-                previous_state.previous_states | {(previous_state.next_player, previous_state.board.zobrist_hash())})
+            self.previous_states = previous_state.previous_states.extended(
+                (previous_state.next_player, previous_state.board.zobrist_hash()))
+            self.superko = previous_state.superko
 
     def apply_move(self, move: Move) -> GameState:
         """Return the new GameState after applying the move."""
@@ -289,12 +444,44 @@ class GameState:
             next_board.place_stone(self.next_player, point)
         else:
             next_board = self.board
-        return GameState(next_board, self.next_player.opposite, self, move)
+        return self.__class__(next_board, self.next_player.opposite, self, move)
+
+    def make_move(self, move: Move):
+        """
+        Apply the move to this state in place, without copying the board; unmake_move() takes it back.
+        Meant for tree search: previous_state is not updated while moves are made in place.
+        """
+        self._made_moves.append((self.next_player, self.last_move, self._second_last_move, self.previous_states,
+                                 self.ko_point))
+        self.previous_states = self.previous_states.extended((self.next_player, self.board.zobrist_hash()))
+        self.ko_point = None
+        if move.is_play:
+            self.board.make_move(self.next_player, cast(Point, move.point))
+            self.ko_point = self.board.ko_point
+        self.next_player = self.next_player.opposite
+        self._second_last_move = self.last_move
+        self.last_move = move
+
+    def unmake_move(self):
+        move = cast(Move, self.last_move)
+        self.next_player, self.last_move, self._second_last_move, self.previous_states, self.ko_point = \
+            self._made_moves.pop()
+        if move.is_play:
+            self.board.undo()
+
+    def clone(self) -> GameState:
+        """Copy of this state with its own board, so make_move() on the copy leaves this state alone."""
+        cloned = copy.copy(self)
+        cloned.board = copy.deepcopy(self.board)
+        cloned._made_moves = []
+        return cloned
 
     @classmethod
-    def new_game(cls, board_size: int) -> GameState:
-        board = Board(board_size, board_size)
-        return GameState(board, Player.black, None, None)
+    def new_game(cls, board_size: int, superko: bool = True) -> GameState:
+        board = cls.board_class(board_size, board_size)
+        game = cls(board, Player.black, None, None)
+        game.superko = superko
+        return game
 
     def is_move_self_capture(self, player, move):
         if not move.is_play:
@@ -309,11 +496,13 @@ class GameState:
         if not move.is_play:
             return False
         point = cast(Point, move.point)
-        if not self.board.will_capture(player, point):
+        if player == self.next_player and point == self.ko_point:
+            # Retaking a ko at once always repeats the position before the ko was taken
+            return True
+        if not self.superko or not self.board.will_capture(player, point):
             return False
-        next_board = copy.deepcopy(self.board)
-        next_board.place_stone(player, point)
-        next_situation = (player.opposite, next_board.zobrist_hash())
+        # The next hash follows from the stones the move adds and captures; the board is left alone
+        next_situation = (player.opposite, self.board.hash_after(player, point))
         return next_situation in self.previous_states
 
     def is_valid_move(self, move: Move) -> bool:
@@ -331,8 +520,7 @@ class GameState:
             return False
         if self.last_move.is_resign:
             return True
-        previous_state = cast(GameState, self.previous_state)
-        second_last_move = previous_state.last_move
+        second_last_move = self._second_last_move
         if second_last_move is None:
             return False
         return self.last_move.is_pass and second_last_move.is_pass
@@ -0,0 +1,605 @@
+"""
+Array backed drop-in replacement for dlgo.goboard
+
+The board is a flat 1-D list padded with a one point border, so the four neighbors of any on-board index are
+reachable with fixed offsets and never need a bounds check. Every stone stores the id (root index) of its string,
+strings are linked into circular lists for iteration and carry pseudo-liberty counters, so placing a stone touches
+only the stone itself and its direct neighbors.
+
+Usage: import GameState (or Board) from dlgo.goboard_fast instead of dlgo.goboard; agents do not change.
+"""
+from __future__ import annotations
+from dlgo import goboard
+from dlgo import zobrist
+from dlgo.goboard import GoString, IllegalMoveError, Move, init_neighbor_table, init_corner_table, \
+    neighbor_tables, corner_tables
+from dlgo.gotypes import Player, Point
+from dlgo.utils.utils import MoveAge
+from typing import Dict, List, Optional, Set, Tuple
+
+__all__ = [
+    'Board',
+    'StringBoard',
+    'GameState',
+    'Move',
+    'GoString',
+    'IllegalMoveError',
+]
+
+EMPTY = 0
+BLACK = Player.black.value
+WHITE = Player.white.value
+BORDER = 3
+
+PLAYER_OF_COLOR: Tuple[Optional[Player], ...] = (None, Player.black, Player.white, None)
+
+ORTHOGONAL_WEIGHT = 8  # weight of an orthogonal neighbor in BoardLayout.surround_template
+
+
+class BoardLayout:
+    """
+    Index tables shared by all boards of the same dimension.
+    Point(row, col) lives at index row * stride + col; row 0, row num_rows + 1, col 0 and col num_cols + 1 are border.
+    """
+
+    def __init__(self, num_rows: int, num_cols: int):
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.stride = num_cols + 2
+        self.size = (num_rows + 2) * self.stride
+        self.offsets: Tuple[int, ...] = (-self.stride, self.stride, -1, 1)
+        self.diagonals: Tuple[int, ...] = (-self.stride - 1, -self.stride + 1, self.stride - 1, self.stride + 1)
+
+        self.points: List[Optional[Point]] = [None] * self.size  # index -> Point
+        self.on_board: List[int] = []  # all on-board indexes, row major
+        self.template: List[int] = [BORDER] * self.size  # empty board grid
+        for r in range(1, num_rows + 1):
+            for c in range(1, num_cols + 1):
+                idx = r * self.stride + c
+                self.points[idx] = Point(row=r, col=c)
+                self.on_board.append(idx)
+                self.template[idx] = EMPTY
+
+        # Eye test tables. surround[color][index] counts the orthogonal neighbors that are color or border 8 each, the
+        # diagonal ones 1 each; an empty point is an eye of color (the dlgo.agent.helpers.is_point_an_eye definition)
+        # when surround reaches eye_threshold: all 4 orthogonal neighbors, and all 4 diagonal ones on the edge or 3
+        # of them inside the board.
+        self.surround_template: List[int] = [0] * self.size  # border contributions
+        self.eye_threshold: List[int] = [4 * ORTHOGONAL_WEIGHT + 4] * self.size  # unreachable off the board
+        for idx in self.on_board:
+            self.surround_template[idx] = \
+                ORTHOGONAL_WEIGHT * sum(self.template[idx + d] == BORDER for d in self.offsets) + \
+                sum(self.template[idx + d] == BORDER for d in self.diagonals)
+            edge = any(self.template[idx + d] == BORDER for d in self.diagonals)
+            self.eye_threshold[idx] = 4 * ORTHOGONAL_WEIGHT + (4 if edge else 3)
+
+        self.empty_mask = sum(1 << idx for idx in self.on_board)  # empty board, one bit per index
+
+        # hash_codes[color][index]
+        self.hash_codes: Tuple[List[int], ...] = zobrist.get_codes(num_rows, num_cols).stone_codes
+
+    def index(self, point: Point) -> int:
+        return point.row * self.stride + point.col
+
+
+layouts: Dict[Tuple[int, int], BoardLayout] = {}
+
+
+def get_layout(dim: Tuple[int, int]) -> BoardLayout:
+    layout = layouts.get(dim)
+    if layout is None:
+        layout = BoardLayout(*dim)
+        layouts[dim] = layout
+    return layout
+
+
+class StringBoard:
+    """
+    Stones and strings on the flat lists of a BoardLayout, shared by Board and dlgo.playout.PlayoutBoard, which add
+    what they need on top (hash, undo, empty point list, ...) around _add_stone().
+    """
+    def __init__(self, num_rows: int, num_cols: int):
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.layout = get_layout((num_rows, num_cols))
+        size = self.layout.size
+
+        self.stones: List[int] = self.layout.template.copy()  # EMPTY, BLACK, WHITE or BORDER per index
+        self.root: List[int] = [0] * size  # string id of a stone (index of the string root)
+        self.next: List[int] = [0] * size  # next stone of the same string (circular list)
+        # The following are valid at string roots only.
+        self.size: List[int] = [0] * size  # number of stones
+        self.libs: List[int] = [0] * size  # pseudo-liberties (a liberty is counted once per adjacent stone)
+        self.lib_sum: List[int] = [0] * size  # sum of pseudo-liberty indexes
+        self.lib_sum_sq: List[int] = [0] * size  # sum of squared pseudo-liberty indexes
+        # Per color, friendly and border neighbors of every point (see BoardLayout.surround_template)
+        self.surround: Tuple[List[int], ...] = ([], self.layout.surround_template.copy(),
+                                                self.layout.surround_template.copy())
+
+    def _add_stone(self, color: int, p: int) -> List[int]:
+        """Place a stone of color at index p, join it to its friendly neighbors and capture. Returns the captured
+        stones."""
+        stones = self.stones
+        root = self.root
+        libs = self.libs
+        lib_sum = self.lib_sum
+        lib_sum_sq = self.lib_sum_sq
+
+        stones[p] = color
+        root[p] = p
+        self.next[p] = p
+        self.size[p] = 1
+        surround = self.surround[color]
+        for d in self.layout.diagonals:
+            surround[p + d] += 1
+        n_libs = s_libs = sq_libs = 0
+        friends: List[int] = []
+        enemies: List[int] = []
+        p_sq = p * p
+        for d in self.layout.offsets:
+            n = p + d
+            surround[n] += ORTHOGONAL_WEIGHT
+            c = stones[n]
+            if c == EMPTY:
+                n_libs += 1
+                s_libs += n
+                sq_libs += n * n
+            elif c != BORDER:
+                r = root[n]
+                libs[r] -= 1
+                lib_sum[r] -= p
+                lib_sum_sq[r] -= p_sq
+                if c == color:
+                    if r not in friends:
+                        friends.append(r)
+                elif r not in enemies:
+                    enemies.append(r)
+        libs[p] = n_libs
+        lib_sum[p] = s_libs
+        lib_sum_sq[p] = sq_libs
+
+        string = p
+        for r in friends:
+            string = self._merge(string, r)
+        captured: List[int] = []
+        for r in enemies:
+            if libs[r] == 0:
+                captured.extend(self._remove_string(r))
+        return captured
+
+    def _ko_after(self, p: int, captured: List[int]) -> int:
+        """Index where an immediate recapture of the stone just played at p would be a simple ko, 0 if none"""
+        if len(captured) == 1 and self.size[self.root[p]] == 1 and self.in_atari(p):
+            return captured[0]
+        return 0
+
+    def _merge(self, a: int, b: int) -> int:
+        """Merge the strings rooted at a and b, relabelling the smaller one. Returns the new root."""
+        size = self.size
+        if size[a] < size[b]:
+            a, b = b, a
+        root = self.root
+        nxt = self.next
+        s = b
+        while True:
+            root[s] = a
+            s = nxt[s]
+            if s == b:
+                break
+        nxt[a], nxt[b] = nxt[b], nxt[a]
+        size[a] += size[b]
+        self.libs[a] += self.libs[b]
+        self.lib_sum[a] += self.lib_sum[b]
+        self.lib_sum_sq[a] += self.lib_sum_sq[b]
+        return a
+
+    def _remove_string(self, r: int) -> List[int]:
+        """Take the string rooted at r off the board. Returns its stones."""
+        stones = self.stones
+        root = self.root
+        offsets = self.layout.offsets
+        diagonals = self.layout.diagonals
+        nxt = self.next
+        surround = self.surround[stones[r]]
+        removed = []
+        s = r
+        while True:
+            removed.append(s)
+            stones[s] = EMPTY
+            for d in offsets:
+                surround[s + d] -= ORTHOGONAL_WEIGHT
+            for d in diagonals:
+                surround[s + d] -= 1
+            s = nxt[s]
+            if s == r:
+                break
+        # Removing a string creates liberties for the neighboring strings.
+        for s in removed:
+            s_sq = s * s
+            for d in offsets:
+                n = s + d
+                if BORDER > stones[n] > EMPTY:
+                    rn = root[n]
+                    self.libs[rn] += 1
+                    self.lib_sum[rn] += s
+                    self.lib_sum_sq[rn] += s_sq
+        return removed
+
+    def _add_surround(self, color: int, p: int, sign: int):
+        """Count a stone of color placed on p (sign 1) or taken off it (sign -1) in the surround counters"""
+        surround = self.surround[color]
+        layout = self.layout
+        for d in layout.offsets:
+            surround[p + d] += sign * ORTHOGONAL_WEIGHT
+        for d in layout.diagonals:
+            surround[p + d] += sign
+
+    def _string_stones(self, r: int) -> List[int]:
+        nxt = self.next
+        ret = [r]
+        s = nxt[r]
+        while s != r:
+            ret.append(s)
+            s = nxt[s]
+        return ret
+
+    def in_atari(self, r: int) -> bool:
+        """
+        Exactly one distinct liberty: all pseudo-liberties are the same point
+        iff (sum of squares) * count == sum ** 2 (Cauchy-Schwarz equality).
+        """
+        n = self.libs[r]
+        return n > 0 and n * self.lib_sum_sq[r] == self.lib_sum[r] * self.lib_sum[r]
+
+    def is_eye(self, color: int, p: int) -> bool:
+        """dlgo.agent.helpers.is_point_an_eye on an index, from the surround counters"""
+        return self.stones[p] == EMPTY and self.surround[color][p] >= self.layout.eye_threshold[p]
+
+
+class Board(StringBoard):
+    def __init__(self, num_rows: int, num_cols: int):
+        super().__init__(num_rows, num_cols)
+        dim = (num_rows, num_cols)
+        # Legal move generation support (see GameState.legal_moves)
+        self._empty = self.layout.empty_mask  # bit index set for every empty point
+        self._atari: Set[int] = set()  # roots of all strings in atari, and of some that left it or were merged away
+        self._hash = zobrist.EMPTY_BOARD
+        self._go_strings: Dict[int, GoString] = {}  # GoString views, keyed by root; dropped on every change
+        # Point where an immediate recapture would be a simple ko (set by the last place_stone)
+        self.ko_point: Optional[Point] = None
+        # make_move / undo / redo support
+        self._undo_stack: List[Tuple] = []
+        self._redo_stack: List[Tuple[int, int]] = []
+
+        if dim not in neighbor_tables:
+            init_neighbor_table(dim)
+        if dim not in corner_tables:
+            init_corner_table(dim)
+        self.neighbor_table = neighbor_tables[dim]
+        self.corner_table = corner_tables[dim]
+        self.move_ages = MoveAge(self)
+
+    def neighbors(self, point) -> List[Point]:
+        return self.neighbor_table[point]
+
+    def corners(self, point) -> List[Point]:
+        return self.corner_table[point]
+
+    def place_stone(self, player: Player, point: Point):
+        assert self.is_on_grid(point)
+        idx = point.row * self.layout.stride + point.col
+        if self.stones[idx] != EMPTY:
+            print('Illegal play on %s' % str(point))
+            raise IllegalMoveError()
+        self._play(player.value, idx)
+
+    def _play(self, color: int, p: int) -> List[int]:
+        """Place a stone of color at index p. Returns the indexes of the captured stones."""
+        if self._go_strings:
+            self._go_strings = {}
+        layout = self.layout
+        self.move_ages.add(layout.points[p])
+        self._empty ^= 1 << p
+        self._hash ^= layout.hash_codes[color][p]
+        captured = self._add_stone(color, p)
+        if captured:
+            codes = layout.hash_codes[3 - color]
+            for s in captured:
+                self._empty |= 1 << s
+                self._hash ^= codes[s]
+                self.move_ages.reset_age(layout.points[s])
+
+        # Only the new string and the enemy strings that lost a liberty can have gone into atari
+        stones = self.stones
+        root = self.root
+        atari = self._atari
+        if self.in_atari(root[p]):
+            atari.add(root[p])
+        other = 3 - color
+        for d in layout.offsets:
+            n = p + d
+            if stones[n] == other and self.in_atari(root[n]):
+                atari.add(root[n])
+
+        ko = self._ko_after(p, captured)
+        self.ko_point = layout.points[ko] if ko else None
+        return captured
+
+    def make_move(self, player: Player, point: Point):
+        """
+        Place a stone in place, without copying the board, and remember how to take it back with undo().
+        The undo record holds the captured stones, the previous hash and ko point; undo() rebuilds only the strings
+        around the changed points.
+        """
+        self._make_move(player, point)
+        self._redo_stack.clear()
+
+    def _make_move(self, player: Player, point: Point):
+        p = point.row * self.layout.stride + point.col
+        if self.stones[p] != EMPTY:
+            raise IllegalMoveError()
+        age_journal: List[Tuple[int, int, int]] = []
+        frame = (p, player.value, self._hash, self.ko_point, age_journal)
+        self.move_ages.journal = age_journal
+        try:
+            captured = self._play(player.value, p)
+        finally:
+            self.move_ages.journal = None
+        self._undo_stack.append(frame + (captured,))
+
+    def undo(self):
+        """Take back the last make_move()"""
+        self._redo_stack.append(self._undo_move())
+
+    def _undo_move(self) -> Tuple[int, int]:
+        p, color, self._hash, self.ko_point, age_journal, captured = self._undo_stack.pop()
+        self.move_ages.undo_add(self.layout.points[p], age_journal)
+        stones = self.stones
+        offsets = self.layout.offsets
+        if self._go_strings:
+            self._go_strings = {}
+        stones[p] = EMPTY
+        self._empty |= 1 << p
+        self._add_surround(color, p, -1)
+        other = 3 - color
+        for s in captured:
+            stones[s] = other
+            self._empty ^= 1 << s
+            self._add_surround(other, s, 1)
+        # Strings next to the removed stone or to the restored stones are the only ones that changed
+        touched = [p + d for d in offsets]
+        for s in captured:
+            touched.append(s)
+            touched.extend(s + d for d in offsets)
+        rebuilt = set()
+        for t in touched:
+            if BORDER > stones[t] > EMPTY and t not in rebuilt:
+                rebuilt.update(self._rebuild_string(t))
+                if self.in_atari(t):
+                    self._atari.add(t)
+        return p, color
+
+    def _rebuild_string(self, start: int) -> List[int]:
+        """Flood fill the string at start and recompute its links and counters from scratch"""
+        stones = self.stones
+        offsets = self.layout.offsets
+        color = stones[start]
+        members = [start]
+        seen = {start}
+        n_libs = s_libs = sq_libs = 0
+        i = 0
+        while i < len(members):
+            s = members[i]
+            i += 1
+            self.root[s] = start
+            for d in offsets:
+                n = s + d
+                c = stones[n]
+                if c == EMPTY:
+                    n_libs += 1
+                    s_libs += n
+                    sq_libs += n * n
+                elif c == color and n not in seen:
+                    seen.add(n)
+                    members.append(n)
+        nxt = self.next
+        for j in range(len(members)):
+            nxt[members[j - 1]] = members[j]
+        self.size[start] = len(members)
+        self.libs[start] = n_libs
+        self.lib_sum[start] = s_libs
+        self.lib_sum_sq[start] = sq_libs
+        return members
+
+    def redo(self):
+        """Replay the last move taken back by undo()"""
+        p, color = self._redo_stack.pop()
+        self._make_move(PLAYER_OF_COLOR[color], self.layout.points[p])
+
+    def can_undo(self) -> bool:
+        return len(self._undo_stack) > 0
+
+    def can_redo(self) -> bool:
+        return len(self._redo_stack) > 0
+
+    def _string_liberties(self, r: int) -> List[int]:
+        stones = self.stones
+        ret = set()
+        for s in self._string_stones(r):
+            for d in self.layout.offsets:
+                if stones[s + d] == EMPTY:
+                    ret.add(s + d)
+        return list(ret)
+
+    def _atari_liberties(self) -> Set[int]:
+        """The only liberty of every string in atari. Drops the strings that are no longer in atari from _atari."""
+        stones = self.stones
+        root = self.root
+        self._atari = {r for r in self._atari if root[r] == r and stones[r] != EMPTY and self.in_atari(r)}
+        return {self.lib_sum[r] // self.libs[r] for r in self._atari}
+
+    def is_self_capture(self, player: Player, point: Point) -> bool:
+        p = point.row * self.layout.stride + point.col
+        color = player.value
+        stones = self.stones
+        root = self.root
+        for d in self.layout.offsets:
+            c = stones[p + d]
+            if c == EMPTY:
+                # This point has a liberty. Can't be self capture.
+                return False
+            elif c == BORDER:
+                continue
+            elif c == color:
+                if not self.in_atari(root[p + d]):
+                    # A friendly string keeps a liberty after the move.
+                    return False
+            elif self.in_atari(root[p + d]):
+                # This move is real capture, not a self capture.
+                return False
+        return True
+
+    def will_capture(self, player: Player, point: Point) -> bool:
+        p = point.row * self.layout.stride + point.col
+        other = 3 - player.value
+        stones = self.stones
+        for d in self.layout.offsets:
+            if stones[p + d] == other and self.in_atari(self.root[p + d]):
+                # This move would capture.
+                return True
+        return False
+
+    def hash_after(self, player: Player, point: Point) -> int:
+        """Zobrist hash of the board once player has played at point, computed without playing it"""
+        p = point.row * self.layout.stride + point.col
+        color = player.value
+        other = 3 - color
+        stones = self.stones
+        codes = self.layout.hash_codes[other]
+        new_hash = self._hash ^ self.layout.hash_codes[color][p]
+        captured: List[int] = []
+        for d in self.layout.offsets:
+            n = p + d
+            if stones[n] == other:
+                r = self.root[n]
+                if r not in captured and self.in_atari(r):
+                    captured.append(r)
+                    for s in self._string_stones(r):
+                        new_hash ^= codes[s]
+        return new_hash
+
+    def is_on_grid(self, point: Point) -> bool:
+        return 1 <= point.row <= self.num_rows and 1 <= point.col <= self.num_cols
+
+    def get(self, point: Point) -> Optional[Player]:
+        return PLAYER_OF_COLOR[self.stones[point.row * self.layout.stride + point.col]]
+
+    def get_go_string(self, point: Point) -> Optional[GoString]:
+        p = point.row * self.layout.stride + point.col
+        color = PLAYER_OF_COLOR[self.stones[p]]
+        if color is None:
+            return None
+        r = self.root[p]
+        go_string = self._go_strings.get(r)
+        if go_string is None:
+            points = self.layout.points
+            go_string = GoString(color,
+                                 [points[s] for s in self._string_stones(r)],
+                                 [points[s] for s in self._string_liberties(r)])
+            self._go_strings[r] = go_string
+        return go_string
+
+    def __eq__(self, other):
+        return isinstance(other, Board) and \
+               self.num_rows == other.num_rows and \
+               self.num_cols == other.num_cols and \
+               self._hash == other._hash
+
+    def __deepcopy__(self, memodict=None):
+        return self.copy()
+
+    def copy(self) -> Board:
+        copied = Board.__new__(Board)
+        copied.num_rows = self.num_rows
+        copied.num_cols = self.num_cols
+        copied.layout = self.layout
+        # All per-point state lives in flat lists of ints, so shallow list copies are enough
+        copied.stones = self.stones.copy()
+        copied.root = self.root.copy()
+        copied.next = self.next.copy()
+        copied.size = self.size.copy()
+        copied.libs = self.libs.copy()
+        copied.lib_sum = self.lib_sum.copy()
+        copied.lib_sum_sq = self.lib_sum_sq.copy()
+        copied.surround = ([], self.surround[BLACK].copy(), self.surround[WHITE].copy())
+        copied._empty = self._empty
+        copied._atari = set(self._atari)
+        copied._hash = self._hash
+        copied._go_strings = {}
+        copied.ko_point = self.ko_point
+        copied._undo_stack = []
+        copied._redo_stack = []
+        copied.neighbor_table = self.neighbor_table
+        copied.corner_table = self.corner_table
+        copied.move_ages = self.move_ages.copy()
+        return copied
+
+    def zobrist_hash(self) -> int:
+        return self._hash
+
+
+class GameState(goboard.GameState):
+    board_class = Board
+
+    def apply_move(self, move: Move) -> GameState:
+        """Return the new GameState after applying the move."""
+        if move.is_play:
+            next_board = self.board.copy()
+            next_board.place_stone(self.next_player, move.point)
+        else:
+            next_board = self.board
+        return GameState(next_board, self.next_player.opposite, self, move)
+
+    def is_valid_move(self, move: Move) -> bool:
+        if self.is_over():
+            return False
+        if not move.is_play:
+            return True
+        board: Board = self.board
+        point = move.point
+        if not board.is_on_grid(point) or board.get(point) is not None:
+            return False
+        return not board.is_self_capture(self.next_player, point) and \
+            not self.does_move_violate_ko(self.next_player, move)
+
+    def legal_moves(self) -> List[Move]:
+        """
+        goboard.GameState.legal_moves without a full test per point. An empty point with an empty neighbor is neither
+        a self capture nor a capture, so it is legal unless it is the only liberty of a string in atari or the ko
+        point; only those and the empty points without an empty neighbor go through is_valid_move.
+        """
+        if self.is_over():
+            return []
+        board: Board = self.board
+        stones = board.stones
+        up, down, left, right = board.layout.offsets
+        points = board.layout.points
+        checked = board._atari_liberties()
+        if self.ko_point is not None:
+            checked.add(board.layout.index(self.ko_point))
+        moves = []
+        empty = board._empty
+        while empty:  # set bits from the lowest index up: row major order
+            low = empty & -empty
+            empty ^= low
+            p = low.bit_length() - 1
+            move = Move.play(points[p])
+            if p not in checked and (stones[p + up] == EMPTY or stones[p + down] == EMPTY or
+                                     stones[p + left] == EMPTY or stones[p + right] == EMPTY):
+                moves.append(move)
+            elif self.is_valid_move(move):
+                moves.append(move)
+        # These two moves are always legal.
+        moves.append(Move.pass_turn())
+        moves.append(Move.resign())
+        return moves
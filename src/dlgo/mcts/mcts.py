@@ -4,47 +4,251 @@ Monte Carlo tree search
 from __future__ import annotations
 import math
 import random
-import copy
-import zmq
+import time
+import numpy as np
 
-from typing import Dict, List, Optional, Tuple, cast
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+
+from typing import Any, Dict, List, Optional, Tuple, cast
 from dlgo.agent.base import Agent
 from dlgo.agent.helpers import is_point_an_eye
-from dlgo.agent.random_bot import FastRandomAgent
 from dlgo.goboard import GameState, Move, Board
-from dlgo.gotypes import Player
+from dlgo.gotypes import Player, Point
+from dlgo.mcts import rollout
+from dlgo.mcts.prior import order_by_prior
+from dlgo.mcts.rollout import RolloutBackend, create_rollout_backend, detached
+from dlgo.mcts.transposition import TranspositionTable, position_key
+from dlgo.playout.playout import RolloutStats
+
+
+_play_moves: Dict[Tuple[int, int], List[Move]] = {}
+
+
+def play_moves(num_rows: int, num_cols: int) -> List[Move]:
+    """Move.play of every point, row major; shared, do not modify"""
+    dim = (num_rows, num_cols)
+    plays = _play_moves.get(dim)
+    if plays is None:
+        plays = [Move.play(Point(row, col)) for row in range(1, num_rows + 1) for col in range(1, num_cols + 1)]
+        _play_moves[dim] = plays
+    return plays
+
+
+def move_index(board: Board, move: Move) -> int:
+    """Row major index of the point of move, -1 for pass and resign"""
+    if not move.is_play:
+        return -1
+    point = cast(Point, move.point)
+    return (point.row - 1) * board.num_cols + point.col - 1
+
+
+def candidate_moves(game_state: GameState) -> List[Move]:
+    """Play on every empty point, pass and resign: a superset of the legal moves that is cheap to build"""
+    if game_state.is_over():
+        return []
+    board = game_state.board
+    moves = [move for move in play_moves(board.num_rows, board.num_cols) if board.get(move.point) is None]
+    moves.append(Move.pass_turn())
+    moves.append(Move.resign())
+    return moves
+
+
+class SearchBudget:
+    """Rounds and wall-clock seconds a search may use, counted from its creation; 0 for no limit"""
+    def __init__(self, num_rounds: int, time_limit: float = 0.0):
+        self.num_rounds = num_rounds
+        self.time_limit = time_limit
+        self.start = time.perf_counter()
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+    def exhausted(self, rounds: int) -> bool:
+        if self.num_rounds and rounds >= self.num_rounds:
+            return True
+        return bool(self.time_limit) and self.elapsed() >= self.time_limit
+
+    def rounds_left(self, rounds: int) -> float:
+        """Upper estimate of the rounds still to come after rounds, from the rate so far when time is limited"""
+        left = self.num_rounds - rounds if self.num_rounds else math.inf
+        elapsed = self.elapsed()
+        if self.time_limit and rounds and elapsed > 0:
+            left = min(left, math.ceil(rounds * max(self.time_limit - elapsed, 0.0) / elapsed))
+        return left
+
+
+def is_decided(visits: np.ndarray, rounds_left: float) -> bool:
+    """Whether the most visited of the children with these visit counts stays so whatever the rounds left do"""
+    if len(visits) < 2:
+        return len(visits) == 1
+    second, first = np.partition(visits, len(visits) - 2)[-2:]
+    return first - second > rounds_left
+
+
+class SearchStats:
+    """Metrics of one search, counted as it goes (no tree walk); times in seconds"""
+    def __init__(self):
+        self.rounds = 0
+        self.rollouts = 0
+        self.elapsed = 0.0
+        self.tree_size = 0  # nodes under the root, the root included
+        self.max_depth = 0
+        self.leaf_depth_sum = 0  # depth of the leaf of every round, for the average
+        self.reused_rollouts = 0  # rollouts the root already had from the previous searches
+        self.stopped_early = False
+        self.select_time = 0.0  # walking down the tree
+        self.expand_time = 0.0  # adding the new leaf
+        self.simulate_time = 0.0  # rollouts; in tree mode, submitting and waiting for them
+        self.backprop_time = 0.0
+
+    def add_leaf(self, depth: int, start: float, expand_start: float, end: float):
+        self.leaf_depth_sum += depth
+        self.max_depth = max(self.max_depth, depth)
+        self.select_time += expand_start - start
+        self.expand_time += end - expand_start
+
+    def as_dict(self) -> Dict[str, float]:
+        elapsed = self.elapsed or math.inf
+        return {
+            'rounds': self.rounds,
+            'rollouts': self.rollouts,
+            'time': self.elapsed,
+            'rounds_per_sec': self.rounds / elapsed,
+            'playouts_per_sec': self.rollouts / elapsed,
+            'tree_size': self.tree_size,
+            'max_depth': self.max_depth,
+            'avg_depth': self.leaf_depth_sum / self.rounds if self.rounds else 0.0,
+            'reused_rollouts': self.reused_rollouts,
+            'stopped_early': self.stopped_early,
+            'select_time': self.select_time,
+            'expand_time': self.expand_time,
+            'simulate_time': self.simulate_time,
+            'backprop_time': self.backprop_time,
+        }
+
+    def print(self):
+        metrics = self.as_dict()
+        print('{rounds} rounds, {rollouts} playouts in {time:.2f}s: {rounds_per_sec:.0f} rounds/s, '
+              '{playouts_per_sec:.0f} playouts/s'.format(**metrics))
+        print('tree: {tree_size} nodes, depth {max_depth} max, {avg_depth:.1f} average leaf'.format(**metrics))
+        print('time: select {select_time:.3f}s, expand {expand_time:.3f}s, simulate {simulate_time:.3f}s, '
+              'backprop {backprop_time:.3f}s'.format(**metrics))
 
 
 class MCTSNode:
-    def __init__(self, game_state: GameState, parent: MCTSNode = None, last_move: Move = None):
+    def __init__(self, game_state: GameState, parent: MCTSNode = None, last_move: Move = None,
+                 widening: Optional[float] = None):
+        """
+        widening: progressive widening, inherited from the parent by default: a node with n rollouts has at most
+                  1 + widening * sqrt(n) children, added in the order of dlgo.mcts.prior; 0 expands every move in
+                  random order
+        """
         self.game_state = game_state
         self.parent = parent
         self.last_move = last_move
+        if widening is None:
+            widening = parent.widening if parent is not None else 0.0
+        self.widening = widening
         self.win_counts: Dict[Player, int] = {
             Player.black: 0,
             Player.white: 0,
         }
         self.num_rollouts: int = 0
+        self.virtual_losses: int = 0  # rollouts in flight through this node, counted as losses until they are back
         self.children: List[MCTSNode] = []
-        b: Board = game_state.board
-        p: Player = game_state.next_player
-        moves: List[Move] = game_state.legal_moves()
-        self.unvisited_moves: List[Move] = [m for m in moves if not (m.point and is_point_an_eye(b, m.point, p))]
-
-    def add_random_child(self) -> MCTSNode:
-        index = random.randint(0, len(self.unvisited_moves) - 1)
-        new_move = self.unvisited_moves.pop(index)
+        self.child_moves: List[Move] = []  # move leading to each child; with transpositions, a child may be shared
+        # Statistics of the edges to the children, in children order, for UCT over all children at once: rollouts,
+        # wins of the player to move here, and pending rollouts (virtual losses). With transpositions they only
+        # count the rollouts that went through this node.
+        self.edge_rollouts = np.zeros(4, dtype=np.int64)
+        self.edge_wins = np.zeros(4, dtype=np.int64)
+        self.edge_virtual_losses = np.zeros(4, dtype=np.int64)
+        self.edge_points = np.zeros(4, dtype=np.int64)  # point of each child's move, row major; -1 for pass, resign
+        # All-moves-as-first statistics for RAVE, per point row major plus an always empty slot for pass and resign:
+        # rollouts where the player to move here played the point first after this node, and how many of them they
+        # won. Allocated by the first RAVE backpropagation through the node.
+        self.amaf_rollouts: Optional[np.ndarray] = None
+        self.amaf_wins: Optional[np.ndarray] = None
+        # Moves not expanded yet: built on the first expansion (most nodes never get one), and checked for
+        # legality only when drawn
+        self._candidates: Optional[List[Move]] = None
+        self._next_move: Optional[Move] = None  # drawn by can_add_child(), known to be legal and not an eye
+
+    def add_random_child(self, table: Optional[TranspositionTable] = None, path: List[MCTSNode] = None) -> MCTSNode:
+        """
+        table: share the node of the new position with other parents, unless it is on path (the nodes from the root
+               to this one), which would make a cycle
+        """
+        assert self.can_add_child()
+        new_move = cast(Move, self._next_move)
+        self._next_move = None
         new_game_state = self.game_state.apply_move(new_move)
-        new_node = MCTSNode(new_game_state, self, new_move)
-        self.children.append(new_node)
+        new_node = None
+        if table is not None:
+            new_node = table.get(new_game_state)
+            if new_node is not None and path is not None and new_node in path:
+                new_node = None
+        if new_node is None:
+            new_node = MCTSNode(new_game_state, self, new_move)
+            if table is not None:
+                table.put(new_node)
+        self.add_child(new_node, new_move)
         return new_node
 
+    def add_child(self, child: MCTSNode, move: Move):
+        if len(self.children) == len(self.edge_rollouts):
+            self.edge_rollouts = np.concatenate([self.edge_rollouts, np.zeros_like(self.edge_rollouts)])
+            self.edge_wins = np.concatenate([self.edge_wins, np.zeros_like(self.edge_wins)])
+            self.edge_virtual_losses = np.concatenate([self.edge_virtual_losses,
+                                                       np.zeros_like(self.edge_virtual_losses)])
+            self.edge_points = np.concatenate([self.edge_points, np.zeros_like(self.edge_points)])
+        self.edge_points[len(self.children)] = move_index(self.game_state.board, move)
+        self.children.append(child)
+        self.child_moves.append(move)
+
     def increment_win(self, winner):
         self.win_counts[winner] += 1
         self.num_rollouts += 1
 
+    def add_stats(self, stats: RolloutStats):
+        self.win_counts[Player.black] += stats.black_wins
+        self.win_counts[Player.white] += stats.white_wins
+        self.num_rollouts += stats.num_games
+
     def can_add_child(self) -> bool:
-        return len(self.unvisited_moves) > 0
+        if self.widening and len(self.children) >= 1 + self.widening * math.sqrt(self.num_rollouts):
+            return False
+        if self._next_move is None:
+            self._next_move = self._draw_move()
+        return self._next_move is not None
+
+    def _draw_move(self) -> Optional[Move]:
+        """
+        An unexpanded legal move that does not fill our own eye, or None when there is none left: the one with the
+        best prior with progressive widening, a random one otherwise
+        """
+        game_state = self.game_state
+        if self._candidates is None:
+            self._candidates = candidate_moves(game_state)
+            if self.widening:
+                self._candidates = order_by_prior(game_state, self._candidates)
+        candidates = self._candidates
+        board: Board = game_state.board
+        player: Player = game_state.next_player
+        while candidates:
+            if self.widening:
+                move = candidates.pop()
+            else:
+                index = random.randrange(len(candidates))
+                move = candidates[index]
+                candidates[index] = candidates[-1]
+                candidates.pop()
+            if move.is_play:
+                point = cast(Point, move.point)
+                if is_point_an_eye(board, point, player) or not game_state.is_valid_move(move):
+                    continue
+            return move
+        return None
 
     def is_terminal(self) -> bool:
         return self.game_state.is_over()
@@ -54,103 +258,398 @@ class MCTSNode:
 
 
 class MCTSAgent(Agent):
-    def __init__(self, num_rounds: int, temperature: float, parallel_rollouts: bool = False):
+    def __init__(self, num_rounds: int, temperature: float, parallel_rollouts: bool = False,
+                 rollout_backend: Optional[str] = None, search_mode: str = 'serial', leaves_in_flight: int = 0,
+                 transpositions: int = 0, reuse_tree: bool = True, rave: int = 0, time_limit: float = 0.0,
+                 early_stop: bool = False, verbose: bool = True, widening: float = 0.0):
         """
+        num_rounds: rollout rounds per move, 0 for as many as time_limit allows
         temperature: around 1.5
                     Hotter (greater) means search what seems to be bad moves a bit more.
                     Cooler means search what seems to be good moves a bit deeper.
+        parallel_rollouts: use the scripts/parallel_mcts servers (same as rollout_backend='zmq')
+        rollout_backend: local, process or zmq (see dlgo.mcts.rollout); by default MCTS_ROLLOUTS of dlgo.cfg
+        search_mode: serial    -> one tree, one leaf at a time
+                     tree      -> one tree, leaves_in_flight leaves at a time, kept apart by virtual loss
+                     root      -> an independent tree per rollout worker, root children merged by their statistics
+        leaves_in_flight: tree mode only, 0 for twice the number of rollout workers
+        transpositions: size of the transposition table (dlgo.mcts.transposition), 0 to search a plain tree
+        reuse_tree: keep the tree between moves and continue from the node of the position we are asked about
+                    (serial and tree modes)
+        rave: equivalence parameter k of RAVE: select children on a blend of their own win rate and of the
+              all-moves-as-first win rate of their move, the latter weighing sqrt(k / (3 n + k)) after n rollouts;
+              around 1000, 0 for plain UCT
+        time_limit: wall-clock seconds per move, 0 for no limit; the search stops at num_rounds or time_limit,
+                    whichever comes first
+        early_stop: stop as soon as the most visited child of the root cannot be overtaken in the rounds left
+                    (estimated from the rate so far under a time limit), and play the most visited child rather
+                    than the one with the best win rate (serial and tree modes)
+        verbose: print the best moves and the search metrics of every move; diagnostics() returns the metrics
+                 either way
+        widening: progressive widening (see MCTSNode): a node with n rollouts gets at most 1 + widening * sqrt(n)
+                  children, expanded best prior first (captures, ataris, moves near the last ones); around 1 for
+                  19x19, 0 to expand every move in random order
         """
         super().__init__()
+        if not num_rounds and not time_limit:
+            raise ValueError('MCTS search needs a number of rounds or a time limit')
         self.num_rounds = num_rounds
         self.temperature = temperature
         self.parallel_rollouts = parallel_rollouts
+        if rollout_backend is None and parallel_rollouts:
+            rollout_backend = 'zmq'
+        self.rollouts: RolloutBackend = create_rollout_backend(rollout_backend)
+        if search_mode not in ('serial', 'tree', 'root'):
+            raise ValueError('Unknown search mode: {}'.format(search_mode))
+        self.search_mode = search_mode
+        self.leaves_in_flight = leaves_in_flight or 2 * self.rollouts.num_workers
+        self.transpositions = transpositions
+        self.table: Optional[TranspositionTable] = None
+        self.reuse_tree = reuse_tree
+        self.rave = rave
+        self.time_limit = time_limit
+        self.early_stop = early_stop
+        self.verbose = verbose
+        self.widening = widening
+        self.stats = SearchStats()  # of the last search
+        self.root: Optional[MCTSNode] = None  # root of the last search
 
-        if self.parallel_rollouts:
-            self.context = zmq.Context()
-            #  Socket to talk to server
-            print("Connecting to sim_games parallel games server...")
-            self.socket = self.context.socket(zmq.REQ)
-            self.socket.connect("tcp://localhost:5555")
+    def close(self):
+        """Shut down the rollout workers"""
+        self.rollouts.close()
 
     def select_move(self, game_state) -> Move:
-        root: MCTSNode = MCTSNode(game_state)
+        player = game_state.next_player
+        if self.search_mode == 'root':
+            scored_moves = node_scores(self.search_root_parallel(game_state), player)
+        elif self.search_mode == 'tree':
+            scored_moves = self.scored_moves(self.search_tree_parallel(game_state), player)
+        else:
+            scored_moves = self.scored_moves(self.search(game_state), player)
+
+        scored_moves.sort(key=lambda x: x[2] if self.early_stop else x[0], reverse=True)
+        if self.verbose:
+            for s, m, n in scored_moves[:10]:
+                print('%s - %.3f (%d)' % (m, s, n))
+            print('Select move %s with win pct %.3f' % (scored_moves[0][1], scored_moves[0][0]))
+            print('# candidate moves: {}'.format(len(scored_moves)))
+            self.print_search()
+        return scored_moves[0][1]
+
+    def diagnostics(self):
+        """Metrics of the last search (see SearchStats.as_dict)"""
+        return self.stats.as_dict()
+
+    def new_root(self, game_state: GameState) -> MCTSNode:
+        """Root of the search of game_state: the matching node of the previous tree when there is one"""
+        root = self.find_reusable_node(game_state) if self.reuse_tree else None
+        if root is None:
+            root = MCTSNode(game_state, widening=self.widening)
+        else:
+            self.stats.reused_rollouts = root.num_rollouts
+            if self.verbose:
+                print('Reusing {} rollouts of the previous search'.format(root.num_rollouts))
+        root.parent = None
+        if self.transpositions:
+            self.table = TranspositionTable(self.transpositions)
+        # Forget the rest of the previous tree: re-parent shared nodes inside the kept subtree and index it again,
+        # counting its nodes and its depth along the way
+        seen = {id(root)}
+        frontier = [(root, 0)]
+        while frontier:
+            node, depth = frontier.pop()
+            self.stats.tree_size += 1
+            self.stats.max_depth = max(self.stats.max_depth, depth)
+            if self.table is not None:
+                self.table.put(node)
+            for child in node.children:
+                if id(child) not in seen:
+                    seen.add(id(child))
+                    child.parent = node
+                    frontier.append((child, depth + 1))
+        self.root = root
+        return root
+
+    def find_reusable_node(self, game_state: GameState, max_depth: int = 2) -> Optional[MCTSNode]:
+        """
+        Node of the previous tree for game_state, reached by following the moves played since the previous root
+        (usually our move and the reply). Positions are compared with their transposition keys.
+        """
+        if self.root is None:
+            return None
+        root_key = position_key(self.root.game_state)
+        moves: List[Move] = []
+        state: Optional[GameState] = game_state
+        while state is not None and len(moves) <= max_depth:
+            if position_key(state) == root_key:
+                node = self.root
+                for move in reversed(moves):
+                    if move not in node.child_moves:
+                        return None
+                    node = node.children[node.child_moves.index(move)]
+                return node
+            if state.last_move is None:
+                return None
+            moves.append(state.last_move)
+            state = state.previous_state
+        return None
 
-        for i in range(self.num_rounds):
-            node = root
-            while (not node.can_add_child()) and (not node.is_terminal()):
-                node = self.select_child(node)
+    # The search loops below only touch the tree through the following methods, so that a subclass can search
+    # another tree structure (see dlgo.mcts.tree). A leaf is whatever next_leaf() needs to find its way back.
+    def start_tree(self, game_state: GameState) -> Any:
+        """Root of the tree to search game_state with"""
+        return self.new_root(game_state)
 
-            # Add a new child node into the tree.
-            if node.can_add_child():
-                node = node.add_random_child()
+    def next_leaf(self, root: Any) -> Tuple[Any, GameState]:
+        """A new leaf to simulate from, and its position"""
+        path, edges = self.select_leaf(root)
+        return (path, edges), path[-1].game_state
+
+    def leaf_sent(self, leaf: Any):
+        """The position of leaf has been handed to the rollout backend"""
+
+    def leaf_done(self, root: Any, leaf: Any, stats: RolloutStats):
+        self.backpropagate(*leaf, stats)
+
+    def leaf_pending(self, root: Any, leaf: Any, count: int):
+        """Add count virtual losses (a negative count takes them back) along the way to leaf"""
+        self.add_virtual_loss(*leaf, count)
+
+    def root_decided(self, root: Any, rounds_left: float) -> bool:
+        return self.is_decided(root, rounds_left)
+
+    def scored_moves(self, root: Any, player: Player) -> List[Tuple[float, Move, int]]:
+        """(win rate of player, move, rollouts) of every child of root"""
+        return node_scores(root, player)
+
+    def print_search(self):
+        self.stats.print()
+
+    def search(self, game_state: GameState) -> Any:
+        """One leaf at a time; returns the root of the tree (an MCTSNode here)"""
+        budget = SearchBudget(self.num_rounds, self.time_limit)
+        search_stats = self.stats = SearchStats()
+        root = self.start_tree(game_state)
+
+        while not budget.exhausted(search_stats.rounds):
+            leaf, state = self.next_leaf(root)
 
             # Simulate a random game from this node.
-            if self.parallel_rollouts:
-                winners = self.simulate_parallel_random_games(node.game_state)
-            else:
-                winners = [self.simulate_random_game(node.game_state)]
+            start = time.perf_counter()
+            stats = self.rollouts.simulate(state)
+            backprop_start = time.perf_counter()
+            search_stats.simulate_time += backprop_start - start
+            self.leaf_sent(leaf)
 
             # Propagate scores back up the tree.
-            tmp_node: Optional[MCTSNode] = node
-            while tmp_node is not None:
-                for winner in winners:
-                    tmp_node.increment_win(winner)
-                tmp_node = tmp_node.parent
-
-        scored_moves: List[Tuple[float, Move, int]] = [
-            (child.winning_frac(game_state.next_player), cast(Move, child.last_move), child.num_rollouts)
-            for child in root.children
-        ]
-        scored_moves.sort(key=lambda x: x[0], reverse=True)
-        for s, m, n in scored_moves[:10]:
-            print('%s - %.3f (%d)' % (m, s, n))
-
-        print('Select move %s with win pct %.3f' % (scored_moves[0][1], scored_moves[0][0]))
-        print_mc_tree_info(root)
-        return scored_moves[0][1]
+            self.leaf_done(root, leaf, stats)
+            search_stats.backprop_time += time.perf_counter() - backprop_start
+            search_stats.rounds += 1
+            search_stats.rollouts += stats.num_games
+            if self.early_stop and self.root_decided(root, budget.rounds_left(search_stats.rounds)):
+                search_stats.stopped_early = True
+                break
+        search_stats.elapsed = budget.elapsed()
+        return root
 
-    def select_child(self, node: MCTSNode) -> MCTSNode:
-        """Select a child according to the upper confidence bound for
-        trees (UCT) metric.
-        """
-        total_rollouts: int = sum(child.num_rollouts for child in node.children)
-        log_rollouts: float = math.log(total_rollouts)
-
-        best_score = -1.0
-        best_child = None
-
-        for child in node.children:
-            # Calculate the UCT score.
-            win_percentage = child.winning_frac(node.game_state.next_player)
-            exploration_factor = math.sqrt(log_rollouts / child.num_rollouts)
-            uct_score = win_percentage + self.temperature * exploration_factor
-            # Check if this is the largest we've seen so far.
-            if uct_score > best_score:
-                best_score = uct_score
-                best_child = child
-        return cast(MCTSNode, best_child)
+    @staticmethod
+    def is_decided(root: MCTSNode, rounds_left: float) -> bool:
+        """Whether the most visited child of root stays so; while root can still grow a child, only if that
+        child cannot catch up either"""
+        visits = root.edge_rollouts[:len(root.children)]
+        if root.can_add_child():
+            visits = np.append(visits, 0)
+        return is_decided(visits, rounds_left)
+
+    def search_tree_parallel(self, game_state: GameState) -> Any:
+        """
+        Tree parallelization: keep leaves_in_flight rollouts going and backpropagate each one as soon as it is back,
+        then pick the next leaf, so the workers never wait for the slowest rollout of a round. Nodes on the way to a
+        pending leaf carry a virtual loss, so the next pick is steered to other parts of the tree.
+        """
+        budget = SearchBudget(self.num_rounds, self.time_limit)
+        search_stats = self.stats = SearchStats()
+        root = self.start_tree(game_state)
+
+        pending: Dict[Future, Any] = {}
+        while not (search_stats.stopped_early or budget.exhausted(search_stats.rounds)) or pending:
+            while not (search_stats.stopped_early or budget.exhausted(search_stats.rounds)) and \
+                    len(pending) < self.leaves_in_flight:
+                leaf, state = self.next_leaf(root)
+                self.leaf_pending(root, leaf, 1)
+                start = time.perf_counter()
+                pending[self.rollouts.submit(state)] = leaf
+                search_stats.simulate_time += time.perf_counter() - start
+                self.leaf_sent(leaf)
+                search_stats.rounds += 1
+            start = time.perf_counter()
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            backprop_start = time.perf_counter()
+            search_stats.simulate_time += backprop_start - start
+            for future in done:
+                leaf = pending.pop(future)
+                stats = future.result()
+                self.leaf_pending(root, leaf, -1)
+                self.leaf_done(root, leaf, stats)
+                search_stats.rollouts += stats.num_games
+            search_stats.backprop_time += time.perf_counter() - backprop_start
+            # Rollouts in flight are still to come
+            if self.early_stop and not (search_stats.stopped_early or budget.exhausted(search_stats.rounds)) and \
+                    self.root_decided(root, budget.rounds_left(search_stats.rounds) + len(pending)):
+                search_stats.stopped_early = True
+        search_stats.elapsed = budget.elapsed()
+        return root
+
+    def search_root_parallel(self, game_state: GameState) -> MCTSNode:
+        """
+        Root parallelization: every rollout worker grows its own tree with local rollouts, sharing num_rounds.
+        The returned root only has children, with the statistics of the same move summed over all trees.
+        """
+        budget = SearchBudget(self.num_rounds, self.time_limit)
+        num_trees = self.rollouts.num_workers
+        if self.num_rounds:
+            num_trees = min(num_trees, self.num_rounds)
+        futures = [self.rollouts.run(search_tree, detached(game_state),
+                                     self.num_rounds // num_trees + (i < self.num_rounds % num_trees),
+                                     self.temperature, self.transpositions, self.rave, self.time_limit,
+                                     self.widening)
+                   for i in range(num_trees)]
+        merged: Dict[Move, MCTSNode] = {}
+        root: MCTSNode = MCTSNode(game_state)
+        for future in futures:
+            for move, win_counts in future.result().items():
+                if move not in merged:
+                    merged[move] = MCTSNode(game_state.apply_move(move), root, move)
+                    root.add_child(merged[move], move)
+                child = merged[move]
+                for player, wins in win_counts.items():
+                    child.win_counts[player] += wins
+                    child.num_rollouts += wins
+                    root.win_counts[player] += wins
+                    root.num_rollouts += wins
+        self.stats = SearchStats()
+        self.stats.rounds = self.stats.rollouts = root.num_rollouts  # the trees play one local rollout per round
+        self.stats.tree_size = len(root.children) + 1
+        self.stats.max_depth = 1
+        self.stats.elapsed = budget.elapsed()
+        return root
+
+    def select_leaf(self, root: MCTSNode) -> Tuple[List[MCTSNode], List[int]]:
+        """
+        The nodes from the root to the leaf to simulate from, and the edges between them: edges[i] is the index of
+        path[i + 1] in path[i].children. With transpositions a node has several parents, so results are propagated
+        along this path rather than through node.parent.
+        """
+        start = time.perf_counter()
+        node = root
+        path = [node]
+        edges: List[int] = []
+        while (not node.can_add_child()) and (not node.is_terminal()):
+            edge = self.select_edge(node)
+            node = node.children[edge]
+            if self.table is not None and node in path:
+                # A shared node led back onto the path: simulate from where we are
+                break
+            path.append(node)
+            edges.append(edge)
+        expand_start = time.perf_counter()
+
+        # Add a new child node into the tree.
+        if node is path[-1] and node.can_add_child():  # not after a loop back
+            child = node.add_random_child(self.table, path)
+            path.append(child)
+            edges.append(len(node.children) - 1)
+            if child.parent is node:
+                self.stats.tree_size += 1
+        self.stats.add_leaf(len(path) - 1, start, expand_start, time.perf_counter())
+        return path, edges
+
+    def backpropagate(self, path: List[MCTSNode], edges: List[int], stats: RolloutStats):
+        for node, edge in zip(path, edges):
+            node.edge_rollouts[edge] += stats.num_games
+            node.edge_wins[edge] += stats.wins(node.game_state.next_player)
+        for node in path:
+            node.add_stats(stats)
+        if self.rave:
+            self.backpropagate_amaf(path, edges, stats)
 
     @staticmethod
-    def simulate_random_game(game: GameState) -> Player:
-        bots = {
-            Player.black: FastRandomAgent(),
-            Player.white: FastRandomAgent(),
-        }
-        while not game.is_over():
-            bot_move = bots[game.next_player].select_move(game)
-            game = game.apply_move(bot_move)
-        return cast(Player, game.winner())
-
-    def simulate_parallel_random_games(self, game: GameState) -> List[Player]:
-        game_with_nomore_than_one_parent = game
-        parent = game.previous_state
-        if parent is not None:
-            board = copy.deepcopy(parent.board)
-            parent_copy = GameState(board, parent.next_player, None, parent.last_move)
-            game_with_nomore_than_one_parent.previous_state = parent_copy
-        self.socket.send_pyobj(game_with_nomore_than_one_parent)
-        results: List[Player] = self.socket.recv_pyobj()
-        return results
+    def backpropagate_amaf(path: List[MCTSNode], edges: List[int], stats: RolloutStats):
+        """
+        Add the points each player played first after a node, in the tree below it or in the rollouts, to its
+        AMAF statistics; the leaf too, from its own rollouts. Going up the path, the tree moves seen so far override
+        what the rollouts played.
+        """
+        tree_first: Dict[int, Player] = {}  # point -> player who played it first between the node and the leaf
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            player = node.game_state.next_player
+            if i < len(edges):
+                point = int(node.edge_points[edges[i]])
+                if point >= 0:
+                    tree_first[point] = player
+            played, won = stats.played(player)
+            if node.amaf_rollouts is None:
+                node.amaf_rollouts = np.zeros(len(played) + 1, dtype=np.int64)
+                node.amaf_wins = np.zeros(len(played) + 1, dtype=np.int64)
+            amaf_rollouts = node.amaf_rollouts
+            amaf_wins = cast(np.ndarray, node.amaf_wins)
+            amaf_rollouts[:-1] += played
+            amaf_wins[:-1] += won
+            for point, first in tree_first.items():
+                amaf_rollouts[point] -= played[point]
+                amaf_wins[point] -= won[point]
+                if first == player:
+                    amaf_rollouts[point] += stats.num_games
+                    amaf_wins[point] += stats.wins(player)
+
+    @staticmethod
+    def add_virtual_loss(path: List[MCTSNode], edges: List[int], count: int):
+        for node in path:
+            node.virtual_losses += count
+        for node, edge in zip(path, edges):
+            node.edge_virtual_losses[edge] += count
+
+    def select_child(self, node: MCTSNode) -> MCTSNode:
+        """The child picked by select_edge()"""
+        return node.children[self.select_edge(node)]
+
+    def select_edge(self, node: MCTSNode) -> int:
+        """Index of the child to visit according to the upper confidence bound for
+        trees (UCT) metric. Pending rollouts (virtual losses) count as lost.
+        All children are scored at once from the edge statistics; the node's own totals stand for the sum over
+        its children.
+        With RAVE the win rate is blended with the AMAF win rate of the child's move.
+        """
+        n = len(node.children)
+        num_rollouts = node.edge_rollouts[:n] + node.edge_virtual_losses[:n]
+        log_rollouts = np.log(node.num_rollouts + node.virtual_losses)
+        win_rates = node.edge_wins[:n] / num_rollouts
+        if self.rave and node.amaf_rollouts is not None:
+            points = node.edge_points[:n]
+            amaf_rollouts = node.amaf_rollouts[points]
+            amaf_win_rates = cast(np.ndarray, node.amaf_wins)[points] / np.maximum(amaf_rollouts, 1)
+            beta = np.where(amaf_rollouts > 0, np.sqrt(self.rave / (3 * num_rollouts + self.rave)), 0.0)
+            win_rates = (1 - beta) * win_rates + beta * amaf_win_rates
+        uct_scores = win_rates + self.temperature * np.sqrt(log_rollouts / num_rollouts)
+        return int(np.argmax(uct_scores))
+
+    simulate_random_game = staticmethod(rollout.simulate_random_game)
+    simulate_random_games = staticmethod(rollout.simulate_random_games)
+
+
+def node_scores(root: MCTSNode, player: Player) -> List[Tuple[float, Move, int]]:
+    return [(child.winning_frac(player), move, child.num_rollouts)
+            for child, move in zip(root.children, root.child_moves)]
+
+
+def search_tree(game_state: GameState, num_rounds: int, temperature: float, transpositions: int = 0,
+                rave: int = 0, time_limit: float = 0.0, widening: float = 0.0) -> Dict[Move, Dict[Player, int]]:
+    """One tree of root parallel search, run on a worker: win counts of the children of the root"""
+    agent = MCTSAgent(num_rounds, temperature, rollout_backend='local', transpositions=transpositions, rave=rave,
+                      time_limit=time_limit, verbose=False, widening=widening)
+    root = agent.search(game_state)
+    return {move: child.win_counts for child, move in zip(root.children, root.child_moves)}
 
 
 # Helper functions to print MCTS tree info
@@ -162,32 +661,34 @@ def _depth_from_to(node_descendent: MCTSNode, node_ancestor: Optional[MCTSNode])
     return ret
 
 
+def _tree_children(node: MCTSNode) -> List[MCTSNode]:
+    return [c for c in node.children if c.last_move and not c.last_move.is_resign and c.parent is node]
+
+
 def _find_tree_deepest_node(node: MCTSNode) -> MCTSNode:
-    ret = node
-    children: List[MCTSNode] = [c for c in node.children if c.last_move and not c.last_move.is_resign]
-    if len(children) > 0:
-        depth = 0
-        for c in children:
-            n: MCTSNode = _find_tree_deepest_node(c)
-            current_depth = _depth_from_to(n, node)
-            if current_depth > depth:
-                depth = current_depth
-                ret = n
+    """One walk over the subtree, keeping the depth of each node"""
+    ret, ret_depth = node, 0
+    frontier = [(node, 0)]
+    while frontier:
+        n, depth = frontier.pop()
+        if depth > ret_depth:
+            ret, ret_depth = n, depth
+        frontier.extend((c, depth + 1) for c in _tree_children(n))
     return ret
 
 
 def _find_tree_shallowest_node(node: MCTSNode) -> MCTSNode:
-    ret = node
-    children: List[MCTSNode] = [c for c in node.children if c.last_move and not c.last_move.is_resign]
-    if len(children) > 0:
-        depth = 10000
-        for c in children:
-            n: MCTSNode = _find_tree_shallowest_node(c)
-            current_depth = _depth_from_to(n, node)
-            if current_depth < depth:
-                depth = current_depth
-                ret = n
-    return ret
+    """Breadth first: the first node without children is the shallowest"""
+    frontier = [node]
+    while frontier:
+        next_frontier = []
+        for n in frontier:
+            children = _tree_children(n)
+            if not children:
+                return n
+            next_frontier.extend(children)
+        frontier = next_frontier
+    return node
 
 
 def print_mc_tree_info(root: MCTSNode) -> None:
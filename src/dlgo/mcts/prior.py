@@ -0,0 +1,69 @@
+"""
+Cheap move-ordering prior for MCTS expansion
+
+A move scores for capturing, for saving a friendly string in atari, for putting an enemy string in atari, and for
+being close to one of the last few moves (found with Board.move_ages). Pass and resign come last. With progressive
+widening, MCTSAgent expands the children of a node in this order instead of at random.
+"""
+from __future__ import annotations
+import random
+import numpy as np
+
+from typing import List
+from dlgo.goboard import GameState, Move
+
+__all__ = [
+    'move_priors',
+    'order_by_prior',
+]
+
+CAPTURE = 4.0
+SAVE = 3.0  # extend a friendly string in atari
+ATARI = 2.0
+NEAR_RECENT_MOVE = 1.0  # divided by the distance, up to _MAX_DISTANCE
+NOT_A_PLAY = -1.0  # pass and resign
+
+_RECENT_MOVES = 2  # moves whose neighborhood counts as local
+_MAX_DISTANCE = 2
+
+
+def move_priors(game_state: GameState, moves: List[Move]) -> List[float]:
+    board = game_state.board
+    player = game_state.next_player
+    ages = board.move_ages.move_ages
+    recent = [(row + 1, col + 1) for row, col in np.argwhere((ages >= 0) & (ages < _RECENT_MOVES))]
+    priors = []
+    for move in moves:
+        if not move.is_play:
+            priors.append(NOT_A_PLAY)
+            continue
+        point = move.point
+        prior = 0.0
+        if board.will_capture(player, point):
+            prior += CAPTURE
+        strings = []  # a string touching the point on several sides counts once
+        for neighbor in board.neighbors(point):
+            string = board.get_go_string(neighbor)
+            if string is None or string in strings:
+                continue
+            strings.append(string)
+            if string.color == player:
+                if string.num_liberties == 1:
+                    prior += SAVE
+            elif string.num_liberties == 2:
+                prior += ATARI
+        if recent:
+            distance = min(abs(point.row - row) + abs(point.col - col) for row, col in recent)
+            if 0 < distance <= _MAX_DISTANCE:
+                prior += NEAR_RECENT_MOVE / distance
+        priors.append(prior)
+    return priors
+
+
+def order_by_prior(game_state: GameState, moves: List[Move]) -> List[Move]:
+    """moves from the lowest prior to the highest, so the best one pops first; ties in random order"""
+    shuffled = list(moves)
+    random.shuffle(shuffled)
+    priors = move_priors(game_state, shuffled)
+    order = sorted(range(len(shuffled)), key=priors.__getitem__)
+    return [shuffled[i] for i in order]
@@ -0,0 +1,269 @@
+"""
+Rollout backends of MCTSAgent
+
+A backend plays the random games of one MCTS iteration and returns their aggregated RolloutStats:
+ - local: one game in this process
+ - process: a pool of worker processes owned by the agent, started on first use and shut down by close()
+ - zmq: the servers of scripts/parallel_mcts, which have to be started separately
+
+submit() does not wait for the rollouts, so a search can keep several leaves in flight.
+"""
+from __future__ import annotations
+import copy
+import os
+import queue
+import threading
+import zmq
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, cast
+from dlgo.config.config import config
+from dlgo.goboard import GameState, Move, EMPTY_HISTORY
+from dlgo.gotypes import Player
+from dlgo.mcts.wire import decode_game_state, encode_game_state
+from dlgo.playout.batch import play_out_batch
+from dlgo.playout.patterns import create_playout_policy
+from dlgo.playout.playout import KOMI, PlayoutBoard, PlayoutPolicy, PlayoutResult, RolloutStats, play_out
+
+__all__ = [
+    'RolloutBackend',
+    'LocalRollouts',
+    'ProcessPoolRollouts',
+    'ZmqRollouts',
+    'create_rollout_backend',
+    'detached',
+    'simulate_random_game',
+    'simulate_random_games',
+    'simulate_rollouts',
+]
+
+
+def simulate_random_game(game: GameState) -> Player:
+    if game.is_over():
+        return cast(Player, game.winner())
+    return play_out(game).winner
+
+
+def simulate_random_games(game: GameState, num_games: int, batched: bool = False) -> List[Player]:
+    """
+    num_games rollouts from the same position.
+    batched: play them in lock-step as one NumPy batch (dlgo.playout.batch) instead of one after the other
+    """
+    if game.is_over() or not batched:
+        return [simulate_random_game(game) for _ in range(num_games)]
+    return [result.winner for result in play_out_batch(game, num_games)]
+
+
+def simulate_rollouts(game: GameState, num_games: int, batched: bool = False,
+                      policy: Optional[PlayoutPolicy] = None) -> RolloutStats:
+    """
+    simulate_random_games, aggregated; a finished game counts num_games times with its final position
+    policy: of the playouts, uniformly random moves by default; batched playouts only support the default
+    """
+    if batched and policy is not None:
+        raise ValueError('Batched playouts only play random moves')
+    board = game.board
+    stats = RolloutStats(board.num_rows * board.num_cols)
+    if game.is_over():
+        if cast(Move, game.last_move).is_resign:
+            stats.add_winner(cast(Player, game.winner()), num_games)
+        else:
+            playout_board = PlayoutBoard.from_board(board)
+            ownership = playout_board.ownership()
+            score = playout_board.score(KOMI)
+            stats.add(PlayoutResult(score.winner, score, 0, ownership, [0] * len(ownership)), num_games)
+    elif batched:
+        for result in play_out_batch(game, num_games):
+            stats.add(result)
+    else:
+        for _ in range(num_games):
+            stats.add(play_out(game, policy=policy))
+    return stats
+
+
+def simulate_encoded_rollouts(data: bytes, num_games: int, batched: bool = False, policy: str = 'light') -> bytes:
+    """simulate_rollouts from and to the binary forms, as run by pool workers; policy: see create_playout_policy"""
+    return simulate_rollouts(decode_game_state(data), num_games, batched, create_playout_policy(policy)).to_bytes()
+
+
+def detached(game: GameState) -> GameState:
+    """Shallow copy of game without its history, all a rollout needs; cheap to send to another process"""
+    state = copy.copy(game)
+    state.previous_state = None
+    state.previous_states = EMPTY_HISTORY
+    state._made_moves = []
+    return state
+
+
+def _done(fn: Callable, *args) -> Future:
+    future: Future = Future()
+    future.set_result(fn(*args))
+    return future
+
+
+class RolloutBackend:
+    num_workers = 1  # tasks that can run at the same time
+
+    def simulate(self, game: GameState) -> RolloutStats:
+        """Results of the rollouts played from game for one MCTS iteration"""
+        raise NotImplementedError()
+
+    def submit(self, game: GameState) -> Future:
+        """Future of the RolloutStats of one leaf; tree parallel search keeps several of them going"""
+        return _done(self.simulate, game)
+
+    def run(self, fn: Callable[..., Any], *args) -> Future:
+        """Run fn(*args) on a worker; fn and args must be picklable for the process backend"""
+        return _done(fn, *args)
+
+    def close(self):
+        ...
+
+    def __enter__(self) -> RolloutBackend:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class LocalRollouts(RolloutBackend):
+    def __init__(self, policy: str = 'light'):
+        """policy: light or heavy playouts (see dlgo.playout.patterns.create_playout_policy)"""
+        self.policy = create_playout_policy(policy)
+
+    def simulate(self, game: GameState) -> RolloutStats:
+        return simulate_rollouts(game, 1, policy=self.policy)
+
+
+class ProcessPoolRollouts(RolloutBackend):
+    def __init__(self, num_workers: int = 0, games_per_task: int = 1, batched: bool = False, policy: str = 'light'):
+        """
+        num_workers: worker processes, 0 for one per CPU; every iteration gives each of them one task
+        games_per_task: rollouts a worker plays per task
+        policy: light or heavy playouts (see dlgo.playout.patterns.create_playout_policy)
+        """
+        if batched and policy != 'light':
+            raise ValueError('Batched playouts only play random moves')
+        create_playout_policy(policy)
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.games_per_task = games_per_task
+        self.batched = batched
+        self.policy = policy
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.num_workers)
+        return self._pool
+
+    def simulate(self, game: GameState) -> RolloutStats:
+        task = encode_game_state(game)
+        futures = [self.pool.submit(simulate_encoded_rollouts, task, self.games_per_task, self.batched, self.policy)
+                   for _ in range(self.num_workers)]
+        stats = RolloutStats.from_bytes(futures[0].result())
+        for future in futures[1:]:
+            stats.merge(RolloutStats.from_bytes(future.result()))
+        return stats
+
+    def submit(self, game: GameState) -> Future:
+        stats: Future = Future()
+
+        def decode(future: Future):
+            if future.exception() is not None:
+                stats.set_exception(cast(BaseException, future.exception()))
+            else:
+                stats.set_result(RolloutStats.from_bytes(future.result()))
+
+        self.pool.submit(simulate_encoded_rollouts, encode_game_state(game), self.games_per_task,
+                         self.batched, self.policy).add_done_callback(decode)
+        return stats
+
+    def run(self, fn: Callable[..., Any], *args) -> Future:
+        return self.pool.submit(fn, *args)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+class ZmqRollouts(RolloutBackend):
+    """
+    Requests go out on a DEALER socket, so more can be sent before the first answer is back. The REP server answers
+    them one by one, in order. The socket is owned by an I/O thread; submit() only queues the request.
+    Game states travel in the dlgo.mcts.wire format, results as RolloutStats bytes.
+    close() fails the requests that are still pending, so nobody waits for an answer that will not come.
+    """
+    def __init__(self, address: str = 'tcp://localhost:5555'):
+        self.address = address
+        self.context = zmq.Context()
+        self._requests: queue.Queue = queue.Queue()
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        #  Socket to talk to server
+        print("Connecting to sim_games parallel games server...")
+        socket = self.context.socket(zmq.DEALER)
+        socket.connect(self.address)
+        waiting: List[Future] = []  # sent requests, oldest first
+        while self._running:
+            try:
+                data, future = self._requests.get(block=not waiting, timeout=0.1)
+                socket.send_multipart([b'', data])  # empty delimiter frame, as a REQ socket would send
+                waiting.append(future)
+                continue
+            except queue.Empty:
+                pass
+            while waiting and socket.poll(10):
+                _, data = socket.recv_multipart()
+                waiting.pop(0).set_result(RolloutStats.from_bytes(data))
+        socket.close(linger=0)
+        for future in waiting:
+            future.set_exception(RuntimeError('Rollout backend closed'))
+
+    def _fail_queued(self):
+        while True:
+            try:
+                _, future = self._requests.get_nowait()
+            except queue.Empty:
+                return
+            future.set_exception(RuntimeError('Rollout backend closed'))
+
+    def simulate(self, game: GameState) -> RolloutStats:
+        return self.submit(game).result()
+
+    def submit(self, game: GameState) -> Future:
+        if not self._running:
+            raise RuntimeError('Rollout backend closed')
+        future: Future = Future()
+        self._requests.put((encode_game_state(game), future))
+        return future
+
+    def close(self):
+        self._running = False
+        self._thread.join()
+        self._fail_queued()
+        self.context.term()
+
+
+def create_rollout_backend(name: Optional[str] = None) -> RolloutBackend:
+    """
+    name: local, process or zmq; by default [ENGINE] MCTS_ROLLOUTS of dlgo.cfg
+    The process backend takes its number of workers and of games per task from [ENGINE] MCTS_ROLLOUT_WORKERS and
+    MCTS_ROLLOUTS_PER_TASK. The local and process backends play the playouts of [ENGINE] MCTS_PLAYOUT_POLICY.
+    """
+    engine = config['ENGINE'] if config.has_section('ENGINE') else {}
+    if name is None:
+        name = engine.get('MCTS_ROLLOUTS', 'local')
+    policy = engine.get('MCTS_PLAYOUT_POLICY', 'light')
+    if name == 'local':
+        return LocalRollouts(policy)
+    if name == 'process':
+        return ProcessPoolRollouts(int(engine.get('MCTS_ROLLOUT_WORKERS', '0')),
+                                   int(engine.get('MCTS_ROLLOUTS_PER_TASK', '1')), policy=policy)
+    if name == 'zmq':
+        return ZmqRollouts()
+    raise ValueError('Unknown rollout backend: {}'.format(name))
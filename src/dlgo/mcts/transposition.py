@@ -0,0 +1,65 @@
+"""
+Transposition table for MCTS
+
+Positions reached by different move orders share one MCTSNode, so the tree becomes a DAG and their statistics are
+pooled. A position is keyed on the board hash combined with the Zobrist codes of the player to move, the simple ko
+point and a pass as last move (two passes end the game). The table holds at most max_size nodes and forgets the
+least recently used ones; a forgotten node stays in the tree, it just is not shared any more.
+"""
+from __future__ import annotations
+from collections import OrderedDict
+
+from typing import Optional, TYPE_CHECKING
+from dlgo import zobrist
+from dlgo.goboard import GameState
+from dlgo.gotypes import Player
+
+if TYPE_CHECKING:
+    from dlgo.mcts.mcts import MCTSNode
+
+__all__ = [
+    'TranspositionTable',
+    'position_key',
+]
+
+
+def position_key(game_state: GameState) -> int:
+    board = game_state.board
+    codes = zobrist.get_codes(board.num_rows, board.num_cols)
+    key = board.zobrist_hash()
+    if game_state.next_player == Player.white:
+        key ^= codes.side_to_move
+    if game_state.ko_point is not None:
+        key ^= int(codes.ko[codes.index(game_state.ko_point)])
+    last_move = game_state.last_move
+    if last_move is not None and last_move.is_pass:
+        key ^= codes.last_pass
+    return key
+
+
+class TranspositionTable:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._nodes: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def get(self, game_state: GameState) -> Optional[MCTSNode]:
+        key = position_key(game_state)
+        node = self._nodes.get(key)
+        if node is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._nodes.move_to_end(key)
+        return node
+
+    def put(self, node: MCTSNode):
+        self._nodes[position_key(node.game_state)] = node
+        if len(self._nodes) > self.max_size:
+            self._nodes.popitem(last=False)
+            self.evictions += 1
@@ -0,0 +1,267 @@
+"""
+Struct-of-arrays MCTS tree
+
+TreeStore keeps one entry per node in NumPy arrays (parent, move, player to move, visits, black wins, virtual
+losses, children block), about 25 bytes per node instead of an MCTSNode with its own GameState. The children of a
+node sit in one contiguous block, so UCT scores all of them with a few array operations. A block starts small and
+is moved to the end of the arrays when it is full; the slots it leaves forward to the new place, so paths held by
+pending rollouts stay valid.
+
+No game state is stored: CompactMCTSAgent walks a single working GameState down the tree with make_move() and
+takes the moves back with unmake_move() once the leaf has been handed to the rollout backend.
+"""
+from __future__ import annotations
+import random
+import time
+import numpy as np
+
+from array import array
+from typing import Dict, List, Optional, Tuple
+from dlgo.agent.helpers import is_point_an_eye
+from dlgo.goboard import GameState, Move
+from dlgo.gotypes import Player
+from dlgo.mcts.mcts import MCTSAgent, is_decided, play_moves
+from dlgo.playout.playout import RolloutStats
+
+__all__ = [
+    'TreeStore',
+    'CompactMCTSAgent',
+]
+
+NO_MOVE = -1
+
+# expansion state of a node
+_NEW = 0  # never expanded
+_EXPANDING = 1  # some moves left in TreeStore.candidates
+_EXPANDED = 2  # all legal moves have a child
+
+_FIELDS = (
+    ('parent', np.int32),  # -1 for the root; -2 - i for a slot moved to i
+    ('move', np.int16),  # move code (see CompactMCTSAgent.moves) leading to the node
+    ('player', np.int8),  # player to move at the node
+    ('visits', np.int32),
+    ('black_wins', np.int32),
+    ('virtual_losses', np.int32),  # rollouts in flight through the node
+    ('first_child', np.int32),
+    ('num_children', np.int16),
+    ('child_capacity', np.int16),
+    ('expansion', np.int8),
+)
+
+
+class TreeStore:
+    def __init__(self, root_player: Player, capacity: int = 1024):
+        self.size = 0
+        self.capacity = capacity
+        for name, dtype in _FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        self.candidates: Dict[int, array] = {}  # move codes not tried yet, for nodes being expanded
+        self._allocate(1)
+        self._init_node(0, -1, NO_MOVE, root_player.value)
+
+    def __len__(self) -> int:
+        """Slots in use, including the ones left behind by moved children blocks"""
+        return self.size
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name, _ in _FIELDS) + \
+            sum(c.itemsize * len(c) for c in self.candidates.values())
+
+    def _allocate(self, count: int) -> int:
+        start = self.size
+        if start + count > self.capacity:
+            capacity = self.capacity
+            while start + count > capacity:
+                capacity *= 2
+            for name, _ in _FIELDS:
+                old = getattr(self, name)
+                grown = np.zeros(capacity, dtype=old.dtype)
+                grown[:self.size] = old[:self.size]
+                setattr(self, name, grown)
+            self.capacity = capacity
+        self.size += count
+        return start
+
+    def _init_node(self, node: int, parent: int, move: int, player: int):
+        self.parent[node] = parent
+        self.move[node] = move
+        self.player[node] = player
+        self.visits[node] = 0
+        self.black_wins[node] = 0
+        self.virtual_losses[node] = 0
+        self.first_child[node] = 0
+        self.num_children[node] = 0
+        self.child_capacity[node] = 0
+        self.expansion[node] = _NEW
+
+    def resolve(self, node: int) -> int:
+        """Current index of a node that may have been moved since its index was taken"""
+        while self.parent[node] < -1:
+            node = -2 - int(self.parent[node])
+        return node
+
+    def children(self, node: int) -> range:
+        first = int(self.first_child[node])
+        return range(first, first + int(self.num_children[node]))
+
+    def add_child(self, node: int, move: int) -> int:
+        count = int(self.num_children[node])
+        if count == self.child_capacity[node]:
+            self._move_children(node, max(4, 2 * count))
+        child = int(self.first_child[node]) + count
+        self._init_node(child, node, move, 3 - int(self.player[node]))
+        self.num_children[node] = count + 1
+        return child
+
+    def _move_children(self, node: int, capacity: int):
+        count = int(self.num_children[node])
+        start = self._allocate(capacity)
+        old = int(self.first_child[node])
+        for name, _ in _FIELDS:
+            values = getattr(self, name)
+            values[start:start + count] = values[old:old + count]
+        # Search only descends into a node once all its children are added, so the moved children have no children
+        # of their own yet: only the old slots need to forward to the new place.
+        self.parent[old:old + count] = -2 - np.arange(start, start + count, dtype=np.int32)
+        self.first_child[node] = start
+        self.child_capacity[node] = capacity
+
+    def select_child(self, node: int, temperature: float) -> int:
+        """UCT over the children block in one go; pending rollouts (virtual losses) count as lost"""
+        first = int(self.first_child[node])
+        last = first + int(self.num_children[node])
+        visits = self.visits[first:last]
+        rollouts = visits + self.virtual_losses[first:last]
+        wins = self.black_wins[first:last]
+        if self.player[node] == Player.white.value:
+            wins = visits - wins
+        total = int(self.visits[node]) + int(self.virtual_losses[node])
+        scores = wins / rollouts + temperature * np.sqrt(np.log(total) / rollouts)
+        return first + int(np.argmax(scores))
+
+    def backpropagate(self, path: List[int], stats: RolloutStats):
+        nodes = [self.resolve(node) for node in path]
+        self.visits[nodes] += stats.num_games
+        self.black_wins[nodes] += stats.black_wins
+
+    def add_virtual_loss(self, path: List[int], count: int):
+        nodes = [self.resolve(node) for node in path]
+        self.virtual_losses[nodes] += count
+
+
+class CompactMCTSAgent(MCTSAgent):
+    """
+    MCTSAgent on a TreeStore. Supports the serial and tree search modes (root mode runs MCTSAgent's search);
+    transpositions and tree reuse are not available.
+    """
+    def __init__(self, num_rounds: int, temperature: float, parallel_rollouts: bool = False,
+                 rollout_backend: Optional[str] = None, search_mode: str = 'serial', leaves_in_flight: int = 0,
+                 time_limit: float = 0.0, early_stop: bool = False, verbose: bool = True):
+        super().__init__(num_rounds, temperature, parallel_rollouts, rollout_backend, search_mode, leaves_in_flight,
+                         reuse_tree=False, time_limit=time_limit, early_stop=early_stop, verbose=verbose)
+        self.store: Optional[TreeStore] = None
+        self.moves: List[Move] = []  # move codes: index of the point row major, then pass and resign
+        self.state: Optional[GameState] = None  # walked down to each leaf and back by the search
+
+    def scored_moves(self, store: TreeStore, player: Player) -> List[Tuple[float, Move, int]]:
+        scored_moves = []
+        for child in store.children(0):
+            visits = int(store.visits[child])
+            wins = int(store.black_wins[child]) if player == Player.black else visits - int(store.black_wins[child])
+            scored_moves.append((wins / visits, self.moves[store.move[child]], visits))
+        return scored_moves
+
+    def print_search(self):
+        super().print_search()
+        if self.search_mode != 'root' and self.store is not None:
+            print('tree store: {} slots, {:.1f} KB'.format(len(self.store), self.store.nbytes / 1024))
+
+    def diagnostics(self):
+        diagnostics = super().diagnostics()
+        if self.store is not None:
+            diagnostics['tree_bytes'] = self.store.nbytes
+        return diagnostics
+
+    def new_store(self, game_state: GameState) -> TreeStore:
+        board = game_state.board
+        self.moves = play_moves(board.num_rows, board.num_cols) + [Move.pass_turn(), Move.resign()]
+        self.store = TreeStore(game_state.next_player)
+        self.stats.tree_size = 1
+        return self.store
+
+    def start_tree(self, game_state: GameState) -> TreeStore:
+        self.state = game_state.clone()
+        return self.new_store(game_state)
+
+    def next_leaf(self, store: TreeStore) -> Tuple[List[int], GameState]:
+        path = self.select_leaf(store, self.state)
+        return path, self.state
+
+    def leaf_sent(self, path: List[int]):
+        for _ in range(len(path) - 1):
+            self.state.unmake_move()
+
+    def leaf_done(self, store: TreeStore, path: List[int], stats: RolloutStats):
+        store.backpropagate(path, stats)
+
+    def leaf_pending(self, store: TreeStore, path: List[int], count: int):
+        store.add_virtual_loss(path, count)
+
+    def root_decided(self, store: TreeStore, rounds_left: float) -> bool:
+        """MCTSAgent.is_decided on the root of store"""
+        children = store.children(0)
+        visits = store.visits[children.start:children.stop]
+        if store.expansion[0] != _EXPANDED:
+            visits = np.append(visits, 0)
+        return is_decided(visits, rounds_left)
+
+    def select_leaf(self, store: TreeStore, state: GameState) -> List[int]:
+        """Walk state down to a new leaf (or a terminal node) with make_move(); returns the node indexes on the way"""
+        start = time.perf_counter()
+        expand_start = None
+        node = 0
+        path = [node]
+        while not state.is_over():
+            code = self.draw_move(store, node, state)
+            if code is not None:
+                # Add a new child node into the tree.
+                expand_start = time.perf_counter()
+                path.append(store.add_child(node, code))
+                state.make_move(self.moves[code])
+                self.stats.tree_size += 1
+                break
+            node = store.select_child(node, self.temperature)
+            path.append(node)
+            state.make_move(self.moves[store.move[node]])
+        end = time.perf_counter()
+        self.stats.add_leaf(len(path) - 1, start, expand_start or end, end)
+        return path
+
+    def draw_move(self, store: TreeStore, node: int, state: GameState) -> Optional[int]:
+        """A random move code of node not expanded yet, legal and not filling our own eye; None if none is left"""
+        expansion = store.expansion[node]
+        if expansion == _EXPANDED:
+            return None
+        if expansion == _NEW:
+            board = state.board
+            plays = play_moves(board.num_rows, board.num_cols)
+            codes = [code for code, move in enumerate(plays) if board.get(move.point) is None]
+            codes.append(len(plays))
+            codes.append(len(plays) + 1)
+            store.candidates[node] = array('h', codes)
+            store.expansion[node] = _EXPANDING
+        candidates = store.candidates[node]
+        player = state.next_player
+        while candidates:
+            index = random.randrange(len(candidates))
+            code = candidates[index]
+            candidates[index] = candidates[-1]
+            candidates.pop()
+            move = self.moves[code]
+            if move.is_play and (is_point_an_eye(state.board, move.point, player) or not state.is_valid_move(move)):
+                continue
+            return code
+        del store.candidates[node]
+        store.expansion[node] = _EXPANDED
+        return None
@@ -0,0 +1,106 @@
+"""
+Compact binary messages between MCTSAgent and the rollout servers and workers
+
+A game state is sent as a fixed header followed by the stones packed 2 bits per point, row major:
+ rows, cols, next player, flags, last move point, ko point (flat indexes of dlgo.goboard_fast, 0 for none), hash
+That is 107 bytes for 19x19, against tens of kilobytes for a pickled GameState. The hash lets the receiver check the
+position it rebuilt. A task adds the number of games to play in front of the game state; its results come back as
+the fixed size bytes of a dlgo.playout.playout.RolloutStats.
+"""
+from __future__ import annotations
+import struct
+
+from typing import Tuple
+from dlgo import goboard_fast
+from dlgo.goboard import GameState, Move
+from dlgo.goboard_fast import EMPTY, get_layout
+from dlgo.gotypes import Player
+
+__all__ = [
+    'encode_game_state',
+    'decode_game_state',
+    'encode_task',
+    'decode_task',
+]
+
+_HEADER = struct.Struct('<BBBBHHQ')
+_TASK = struct.Struct('<H')
+
+# flags
+_LAST_MOVE_PASS = 1
+_LAST_MOVE_RESIGN = 2
+_SECOND_LAST_MOVE_PASS = 4
+_SUPERKO = 8
+
+
+def encode_game_state(game: GameState) -> bytes:
+    board = game.board
+    layout = get_layout((board.num_rows, board.num_cols))
+    if isinstance(board, goboard_fast.Board):
+        stones = board.stones
+        colors = [stones[p] for p in layout.on_board]
+    else:
+        colors = [EMPTY if player is None else player.value
+                  for player in (board.get(layout.points[p]) for p in layout.on_board)]
+    colors.extend([EMPTY] * (-len(colors) % 4))
+    packed = bytes(colors[i] | colors[i + 1] << 2 | colors[i + 2] << 4 | colors[i + 3] << 6
+                   for i in range(0, len(colors), 4))
+
+    flags = 0
+    last_point = 0
+    last_move = game.last_move
+    if last_move is not None:
+        if last_move.is_pass:
+            flags |= _LAST_MOVE_PASS
+        elif last_move.is_resign:
+            flags |= _LAST_MOVE_RESIGN
+        else:
+            last_point = layout.index(last_move.point)
+    second_last_move = game._second_last_move
+    if second_last_move is not None and second_last_move.is_pass:
+        flags |= _SECOND_LAST_MOVE_PASS
+    if game.superko:
+        flags |= _SUPERKO
+    ko_point = 0 if game.ko_point is None else layout.index(game.ko_point)
+    header = _HEADER.pack(board.num_rows, board.num_cols, game.next_player.value, flags, last_point, ko_point,
+                          board.zobrist_hash())
+    return header + packed
+
+
+def decode_game_state(data: bytes) -> goboard_fast.GameState:
+    """A goboard_fast.GameState without history; raises ValueError if the rebuilt position does not match the hash"""
+    num_rows, num_cols, next_player, flags, last_point, ko_point, hash_code = _HEADER.unpack_from(data)
+    layout = get_layout((num_rows, num_cols))
+    board = goboard_fast.Board(num_rows, num_cols)
+    packed = data[_HEADER.size:]
+    for i, p in enumerate(layout.on_board):
+        color = packed[i >> 2] >> ((i & 3) << 1) & 3
+        if color != EMPTY:
+            board._play(color, p)
+    if board.zobrist_hash() != hash_code:
+        raise ValueError('Game state does not match its hash')
+
+    if flags & _LAST_MOVE_PASS:
+        last_move = Move.pass_turn()
+    elif flags & _LAST_MOVE_RESIGN:
+        last_move = Move.resign()
+    elif last_point:
+        last_move = Move.play(layout.points[last_point])
+    else:
+        last_move = None
+    board.ko_point = layout.points[ko_point] if ko_point else None
+    game = goboard_fast.GameState(board, Player(next_player), None, last_move)
+    game.ko_point = board.ko_point
+    game._second_last_move = Move.pass_turn() if flags & _SECOND_LAST_MOVE_PASS else None
+    game.superko = bool(flags & _SUPERKO)
+    return game
+
+
+def encode_task(game_state_data: bytes, num_games: int) -> bytes:
+    """game_state_data: an encoded game state, passed on as is"""
+    return _TASK.pack(num_games) + game_state_data
+
+
+def decode_task(data: bytes) -> Tuple[goboard_fast.GameState, int]:
+    num_games, = _TASK.unpack_from(data)
+    return decode_game_state(data[_TASK.size:]), num_games
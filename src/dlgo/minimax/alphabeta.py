@@ -38,6 +38,9 @@ def eval_fn2(game_state: GameState, original_player: Player) -> float:
 
 def alphabeta(game_state: GameState, maximizing: bool, original_player: Player, max_depth: int = 2,
               alpha: float = float("-inf"), beta: float = float("inf"), ev_fn=None) -> float:
+    """
+    Walks the tree in place with game_state.make_move / unmake_move, so game_state is restored on return.
+    """
     if game_state.is_over():
         if game_state.winner() == original_player:
             return float("inf")
@@ -50,14 +53,18 @@ def alphabeta(game_state: GameState, maximizing: bool, original_player: Player,
     # Recursive case - maximize your gains or minimize the opponent's gains
     if maximizing:
         for move in game_state.legal_moves():
-            result = alphabeta(game_state.apply_move(move), False, original_player, max_depth - 1, alpha, beta, ev_fn)
+            game_state.make_move(move)
+            result = alphabeta(game_state, False, original_player, max_depth - 1, alpha, beta, ev_fn)
+            game_state.unmake_move()
             alpha = max(result, alpha)
             if beta <= alpha:
                 break
         return alpha
     else:  # minimizing
         for move in game_state.legal_moves():
-            result = alphabeta(game_state.apply_move(move), True, original_player, max_depth - 1, alpha, beta, ev_fn)
+            game_state.make_move(move)
+            result = alphabeta(game_state, True, original_player, max_depth - 1, alpha, beta, ev_fn)
+            game_state.unmake_move()
             beta = min(result, beta)
             if beta <= alpha:
                 break
@@ -0,0 +1,241 @@
+"""
+Random playouts of many boards in lock-step with NumPy
+
+All boards of a batch live in one (num_games, rows + 2, cols + 2) array using the padded layout of dlgo.goboard_fast,
+next to a string label per point (the flat index of one of the string's stones). Neighbors are shifted views of the
+padded planes. Every step counts the liberties of all strings at once, builds the legal non-eye move mask, picks one
+random move per board, then merges labels and resolves captures with whole-array operations, so the number of Python
+level operations per step does not depend on the number of boards.
+"""
+from __future__ import annotations
+import numpy as np
+from dlgo.goboard import GameState
+from dlgo.goboard_fast import EMPTY, BLACK, WHITE, BORDER, get_layout
+from dlgo.playout.playout import KOMI, PlayoutResult
+from dlgo.scoring import GameResult
+from typing import List
+
+__all__ = [
+    'BatchPlayout',
+    'play_out_batch',
+]
+
+_NO_POINT = -1
+
+# Views of the padded planes: the points themselves, their neighbors and their diagonal neighbors
+_INNER = (slice(None), slice(1, -1), slice(1, -1))
+_NEIGHBORS = [
+    (slice(None), slice(0, -2), slice(1, -1)),
+    (slice(None), slice(2, None), slice(1, -1)),
+    (slice(None), slice(1, -1), slice(0, -2)),
+    (slice(None), slice(1, -1), slice(2, None)),
+]
+_DIAGONALS = [
+    (slice(None), slice(0, -2), slice(0, -2)),
+    (slice(None), slice(0, -2), slice(2, None)),
+    (slice(None), slice(2, None), slice(0, -2)),
+    (slice(None), slice(2, None), slice(2, None)),
+]
+
+
+class BatchPlayout:
+    def __init__(self, game_state: GameState, num_games: int, komi: float = KOMI, max_moves: int = 0):
+        """All num_games boards start from game_state, which must not be over"""
+        board = game_state.board
+        self.layout = get_layout((board.num_rows, board.num_cols))
+        self.num_games = num_games
+        self.komi = komi
+        self.max_moves = max_moves or 3 * board.num_rows * board.num_cols
+
+        layout = self.layout
+        shape = (num_games, board.num_rows + 2, board.num_cols + 2)
+        start = np.array(layout.template, dtype=np.int8)
+        for p in layout.on_board:
+            player = board.get(layout.points[p])
+            if player is not None:
+                start[p] = player.value
+        self.stones = np.tile(start, (num_games, 1)).reshape(shape)
+        self.flat_index = np.arange(layout.size, dtype=np.int32).reshape(shape[1:])[_INNER[1:]]
+        self.color = np.full(num_games, game_state.next_player.value, dtype=np.int8)
+        self.ko = np.full(num_games, _NO_POINT if game_state.ko_point is None else layout.index(game_state.ko_point))
+        last_move = game_state.last_move
+        self.passes = np.full(num_games, 1 if last_move is not None and last_move.is_pass else 0)
+        self.num_moves = np.zeros(num_games, dtype=np.int64)
+        self.first_played = np.zeros(shape, dtype=np.int8)  # color of the first stone played on each point
+        self._rows = np.arange(num_games)
+        self.labels = self.label_strings()
+
+    def label_strings(self) -> np.ndarray:
+        """
+        (num_games, rows + 2, cols + 2) array: for stones, the smallest flat index of their string.
+        Min-label propagation with pointer jumping; only needed for the starting position, step() keeps labels current.
+        """
+        stones = self.stones
+        inner = stones[_INNER]
+        is_stone = (inner == BLACK) | (inner == WHITE)
+        same = [is_stone & (inner == stones[n]) for n in _NEIGHBORS]
+        labels = np.tile(np.arange(self.layout.size, dtype=np.int32), self.num_games).reshape(stones.shape)
+        flat = labels.reshape(self.num_games, -1)
+        while True:
+            previous = labels.copy()
+            current = labels[_INNER]
+            for k, n in enumerate(_NEIGHBORS):
+                current = np.where(same[k], np.minimum(current, previous[n]), current)
+            labels[_INNER] = current
+            # Pointer jumping: a label always points into the same string, so follow it
+            flat[:] = np.take_along_axis(flat, flat, axis=1)
+            if np.array_equal(labels, previous):
+                return labels
+
+    def count_liberties(self) -> np.ndarray:
+        """(num_games, rows + 2, cols + 2) array: for stones, the number of liberties of their string"""
+        size = self.layout.size
+        stones = self.stones
+        labels = self.labels
+        empty = stones[_INNER] == EMPTY
+        board_offset = (self._rows * size).astype(np.int32)[:, None, None]
+        # Every empty point is one liberty of each distinct string around it
+        around = []
+        for n in _NEIGHBORS:
+            neighbor = stones[n]
+            around.append(np.where(empty & (neighbor != EMPTY) & (neighbor != BORDER), labels[n], _NO_POINT))
+        keys = []
+        for k, label in enumerate(around):
+            distinct = label != _NO_POINT
+            for previous in around[:k]:
+                distinct &= label != previous
+            keys.append((board_offset + label)[distinct])
+        libs = np.bincount(np.concatenate(keys), minlength=self.num_games * size)
+        libs = np.take_along_axis(libs.reshape(self.num_games, size), labels.reshape(self.num_games, -1), axis=1)
+        return libs.reshape(stones.shape)
+
+    def candidate_moves(self, libs: np.ndarray) -> np.ndarray:
+        """(num_games, rows, cols) mask of legal moves that do not fill our own eyes"""
+        stones = self.stones
+        color = self.color[:, None, None]
+        own = stones == color
+        border = stones == BORDER
+        # A stone on a neighbor gives the move a liberty if it is empty, a friendly string that is not in atari or
+        # an enemy string in atari (captured)
+        breath = (stones == EMPTY) | (own & (libs > 1)) | ((stones == 3 - color) & (libs == 1))
+        own_or_border = own | border
+        breathes = np.zeros(stones[_INNER].shape, dtype=bool)
+        own_neighbors = np.ones(stones[_INNER].shape, dtype=bool)
+        for n in _NEIGHBORS:
+            breathes |= breath[n]
+            own_neighbors &= own_or_border[n]
+        off_board = np.zeros(breathes.shape, dtype=np.int8)
+        friendly = np.zeros(breathes.shape, dtype=np.int8)
+        for n in _DIAGONALS:
+            off_board += border[n]
+            friendly += own[n]
+        eye = own_neighbors & np.where(off_board > 0, off_board + friendly == 4, friendly >= 3)
+        not_ko = self.flat_index[None, :, :] != self.ko[:, None, None]
+        return (stones[_INNER] == EMPTY) & breathes & not_ko & ~eye
+
+    def step(self, active: np.ndarray):
+        libs = self.count_liberties()
+        candidates = (self.candidate_moves(libs) & active[:, None, None]).reshape(self.num_games, -1)
+        choice = np.argmax(np.where(candidates, np.random.random(candidates.shape), -1.0), axis=1)
+        plays = candidates[self._rows, choice]
+        boards = self._rows[plays]
+        points = self.flat_index.ravel()[choice[plays]]
+        color = self.color[plays]
+        other = 3 - color
+
+        stones = self.stones.reshape(self.num_games, -1)
+        labels = self.labels.reshape(self.num_games, -1)
+        libs = libs.reshape(self.num_games, -1)
+        # Friendly strings next to the move join it, enemy strings with a single liberty are captured
+        friend_labels = []
+        captured_labels = []
+        lonely = np.ones(len(boards), dtype=bool)  # no friendly or empty neighbor before the move
+        for d in self.layout.offsets:
+            neighbor = stones[boards, points + d]
+            lonely &= (neighbor != color) & (neighbor != EMPTY)
+            friend_labels.append(np.where(neighbor == color, labels[boards, points + d], _NO_POINT))
+            captures = (neighbor == other) & (libs[boards, points + d] == 1)
+            captured_labels.append(np.where(captures, labels[boards, points + d], _NO_POINT))
+        new_label = points.astype(np.int32)
+        for friend_label in friend_labels:
+            new_label = np.where(friend_label != _NO_POINT, np.minimum(new_label, friend_label), new_label)
+
+        board_stones = stones[boards]
+        board_labels = labels[boards]
+        joined = np.zeros(board_stones.shape, dtype=bool)
+        captured = np.zeros(board_stones.shape, dtype=bool)
+        for friend_label, captured_label in zip(friend_labels, captured_labels):
+            joined |= board_labels == friend_label[:, None]
+            captured |= board_labels == captured_label[:, None]
+        joined &= board_stones == color[:, None]
+        captured &= board_stones == other[:, None]
+        board_stones[captured] = EMPTY
+        board_stones[np.arange(len(boards)), points] = color
+        first_played = self.first_played.reshape(self.num_games, -1)
+        first = first_played[boards, points] == EMPTY
+        first_played[boards[first], points[first]] = color[first]
+        board_labels = np.where(joined, new_label[:, None], board_labels)
+        board_labels[np.arange(len(boards)), points] = new_label
+        stones[boards] = board_stones
+        labels[boards] = board_labels
+
+        num_captured = captured.sum(axis=1)
+        self.ko[:] = _NO_POINT
+        ko = lonely & (num_captured == 1)
+        self.ko[boards[ko]] = np.argmax(captured[ko], axis=1)
+
+        self.passes[plays] = 0
+        self.passes[active & ~plays] += 1
+        self.num_moves[active] += 1
+        self.color[active] = 3 - self.color[active]
+
+    def score(self) -> List[GameResult]:
+        """Area score of every board, counted the same way as dlgo.scoring"""
+        ownership = self.ownership()
+        b = (ownership == BLACK).sum(axis=(1, 2))
+        w = (ownership == WHITE).sum(axis=(1, 2))
+        return [GameResult(int(b[i]), int(w[i]), komi=self.komi) for i in range(self.num_games)]
+
+    def ownership(self) -> np.ndarray:
+        """(num_games, rows, cols) array: the color of the stone or of the territory, EMPTY for dame"""
+        stones = self.stones
+        empty = stones[_INNER] == EMPTY
+        areas = []
+        for color in (BLACK, WHITE):
+            # Grow the area reachable from our stones through empty points
+            reach = stones == color
+            while True:
+                grown = reach[_INNER].copy()
+                for n in _NEIGHBORS:
+                    grown |= empty & reach[n]
+                if np.array_equal(grown, reach[_INNER]):
+                    break
+                reach[_INNER] = grown
+            areas.append(reach[_INNER])
+        black_area, white_area = areas
+        ownership = np.full(empty.shape, EMPTY, dtype=np.int8)
+        ownership[black_area & ~(empty & white_area)] = BLACK
+        ownership[white_area & ~(empty & black_area)] = WHITE
+        return ownership
+
+    def run(self) -> List[PlayoutResult]:
+        while True:
+            active = (self.passes < 2) & (self.num_moves < self.max_moves)
+            if not active.any():
+                break
+            self.step(active)
+        ownership = self.ownership().reshape(self.num_games, -1)
+        b = (ownership == BLACK).sum(axis=1)
+        w = (ownership == WHITE).sum(axis=1)
+        first_played = self.first_played[_INNER].reshape(self.num_games, -1)
+        results = []
+        for i in range(self.num_games):
+            score = GameResult(int(b[i]), int(w[i]), komi=self.komi)
+            results.append(PlayoutResult(score.winner, score, int(self.num_moves[i]), ownership[i].tolist(),
+                                         first_played[i].tolist()))
+        return results
+
+
+def play_out_batch(game_state: GameState, num_games: int, komi: float = KOMI) -> List[PlayoutResult]:
+    """num_games random playouts from game_state (which must not be over), advanced together"""
+    return BatchPlayout(game_state, num_games, komi).run()
@@ -0,0 +1,209 @@
+"""
+Heavy playout policy: local answers to the last move, after MoGo
+
+HeavyPolicy looks at the opponent's last move before falling back to a random move, in this order:
+ - atari escape: one of our strings next to the last move is in atari, extend it if that gains liberties
+ - capture: the string of the last move is in atari, take it
+ - 3x3 patterns: an empty neighbor of the last move whose surroundings match a pattern (hane, cut, edge moves)
+Only the last move's neighborhood is examined, so a move costs a bounded multiple of a random one.
+
+A 3x3 neighborhood is hashed to 16 bits, 2 bits per point (EMPTY, BLACK, WHITE, BORDER) in reading order without
+the center. The table of matching codes is built at import from the patterns below, in all 8 rotations and
+reflections and with both colors swapped, so it does not depend on the player to move.
+"""
+from __future__ import annotations
+import random
+import numpy as np
+
+from typing import Optional, Sequence, Tuple
+from dlgo.goboard_fast import BLACK, BORDER, EMPTY, WHITE
+from dlgo.playout.playout import PlayoutBoard, PlayoutPolicy
+
+__all__ = [
+    'HeavyPolicy',
+    'PATTERNS',
+    'create_playout_policy',
+    'matches_pattern',
+    'pattern_code',
+]
+
+# The move is played at the center. X: one color, O: the other, .: empty, #: off board, ?: anything,
+# x: anything but X, o: anything but O
+PATTERNS: Tuple[str, ...] = (
+    # hane
+    'XOX'
+    '...'
+    '???',
+    'XO.'
+    '...'
+    '?.?',
+    'XO?'
+    'X..'
+    'x.?',
+    'XOO'
+    '...'
+    '?.?',
+    # attachment
+    '.O.'
+    'X..'
+    '...',
+    # cut
+    'XO?'
+    'O.o'
+    '?o?',
+    'XO?'
+    'O.X'
+    '???',
+    '?X?'
+    'O.O'
+    'ooo',
+    # edge
+    'X.?'
+    'O.?'
+    '###',
+    'OX?'
+    'X.O'
+    '###',
+    '?X?'
+    'x.O'
+    '###',
+    '?XO'
+    'x.x'
+    '###',
+    '?OX'
+    'X.O'
+    '###',
+)
+
+_X = BLACK
+_O = WHITE
+_ALLOWED = {
+    'X': (_X,),
+    'O': (_O,),
+    '.': (EMPTY,),
+    '#': (BORDER,),
+    '?': (EMPTY, _X, _O, BORDER),
+    'x': (EMPTY, _O, BORDER),
+    'o': (EMPTY, _X, BORDER),
+}
+
+
+def _symmetries(pattern: str):
+    """The 8 rotations and reflections of a 3x3 pattern"""
+    grid = np.array(list(pattern)).reshape(3, 3)
+    for k in range(4):
+        rotated = np.rot90(grid, k)
+        yield ''.join(rotated.ravel())
+        yield ''.join(rotated.T.ravel())
+
+
+def _swap_colors(pattern: str) -> str:
+    return pattern.translate(str.maketrans('XOxo', 'OXox'))
+
+
+def _build_table(patterns: Sequence[str]) -> bytes:
+    """One byte per 16 bit neighborhood code, 1 if it matches a pattern"""
+    table = np.zeros((4,) * 8, dtype=np.uint8)
+    for pattern in patterns:
+        for variant in set(_symmetries(pattern)) | set(_symmetries(_swap_colors(pattern))):
+            cells = variant[:4] + variant[5:]  # the center is the move
+            table[np.ix_(*(_ALLOWED[c] for c in cells))] = 1
+    return table.tobytes()
+
+
+_TABLE = _build_table(PATTERNS)
+
+
+def pattern_code(board: PlayoutBoard, p: int) -> int:
+    """16 bit code of the 3x3 neighborhood of p, first neighbor in the high bits"""
+    stones = board.stones
+    stride = board.layout.stride
+    return stones[p - stride - 1] << 14 | stones[p - stride] << 12 | stones[p - stride + 1] << 10 | \
+        stones[p - 1] << 8 | stones[p + 1] << 6 | \
+        stones[p + stride - 1] << 4 | stones[p + stride] << 2 | stones[p + stride + 1]
+
+
+def matches_pattern(board: PlayoutBoard, p: int) -> bool:
+    return _TABLE[pattern_code(board, p)] == 1
+
+
+class HeavyPolicy(PlayoutPolicy):
+    def __init__(self, escapes: bool = True, captures: bool = True, patterns: bool = True):
+        """Each heuristic can be turned off; with none, the policy is the random one"""
+        self.escapes = escapes
+        self.captures = captures
+        self.patterns = patterns
+
+    def select_move(self, board: PlayoutBoard, color: int, last: int) -> int:
+        if last and board.stones[last] != EMPTY:
+            p = self.local_move(board, color, last)
+            if p:
+                return p
+        return board.select_move(color)
+
+    def local_move(self, board: PlayoutBoard, color: int, last: int) -> int:
+        """An answer to the opponent's move at last, 0 if none applies"""
+        stones = board.stones
+        root = board.root
+        if self.escapes:
+            for d in board.layout.offsets:
+                n = last + d
+                if stones[n] == color and board.in_atari(root[n]):
+                    liberty = _liberty(board, root[n])
+                    if self.playable(board, color, liberty) and _gains_liberties(board, color, liberty):
+                        return liberty
+        if self.captures and board.in_atari(root[last]):
+            liberty = _liberty(board, root[last])
+            if self.playable(board, color, liberty):
+                return liberty
+        if self.patterns:
+            stride = board.layout.stride
+            candidates = [n for n in (last - stride - 1, last - stride, last - stride + 1, last - 1, last + 1,
+                                      last + stride - 1, last + stride, last + stride + 1)
+                          if stones[n] == EMPTY and matches_pattern(board, n)]
+            while candidates:
+                n = candidates.pop(int(random.random() * len(candidates)))
+                if self.playable(board, color, n) and _gains_liberties(board, color, n):
+                    return n
+        return 0
+
+    @staticmethod
+    def playable(board: PlayoutBoard, color: int, p: int) -> bool:
+        return p != board.ko and not board.is_eye(color, p) and board.is_legal(color, p)
+
+
+def _liberty(board: PlayoutBoard, r: int) -> int:
+    """The only liberty of string r, which is in atari: all its pseudo-liberties are the same point"""
+    return board.lib_sum[r] // board.libs[r]
+
+
+def _gains_liberties(board: PlayoutBoard, color: int, p: int) -> bool:
+    """
+    Cheap guess that a stone at p is not a self-atari: it has two empty neighbors, joins a friendly string out of
+    atari with liberties to spare, or captures
+    """
+    stones = board.stones
+    empties = 0
+    for d in board.layout.offsets:
+        n = p + d
+        c = stones[n]
+        if c == EMPTY:
+            empties += 1
+        elif c == BORDER:
+            continue
+        elif c == color:
+            r = board.root[n]
+            if board.libs[r] > 2 and not board.in_atari(r):
+                return True
+        elif board.in_atari(board.root[n]):
+            return True
+    return empties >= 2
+
+
+def create_playout_policy(name: str) -> Optional[PlayoutPolicy]:
+    """light: uniformly random moves (None, play_out's default), heavy: HeavyPolicy"""
+    if name == 'light':
+        return None
+    if name == 'heavy':
+        return HeavyPolicy()
+    raise ValueError('Unknown playout policy: {}'.format(name))
@@ -0,0 +1,288 @@
+"""
+Light-weight random playouts for Monte Carlo rollouts
+
+A playout copies the position into a PlayoutBoard (the strings of dlgo.goboard_fast.StringBoard) and plays uniformly
+random non-eye moves to the end, keeping an incremental list of the empty points so a move is drawn without scanning the
+board. No GameState, Move or hash is built on the way; only the simple ko rule is enforced.
+"""
+from __future__ import annotations
+import random
+import struct
+import numpy as np
+from dlgo import goboard_fast
+from dlgo.goboard_fast import EMPTY, BLACK, WHITE, BORDER, StringBoard
+from dlgo.goboard import GameState
+from dlgo.gotypes import Player
+from dlgo.scoring import GameResult
+from typing import List, NamedTuple, Sequence, Tuple
+
+__all__ = [
+    'PlayoutBoard',
+    'PlayoutPolicy',
+    'PlayoutResult',
+    'RolloutStats',
+    'play_out',
+]
+
+KOMI = 7.5
+
+
+class PlayoutResult(NamedTuple):
+    winner: Player
+    score: GameResult
+    num_moves: int
+    ownership: Sequence[int]  # per point, row major: color of the stone or of the territory, EMPTY for dame
+    first_played: Sequence[int]  # per point, row major: color of the first stone the playout put there, or EMPTY
+
+
+class RolloutStats:
+    """
+    Aggregated results of many playouts from the same position: win counts, the sum of the score margins (black minus
+    white, komi included), how often each point ended up black or white, and for all-moves-as-first (RAVE) statistics
+    how often each color played a point first and how often it then won. The per point counts are NumPy uint32
+    arrays, so a result is added with a few array operations. Its binary form has a fixed size for a board size,
+    whatever the number of games.
+    """
+    _HEADER = struct.Struct('<IId')
+    # per point, row major
+    _ARRAYS = ('black_owned', 'white_owned', 'black_played', 'black_played_wins', 'white_played', 'white_played_wins')
+
+    def __init__(self, num_points: int):
+        self.black_wins = 0
+        self.white_wins = 0
+        self.margin_sum = 0.0
+        self.black_owned = np.zeros(num_points, dtype=np.uint32)
+        self.white_owned = np.zeros(num_points, dtype=np.uint32)
+        self.black_played = np.zeros(num_points, dtype=np.uint32)
+        self.black_played_wins = np.zeros(num_points, dtype=np.uint32)
+        self.white_played = np.zeros(num_points, dtype=np.uint32)
+        self.white_played_wins = np.zeros(num_points, dtype=np.uint32)
+
+    @property
+    def num_games(self) -> int:
+        return self.black_wins + self.white_wins
+
+    @property
+    def average_margin(self) -> float:
+        return self.margin_sum / self.num_games if self.num_games else 0.0
+
+    def wins(self, player: Player) -> int:
+        return self.black_wins if player == Player.black else self.white_wins
+
+    def played(self, player: Player) -> Tuple[np.ndarray, np.ndarray]:
+        """Per point: games where player played there first, and how many of them player won"""
+        if player == Player.black:
+            return self.black_played, self.black_played_wins
+        return self.white_played, self.white_played_wins
+
+    def add_winner(self, winner: Player, count: int = 1):
+        """Games known only by their winner (resignation): no margin, no ownership"""
+        if winner == Player.black:
+            self.black_wins += count
+        else:
+            self.white_wins += count
+
+    def add(self, result: PlayoutResult, count: int = 1):
+        self.add_winner(result.winner, count)
+        self.margin_sum += count * (result.score.b - result.score.w - result.score.komi)
+        owner = _colors(result.ownership)
+        _count(self.black_owned, owner == BLACK, count)
+        _count(self.white_owned, owner == WHITE, count)
+        first = _colors(result.first_played)
+        black_first = first == BLACK
+        white_first = first == WHITE
+        _count(self.black_played, black_first, count)
+        _count(self.white_played, white_first, count)
+        if result.winner == Player.black:
+            _count(self.black_played_wins, black_first, count)
+        else:
+            _count(self.white_played_wins, white_first, count)
+
+    def merge(self, other: RolloutStats):
+        self.black_wins += other.black_wins
+        self.white_wins += other.white_wins
+        self.margin_sum += other.margin_sum
+        for name in self._ARRAYS:
+            getattr(self, name)[:] += getattr(other, name)
+
+    def to_bytes(self) -> bytes:
+        return self._HEADER.pack(self.black_wins, self.white_wins, self.margin_sum) + \
+               b''.join(getattr(self, name).tobytes() for name in self._ARRAYS)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> RolloutStats:
+        stats = cls(0)
+        stats.black_wins, stats.white_wins, stats.margin_sum = cls._HEADER.unpack_from(data)
+        num_points = (len(data) - cls._HEADER.size) // (len(cls._ARRAYS) * 4)
+        values = np.frombuffer(data, dtype=np.uint32, offset=cls._HEADER.size).reshape(len(cls._ARRAYS), num_points)
+        for name, row in zip(cls._ARRAYS, values):
+            setattr(stats, name, row.copy())  # writable, for merge()
+        return stats
+
+
+def _colors(values: Sequence[int]) -> np.ndarray:
+    """Per point colors as an array; going through bytes is several times faster than np.asarray on a list"""
+    if isinstance(values, np.ndarray):
+        return values
+    return np.frombuffer(bytes(values), dtype=np.int8)
+
+
+def _count(values: np.ndarray, where: np.ndarray, count: int):
+    if count == 1:
+        values += where
+    else:
+        np.add(values, count, out=values, where=where)
+
+
+class PlayoutBoard(StringBoard):
+    """The strings of goboard_fast.StringBoard, plus a list of the empty points to draw random moves from"""
+    def __init__(self, num_rows: int, num_cols: int):
+        super().__init__(num_rows, num_cols)
+        self.empties: List[int] = list(self.layout.on_board)  # unordered
+        self.empty_pos: List[int] = [0] * self.layout.size  # index into empties, valid for empty points
+        for i, p in enumerate(self.empties):
+            self.empty_pos[p] = i
+        self.ko = 0  # index of the simple ko point, 0 (a border index) when there is none
+
+    @classmethod
+    def from_board(cls, board) -> PlayoutBoard:
+        """Build from a dlgo.goboard or dlgo.goboard_fast board"""
+        playout_board = cls(board.num_rows, board.num_cols)
+        if isinstance(board, goboard_fast.Board):
+            for p in playout_board.layout.on_board:
+                color = board.stones[p]
+                if color != EMPTY:
+                    playout_board.play(color, p)
+        else:
+            for p in playout_board.layout.on_board:
+                player = board.get(playout_board.layout.points[p])
+                if player is not None:
+                    playout_board.play(player.value, p)
+        return playout_board
+
+    def play(self, color: int, p: int):
+        """Place a stone; the move must be legal"""
+        empties = self.empties
+        empty_pos = self.empty_pos
+        i = empty_pos[p]
+        last = empties.pop()
+        if last != p:
+            empties[i] = last
+            empty_pos[last] = i
+
+        captured = self._add_stone(color, p)
+        for s in captured:
+            empty_pos[s] = len(empties)
+            empties.append(s)
+        self.ko = self._ko_after(p, captured) if captured else 0
+
+    def is_legal(self, color: int, p: int) -> bool:
+        """Legality of a move on an empty point other than the ko point: it must not be a suicide"""
+        stones = self.stones
+        for d in self.layout.offsets:
+            c = stones[p + d]
+            if c == EMPTY:
+                return True
+            if c == BORDER:
+                continue
+            if (c == color) != self.in_atari(self.root[p + d]):
+                # A friendly string with liberties left, or an enemy string we capture
+                return True
+        return False
+
+    def select_move(self, color: int) -> int:
+        """A random legal non-eye point, or 0 to pass"""
+        empties = self.empties
+        n = len(empties)
+        if n == 0:
+            return 0
+        start = int(random.random() * n)
+        ko = self.ko
+        surround = self.surround[color]
+        eye_threshold = self.layout.eye_threshold
+        for i in range(start - n, start):
+            p = empties[i]
+            # is_eye() on a point known to be empty
+            if p != ko and surround[p] < eye_threshold[p] and self.is_legal(color, p):
+                return p
+        return 0
+
+    def score(self, komi: float = KOMI) -> GameResult:
+        """Area score, counted the same way as dlgo.scoring"""
+        ownership = self.ownership()
+        return GameResult(ownership.count(BLACK), ownership.count(WHITE), komi=komi)
+
+    def ownership(self) -> List[int]:
+        """Per on-board point, row major: the color of the stone or of the territory, EMPTY for dame"""
+        stones = self.stones
+        offsets = self.layout.offsets
+        owner = stones.copy()
+        seen = set()
+        for p in self.layout.on_board:
+            if stones[p] == EMPTY and p not in seen:
+                seen.add(p)
+                region = [p]
+                borders = 0
+                i = 0
+                while i < len(region):
+                    q = region[i]
+                    i += 1
+                    for d in offsets:
+                        n = q + d
+                        c = stones[n]
+                        if c == EMPTY:
+                            if n not in seen:
+                                seen.add(n)
+                                region.append(n)
+                        elif c != BORDER:
+                            borders |= c
+                if borders == BLACK or borders == WHITE:
+                    for q in region:
+                        owner[q] = borders
+        return [owner[p] for p in self.layout.on_board]
+
+
+class PlayoutPolicy:
+    """Picks the playout moves; this one plays uniformly random non-eye moves (see dlgo.playout.patterns for more)"""
+    def select_move(self, board: PlayoutBoard, color: int, last: int) -> int:
+        """
+        A legal non-eye point for color, or 0 to pass
+        last: index of the opponent's last move, 0 for a pass or none
+        """
+        return board.select_move(color)
+
+
+def play_out(game_state: GameState, komi: float = KOMI, max_moves: int = 0,
+             policy: PlayoutPolicy = None) -> PlayoutResult:
+    """
+    Play moves from game_state (which must not be over) until both players pass, random ones unless a policy is
+    given.
+    max_moves caps the playout length (default: 3 times the number of points) in case of long ko fights.
+    """
+    board = PlayoutBoard.from_board(game_state.board)
+    if game_state.ko_point is not None:
+        board.ko = board.layout.index(game_state.ko_point)
+    if not max_moves:
+        max_moves = 3 * board.num_rows * board.num_cols
+    color = game_state.next_player.value
+    last_move = game_state.last_move
+    passes = 1 if last_move is not None and last_move.is_pass else 0
+    last = board.layout.index(last_move.point) if last_move is not None and last_move.is_play else 0
+    num_moves = 0
+    first_played = [EMPTY] * board.layout.size
+    while passes < 2 and num_moves < max_moves:
+        p = board.select_move(color) if policy is None else policy.select_move(board, color, last)
+        last = p
+        if p:
+            board.play(color, p)
+            if not first_played[p]:
+                first_played[p] = color
+            passes = 0
+        else:
+            board.ko = 0
+            passes += 1
+        color = 3 - color
+        num_moves += 1
+    ownership = board.ownership()
+    score = GameResult(ownership.count(BLACK), ownership.count(WHITE), komi=komi)
+    return PlayoutResult(score.winner, score, num_moves, ownership, [first_played[p] for p in board.layout.on_board])
@@ -2,7 +2,7 @@ from __future__ import annotations
 import dlgo.goboard as goboard
 import numpy as np
 from dlgo import gotypes
-from typing import cast
+from typing import List, Optional, Tuple, cast
 
 COLS = 'ABCDEFGHJKLMNOPQRST'
 STONE_TO_CHAR = {
@@ -48,17 +48,45 @@ def coords_from_point(point: gotypes.Point):
 
 
 class MoveAge:
+    """
+    Age of the stone on each point, in stones placed since: 0 for the last one, -1 for an empty point.
+    Stores the number of the move that placed each stone and a move counter, so placing a stone is O(1) and ages are
+    computed when read. Board.make_move() sets journal to record the ages of captured stones for undo().
+    """
     def __init__(self, board: goboard.Board):
-        self.move_ages = - np.ones((board.num_rows, board.num_cols))
+        self.placed = np.full((board.num_rows, board.num_cols), -1, dtype=np.int32)  # move number, -1 for none
+        self.move_number = 0  # stones placed so far
+        self.journal: Optional[List[Tuple[int, int, int]]] = None  # (row, col, placed) of the cleared points
 
-    def get(self, row, col):
-        return self.move_ages[row, col]
+    def get(self, row, col) -> int:
+        placed = int(self.placed[row, col])
+        return -1 if placed < 0 else self.move_number - 1 - placed
+
+    @property
+    def move_ages(self) -> np.ndarray:
+        """Ages of all points, indexed [row - 1, col - 1]"""
+        return np.where(self.placed >= 0, self.move_number - 1 - self.placed, -1)
 
     def reset_age(self, point):
-        self.move_ages[point.row - 1, point.col - 1] = -1
+        row, col = point.row - 1, point.col - 1
+        if self.journal is not None:
+            self.journal.append((row, col, int(self.placed[row, col])))
+        self.placed[row, col] = -1
 
     def add(self, point):
-        self.move_ages[point.row - 1, point.col - 1] = 0
+        self.placed[point.row - 1, point.col - 1] = self.move_number
+        self.move_number += 1
+
+    def undo_add(self, point, journal: List[Tuple[int, int, int]]):
+        """Take back add(point) and the reset_age() calls recorded in journal since"""
+        for row, col, placed in reversed(journal):
+            self.placed[row, col] = placed
+        self.placed[point.row - 1, point.col - 1] = -1
+        self.move_number -= 1
 
-    def increment_all(self):
-        self.move_ages[self.move_ages > -1] += 1
+    def copy(self) -> MoveAge:
+        copied = MoveAge.__new__(MoveAge)
+        copied.placed = self.placed.copy()
+        copied.move_number = self.move_number
+        copied.journal = None
+        return copied
@@ -1,728 +1,67 @@
-from .gotypes import Player, Point
+"""
+Zobrist hashing codes
 
-HASH_CODE = {
-    (Point(row=1, col=1), Player.black): 2386160552114413899,
-    (Point(row=1, col=1), Player.white): 8266240993832069703,
-    (Point(row=1, col=2), Player.black): 12254257972004638495,
-    (Point(row=1, col=2), Player.white): 10231349026518909132,
-    (Point(row=1, col=3), Player.black): 8652728914032976704,
-    (Point(row=1, col=3), Player.white): 14638569760683194206,
-    (Point(row=1, col=4), Player.black): 5054346042919783030,
-    (Point(row=1, col=4), Player.white): 10356255778483841633,
-    (Point(row=1, col=5), Player.black): 2911543919418462599,
-    (Point(row=1, col=5), Player.white): 10355585343656592626,
-    (Point(row=1, col=6), Player.black): 5891377913495581110,
-    (Point(row=1, col=6), Player.white): 11359544909629854212,
-    (Point(row=1, col=7), Player.black): 12986002195043957891,
-    (Point(row=1, col=7), Player.white): 9384955195456006833,
-    (Point(row=1, col=8), Player.black): 9770820802160862410,
-    (Point(row=1, col=8), Player.white): 2963181540116183225,
-    (Point(row=1, col=9), Player.black): 5114243824203979798,
-    (Point(row=1, col=9), Player.white): 3213952106634559372,
-    (Point(row=1, col=10), Player.black): 3668500222390827327,
-    (Point(row=1, col=10), Player.white): 444091830162456220,
-    (Point(row=1, col=11), Player.black): 15471301130681077547,
-    (Point(row=1, col=11), Player.white): 16853888324974108306,
-    (Point(row=1, col=12), Player.black): 16487949476590422651,
-    (Point(row=1, col=12), Player.white): 93631368999883195,
-    (Point(row=1, col=13), Player.black): 31638533832478937,
-    (Point(row=1, col=13), Player.white): 16863028275438807048,
-    (Point(row=1, col=14), Player.black): 15306851553015756747,
-    (Point(row=1, col=14), Player.white): 7545882297083758636,
-    (Point(row=1, col=15), Player.black): 17632124610832701220,
-    (Point(row=1, col=15), Player.white): 803603144874333354,
-    (Point(row=1, col=16), Player.black): 4120195792638020527,
-    (Point(row=1, col=16), Player.white): 13534509683545361948,
-    (Point(row=1, col=17), Player.black): 1549033998157901768,
-    (Point(row=1, col=17), Player.white): 681504872219838448,
-    (Point(row=1, col=18), Player.black): 88476785864677698,
-    (Point(row=1, col=18), Player.white): 4364651581342791166,
-    (Point(row=1, col=19), Player.black): 2277246052932974565,
-    (Point(row=1, col=19), Player.white): 11538877673270123588,
-    (Point(row=2, col=1), Player.black): 3108325264481573279,
-    (Point(row=2, col=1), Player.white): 14040762262399479878,
-    (Point(row=2, col=2), Player.black): 6063726362831969629,
-    (Point(row=2, col=2), Player.white): 15362948813882792393,
-    (Point(row=2, col=3), Player.black): 15883014832336443699,
-    (Point(row=2, col=3), Player.white): 2931516098691038336,
-    (Point(row=2, col=4), Player.black): 18106076811140281766,
-    (Point(row=2, col=4), Player.white): 18192478365641635738,
-    (Point(row=2, col=5), Player.black): 10880088428645953353,
-    (Point(row=2, col=5), Player.white): 7088637599988758137,
-    (Point(row=2, col=6), Player.black): 5294257684752489883,
-    (Point(row=2, col=6), Player.white): 6658708550977791514,
-    (Point(row=2, col=7), Player.black): 766809237976892868,
-    (Point(row=2, col=7), Player.white): 17517711484519478108,
-    (Point(row=2, col=8), Player.black): 1881843776084540436,
-    (Point(row=2, col=8), Player.white): 3618303738118192044,
-    (Point(row=2, col=9), Player.black): 16801985568463954047,
-    (Point(row=2, col=9), Player.white): 610817706129131732,
-    (Point(row=2, col=10), Player.black): 260343313439868760,
-    (Point(row=2, col=10), Player.white): 7203419730177982221,
-    (Point(row=2, col=11), Player.black): 13295641523509391322,
-    (Point(row=2, col=11), Player.white): 17697824451124057549,
-    (Point(row=2, col=12), Player.black): 12001935813103820711,
-    (Point(row=2, col=12), Player.white): 11823248248633718835,
-    (Point(row=2, col=13), Player.black): 16359663912636563517,
-    (Point(row=2, col=13), Player.white): 15864472423449324641,
-    (Point(row=2, col=14), Player.black): 6010210134225071399,
-    (Point(row=2, col=14), Player.white): 1473013005711499699,
-    (Point(row=2, col=15), Player.black): 9270895041447866722,
-    (Point(row=2, col=15), Player.white): 10361860375118174904,
-    (Point(row=2, col=16), Player.black): 10305605477560759787,
-    (Point(row=2, col=16), Player.white): 14395133624179674952,
-    (Point(row=2, col=17), Player.black): 8060407118560561733,
-    (Point(row=2, col=17), Player.white): 14526331093746093244,
-    (Point(row=2, col=18), Player.black): 14306402621751000206,
-    (Point(row=2, col=18), Player.white): 328433392950826431,
-    (Point(row=2, col=19), Player.black): 10859662764713484488,
-    (Point(row=2, col=19), Player.white): 12732556342800437547,
-    (Point(row=3, col=1), Player.black): 4774720337719824286,
-    (Point(row=3, col=1), Player.white): 7031889115136112299,
-    (Point(row=3, col=2), Player.black): 10574003100593760608,
-    (Point(row=3, col=2), Player.white): 18015965458250612972,
-    (Point(row=3, col=3), Player.black): 14588631844173327916,
-    (Point(row=3, col=3), Player.white): 2081157460066961041,
-    (Point(row=3, col=4), Player.black): 3253917024277442316,
-    (Point(row=3, col=4), Player.white): 10576012212176522248,
-    (Point(row=3, col=5), Player.black): 5993688564182533666,
-    (Point(row=3, col=5), Player.white): 10206905545530769651,
-    (Point(row=3, col=6), Player.black): 9636158683659634253,
-    (Point(row=3, col=6), Player.white): 5680574026464391591,
-    (Point(row=3, col=7), Player.black): 5051507517152685625,
-    (Point(row=3, col=7), Player.white): 15333944824955224308,
-    (Point(row=3, col=8), Player.black): 10303003085491924701,
-    (Point(row=3, col=8), Player.white): 8065011537016838816,
-    (Point(row=3, col=9), Player.black): 5143678546374130628,
-    (Point(row=3, col=9), Player.white): 16674704050162589468,
-    (Point(row=3, col=10), Player.black): 2548290656083552979,
-    (Point(row=3, col=10), Player.white): 9562907240355967683,
-    (Point(row=3, col=11), Player.black): 14221960374366426451,
-    (Point(row=3, col=11), Player.white): 16457862511422682245,
-    (Point(row=3, col=12), Player.black): 13668620415047073284,
-    (Point(row=3, col=12), Player.white): 16112481419266314908,
-    (Point(row=3, col=13), Player.black): 17545315066159355720,
-    (Point(row=3, col=13), Player.white): 16178239413732388503,
-    (Point(row=3, col=14), Player.black): 14166653715705645121,
-    (Point(row=3, col=14), Player.white): 4365320700486049506,
-    (Point(row=3, col=15), Player.black): 14751961179696049017,
-    (Point(row=3, col=15), Player.white): 7500834143170501159,
-    (Point(row=3, col=16), Player.black): 8568389612384467627,
-    (Point(row=3, col=16), Player.white): 17776037234958195933,
-    (Point(row=3, col=17), Player.black): 14523757343115416579,
-    (Point(row=3, col=17), Player.white): 2559935539793769572,
-    (Point(row=3, col=18), Player.black): 18095599617083150236,
-    (Point(row=3, col=18), Player.white): 1918309410653665719,
-    (Point(row=3, col=19), Player.black): 6071847993734271250,
-    (Point(row=3, col=19), Player.white): 1084928653899839643,
-    (Point(row=4, col=1), Player.black): 12515408548800234446,
-    (Point(row=4, col=1), Player.white): 11339333233102246488,
-    (Point(row=4, col=2), Player.black): 4551313588357394051,
-    (Point(row=4, col=2), Player.white): 1431057844116084854,
-    (Point(row=4, col=3), Player.black): 14303510340483344298,
-    (Point(row=4, col=3), Player.white): 16719069357526629317,
-    (Point(row=4, col=4), Player.black): 10996774419197467287,
-    (Point(row=4, col=4), Player.white): 9001291533871860754,
-    (Point(row=4, col=5), Player.black): 4950626390309581649,
-    (Point(row=4, col=5), Player.white): 1449284662440167599,
-    (Point(row=4, col=6), Player.black): 9231858397117327480,
-    (Point(row=4, col=6), Player.white): 4826363101898919091,
-    (Point(row=4, col=7), Player.black): 5843877177870427340,
-    (Point(row=4, col=7), Player.white): 11458917280741627539,
-    (Point(row=4, col=8), Player.black): 3915607029028498581,
-    (Point(row=4, col=8), Player.white): 1819334397711031733,
-    (Point(row=4, col=9), Player.black): 14332767366481699664,
-    (Point(row=4, col=9), Player.white): 204142093814570291,
-    (Point(row=4, col=10), Player.black): 8826612531702117370,
-    (Point(row=4, col=10), Player.white): 742915810298919664,
-    (Point(row=4, col=11), Player.black): 5249452435380876771,
-    (Point(row=4, col=11), Player.white): 9769360007552729883,
-    (Point(row=4, col=12), Player.black): 7537582783703997822,
-    (Point(row=4, col=12), Player.white): 10654909559513645973,
-    (Point(row=4, col=13), Player.black): 13634984712513235234,
-    (Point(row=4, col=13), Player.white): 10850804688040864296,
-    (Point(row=4, col=14), Player.black): 14463435286150627651,
-    (Point(row=4, col=14), Player.white): 9322272276274389704,
-    (Point(row=4, col=15), Player.black): 9888301313892625180,
-    (Point(row=4, col=15), Player.white): 3068681285296050221,
-    (Point(row=4, col=16), Player.black): 4661570883210907123,
-    (Point(row=4, col=16), Player.white): 17849276249799608173,
-    (Point(row=4, col=17), Player.black): 7623497967928600134,
-    (Point(row=4, col=17), Player.white): 663226316224525813,
-    (Point(row=4, col=18), Player.black): 15353266379952853471,
-    (Point(row=4, col=18), Player.white): 13665325931444709196,
-    (Point(row=4, col=19), Player.black): 15912806057761515790,
-    (Point(row=4, col=19), Player.white): 6932533842426461800,
-    (Point(row=5, col=1), Player.black): 5389647661291964582,
-    (Point(row=5, col=1), Player.white): 8271210960914856389,
-    (Point(row=5, col=2), Player.black): 1163850250047900935,
-    (Point(row=5, col=2), Player.white): 2664355668969540163,
-    (Point(row=5, col=3), Player.black): 7331137545228194908,
-    (Point(row=5, col=3), Player.white): 5539938379748043418,
-    (Point(row=5, col=4), Player.black): 2263407292862112818,
-    (Point(row=5, col=4), Player.white): 10224517982103704400,
-    (Point(row=5, col=5), Player.black): 1056957749755116263,
-    (Point(row=5, col=5), Player.white): 3026432730841698401,
-    (Point(row=5, col=6), Player.black): 15738274376629775047,
-    (Point(row=5, col=6), Player.white): 10170868468922994686,
-    (Point(row=5, col=7), Player.black): 16296665714639545236,
-    (Point(row=5, col=7), Player.white): 8011792551048515497,
-    (Point(row=5, col=8), Player.black): 498805319737857857,
-    (Point(row=5, col=8), Player.white): 9183517262948021346,
-    (Point(row=5, col=9), Player.black): 12898752330904303540,
-    (Point(row=5, col=9), Player.white): 8776963674435075401,
-    (Point(row=5, col=10), Player.black): 10516876397333418129,
-    (Point(row=5, col=10), Player.white): 9512987157335865180,
-    (Point(row=5, col=11), Player.black): 7971489408849981227,
-    (Point(row=5, col=11), Player.white): 4631557031372881952,
-    (Point(row=5, col=12), Player.black): 3201048388762854511,
-    (Point(row=5, col=12), Player.white): 13626365142291340337,
-    (Point(row=5, col=13), Player.black): 3021984051759319713,
-    (Point(row=5, col=13), Player.white): 16063259265085272513,
-    (Point(row=5, col=14), Player.black): 10343384743219002593,
-    (Point(row=5, col=14), Player.white): 17643979059296957825,
-    (Point(row=5, col=15), Player.black): 12890323752286630155,
-    (Point(row=5, col=15), Player.white): 8799946639133539924,
-    (Point(row=5, col=16), Player.black): 14101912567174050467,
-    (Point(row=5, col=16), Player.white): 4157557500272602592,
-    (Point(row=5, col=17), Player.black): 9714816315102910551,
-    (Point(row=5, col=17), Player.white): 3745947185455500560,
-    (Point(row=5, col=18), Player.black): 1925099973743742416,
-    (Point(row=5, col=18), Player.white): 5186756065711057594,
-    (Point(row=5, col=19), Player.black): 14992447689385545753,
-    (Point(row=5, col=19), Player.white): 538269124168419654,
-    (Point(row=6, col=1), Player.black): 7670498905448685615,
-    (Point(row=6, col=1), Player.white): 7781981741278703848,
-    (Point(row=6, col=2), Player.black): 4904777257183887638,
-    (Point(row=6, col=2), Player.white): 18138046875244719055,
-    (Point(row=6, col=3), Player.black): 9677540425001572891,
-    (Point(row=6, col=3), Player.white): 13307030259871007217,
-    (Point(row=6, col=4), Player.black): 8814706288223704191,
-    (Point(row=6, col=4), Player.white): 2491500083849108527,
-    (Point(row=6, col=5), Player.black): 4041820723235363863,
-    (Point(row=6, col=5), Player.white): 6283867422395121187,
-    (Point(row=6, col=6), Player.black): 9270397970151535103,
-    (Point(row=6, col=6), Player.white): 7241724294015685821,
-    (Point(row=6, col=7), Player.black): 6583358675083547910,
-    (Point(row=6, col=7), Player.white): 13030898211007713391,
-    (Point(row=6, col=8), Player.black): 5485288756263702104,
-    (Point(row=6, col=8), Player.white): 8861057267191504139,
-    (Point(row=6, col=9), Player.black): 16890410001229063080,
-    (Point(row=6, col=9), Player.white): 6932041936139727227,
-    (Point(row=6, col=10), Player.black): 17100729292285155998,
-    (Point(row=6, col=10), Player.white): 1535461644583655544,
-    (Point(row=6, col=11), Player.black): 5524526007472911797,
-    (Point(row=6, col=11), Player.white): 12095932444164084640,
-    (Point(row=6, col=12), Player.black): 9087595586767638079,
-    (Point(row=6, col=12), Player.white): 5988340721707030447,
-    (Point(row=6, col=13), Player.black): 15017160425349002977,
-    (Point(row=6, col=13), Player.white): 16140981519780255360,
-    (Point(row=6, col=14), Player.black): 11653053127605448725,
-    (Point(row=6, col=14), Player.white): 5863535739523275405,
-    (Point(row=6, col=15), Player.black): 13142718954534017260,
-    (Point(row=6, col=15), Player.white): 15188465602942960451,
-    (Point(row=6, col=16), Player.black): 7515385136342065830,
-    (Point(row=6, col=16), Player.white): 8346129381655677323,
-    (Point(row=6, col=17), Player.black): 12782570559593871674,
-    (Point(row=6, col=17), Player.white): 2756734619280662925,
-    (Point(row=6, col=18), Player.black): 9846721893668216653,
-    (Point(row=6, col=18), Player.white): 12293841734413355568,
-    (Point(row=6, col=19), Player.black): 9445427397560833119,
-    (Point(row=6, col=19), Player.white): 3276311409723423370,
-    (Point(row=7, col=1), Player.black): 16340598972044852400,
-    (Point(row=7, col=1), Player.white): 10775626603236348043,
-    (Point(row=7, col=2), Player.black): 13460325126426083240,
-    (Point(row=7, col=2), Player.white): 10571566024537078013,
-    (Point(row=7, col=3), Player.black): 4123711872662225064,
-    (Point(row=7, col=3), Player.white): 2426278691673205964,
-    (Point(row=7, col=4), Player.black): 3723918040012785921,
-    (Point(row=7, col=4), Player.white): 14497988722993806284,
-    (Point(row=7, col=5), Player.black): 724089237128073618,
-    (Point(row=7, col=5), Player.white): 3047114239424992495,
-    (Point(row=7, col=6), Player.black): 2400537583060014038,
-    (Point(row=7, col=6), Player.white): 5602687873592984755,
-    (Point(row=7, col=7), Player.black): 14563139103427819627,
-    (Point(row=7, col=7), Player.white): 8152539601177342688,
-    (Point(row=7, col=8), Player.black): 205305303928894867,
-    (Point(row=7, col=8), Player.white): 10562542856295530550,
-    (Point(row=7, col=9), Player.black): 14159673631577339300,
-    (Point(row=7, col=9), Player.white): 13413726257550041173,
-    (Point(row=7, col=10), Player.black): 3600597568178671522,
-    (Point(row=7, col=10), Player.white): 8140769984539048530,
-    (Point(row=7, col=11), Player.black): 12305820364345533180,
-    (Point(row=7, col=11), Player.white): 5147052992815851336,
-    (Point(row=7, col=12), Player.black): 4513474035904816100,
-    (Point(row=7, col=12), Player.white): 13647963875020855015,
-    (Point(row=7, col=13), Player.black): 13034933992147484826,
-    (Point(row=7, col=13), Player.white): 753642831153823450,
-    (Point(row=7, col=14), Player.black): 16661568734621570700,
-    (Point(row=7, col=14), Player.white): 9454888087080257806,
-    (Point(row=7, col=15), Player.black): 11284238132050689189,
-    (Point(row=7, col=15), Player.white): 11051952864109835341,
-    (Point(row=7, col=16), Player.black): 11321142269353376287,
-    (Point(row=7, col=16), Player.white): 4106743594294248632,
-    (Point(row=7, col=17), Player.black): 15694541493220000828,
-    (Point(row=7, col=17), Player.white): 63584712995731123,
-    (Point(row=7, col=18), Player.black): 3244669564753295770,
-    (Point(row=7, col=18), Player.white): 10548044906135804017,
-    (Point(row=7, col=19), Player.black): 7745324974368789054,
-    (Point(row=7, col=19), Player.white): 4780259586201452655,
-    (Point(row=8, col=1), Player.black): 14333444777976732432,
-    (Point(row=8, col=1), Player.white): 520828352068911299,
-    (Point(row=8, col=2), Player.black): 2264086800538145913,
-    (Point(row=8, col=2), Player.white): 9076483746524060162,
-    (Point(row=8, col=3), Player.black): 10091016801290201521,
-    (Point(row=8, col=3), Player.white): 9817950370456979020,
-    (Point(row=8, col=4), Player.black): 18050210825251154785,
-    (Point(row=8, col=4), Player.white): 2285180639365764775,
-    (Point(row=8, col=5), Player.black): 10407279727708288379,
-    (Point(row=8, col=5), Player.white): 5989924575096766059,
-    (Point(row=8, col=6), Player.black): 2450812363356015106,
-    (Point(row=8, col=6), Player.white): 3575984087036590225,
-    (Point(row=8, col=7), Player.black): 14844911847635556385,
-    (Point(row=8, col=7), Player.white): 17898881341357805026,
-    (Point(row=8, col=8), Player.black): 11796692614664127220,
-    (Point(row=8, col=8), Player.white): 7230775862977341986,
-    (Point(row=8, col=9), Player.black): 1786343694823279190,
-    (Point(row=8, col=9), Player.white): 2973653847096188421,
-    (Point(row=8, col=10), Player.black): 4678865443765643728,
-    (Point(row=8, col=10), Player.white): 3941622609018048780,
-    (Point(row=8, col=11), Player.black): 3062406794081054062,
-    (Point(row=8, col=11), Player.white): 18401702877089848196,
-    (Point(row=8, col=12), Player.black): 4311838679374946386,
-    (Point(row=8, col=12), Player.white): 10735171146692117695,
-    (Point(row=8, col=13), Player.black): 16030323178814683723,
-    (Point(row=8, col=13), Player.white): 3660054743539211575,
-    (Point(row=8, col=14), Player.black): 772135176604717524,
-    (Point(row=8, col=14), Player.white): 5102431594366913424,
-    (Point(row=8, col=15), Player.black): 17684470190938370589,
-    (Point(row=8, col=15), Player.white): 12968488393675862912,
-    (Point(row=8, col=16), Player.black): 14765513363571929718,
-    (Point(row=8, col=16), Player.white): 11618652250554602402,
-    (Point(row=8, col=17), Player.black): 16201925522639508543,
-    (Point(row=8, col=17), Player.white): 12488998394976680465,
-    (Point(row=8, col=18), Player.black): 18271829122351577964,
-    (Point(row=8, col=18), Player.white): 9553316251380402492,
-    (Point(row=8, col=19), Player.black): 11117405115165909137,
-    (Point(row=8, col=19), Player.white): 13368995107037489280,
-    (Point(row=9, col=1), Player.black): 2414548097221490426,
-    (Point(row=9, col=1), Player.white): 17824395836923402327,
-    (Point(row=9, col=2), Player.black): 14075418207886409685,
-    (Point(row=9, col=2), Player.white): 16356969336152273653,
-    (Point(row=9, col=3), Player.black): 3401075818993783345,
-    (Point(row=9, col=3), Player.white): 3928645317861032570,
-    (Point(row=9, col=4), Player.black): 13216783255140852867,
-    (Point(row=9, col=4), Player.white): 17171438665316926322,
-    (Point(row=9, col=5), Player.black): 9728566899473434539,
-    (Point(row=9, col=5), Player.white): 14198613688588844578,
-    (Point(row=9, col=6), Player.black): 9694889655159922387,
-    (Point(row=9, col=6), Player.white): 1347073406935360476,
-    (Point(row=9, col=7), Player.black): 8261888027687530946,
-    (Point(row=9, col=7), Player.white): 8578909951128105397,
-    (Point(row=9, col=8), Player.black): 16673028316711853999,
-    (Point(row=9, col=8), Player.white): 6568869403407911474,
-    (Point(row=9, col=9), Player.black): 2817832775379817077,
-    (Point(row=9, col=9), Player.white): 4795289391813730384,
-    (Point(row=9, col=10), Player.black): 11909233057317620293,
-    (Point(row=9, col=10), Player.white): 9338091891135370461,
-    (Point(row=9, col=11), Player.black): 14558092571949439827,
-    (Point(row=9, col=11), Player.white): 8703745188556824710,
-    (Point(row=9, col=12), Player.black): 16520616303184362633,
-    (Point(row=9, col=12), Player.white): 15907671358435669708,
-    (Point(row=9, col=13), Player.black): 16180701842453583448,
-    (Point(row=9, col=13), Player.white): 15252625567740409488,
-    (Point(row=9, col=14), Player.black): 5291518554255122469,
-    (Point(row=9, col=14), Player.white): 1613575945338962340,
-    (Point(row=9, col=15), Player.black): 15112797495808268902,
-    (Point(row=9, col=15), Player.white): 13291758634796929716,
-    (Point(row=9, col=16), Player.black): 16538792907755513537,
-    (Point(row=9, col=16), Player.white): 13647304143537777009,
-    (Point(row=9, col=17), Player.black): 9862976305065628530,
-    (Point(row=9, col=17), Player.white): 3908320700626257750,
-    (Point(row=9, col=18), Player.black): 13495775462547968934,
-    (Point(row=9, col=18), Player.white): 1958147474824104078,
-    (Point(row=9, col=19), Player.black): 7150696994913625456,
-    (Point(row=9, col=19), Player.white): 12141351473712543721,
-    (Point(row=10, col=1), Player.black): 2511227019443801730,
-    (Point(row=10, col=1), Player.white): 10501057022434442276,
-    (Point(row=10, col=2), Player.black): 1910760494946712462,
-    (Point(row=10, col=2), Player.white): 7451819158519930184,
-    (Point(row=10, col=3), Player.black): 3573290749735390841,
-    (Point(row=10, col=3), Player.white): 12674127222824749380,
-    (Point(row=10, col=4), Player.black): 3112481980230164497,
-    (Point(row=10, col=4), Player.white): 7492270159587692997,
-    (Point(row=10, col=5), Player.black): 8051756160772638715,
-    (Point(row=10, col=5), Player.white): 10646821878910322776,
-    (Point(row=10, col=6), Player.black): 14708476148847402795,
-    (Point(row=10, col=6), Player.white): 12265697741867534782,
-    (Point(row=10, col=7), Player.black): 18109851771290328234,
-    (Point(row=10, col=7), Player.white): 11771645379060265518,
-    (Point(row=10, col=8), Player.black): 8684968872203386251,
-    (Point(row=10, col=8), Player.white): 15709712338641256087,
-    (Point(row=10, col=9), Player.black): 807718040410031024,
-    (Point(row=10, col=9), Player.white): 11473511644959477758,
-    (Point(row=10, col=10), Player.black): 3577510365335906407,
-    (Point(row=10, col=10), Player.white): 18403343563046066068,
-    (Point(row=10, col=11), Player.black): 8933993597628586242,
-    (Point(row=10, col=11), Player.white): 17565921023644533532,
-    (Point(row=10, col=12), Player.black): 3532191114964038166,
-    (Point(row=10, col=12), Player.white): 13319852038244594844,
-    (Point(row=10, col=13), Player.black): 14984206953787533899,
-    (Point(row=10, col=13), Player.white): 13614198236036456889,
-    (Point(row=10, col=14), Player.black): 725858349057558688,
-    (Point(row=10, col=14), Player.white): 9449541627361780776,
-    (Point(row=10, col=15), Player.black): 11709041878701332136,
-    (Point(row=10, col=15), Player.white): 650311004008266111,
-    (Point(row=10, col=16), Player.black): 9487855874776936296,
-    (Point(row=10, col=16), Player.white): 2702661222677339392,
-    (Point(row=10, col=17), Player.black): 1766147067053364584,
-    (Point(row=10, col=17), Player.white): 349359058694731094,
-    (Point(row=10, col=18), Player.black): 13171197979488932880,
-    (Point(row=10, col=18), Player.white): 15443819966018813621,
-    (Point(row=10, col=19), Player.black): 2085036920175855755,
-    (Point(row=10, col=19), Player.white): 1546203707791781263,
-    (Point(row=11, col=1), Player.black): 14061444117633023980,
-    (Point(row=11, col=1), Player.white): 10223065720691845089,
-    (Point(row=11, col=2), Player.black): 16074809530350671275,
-    (Point(row=11, col=2), Player.white): 13376167007956749477,
-    (Point(row=11, col=3), Player.black): 12384397221180507039,
-    (Point(row=11, col=3), Player.white): 13489497119352893051,
-    (Point(row=11, col=4), Player.black): 11426696533791397774,
-    (Point(row=11, col=4), Player.white): 16109179191011979190,
-    (Point(row=11, col=5), Player.black): 2005518531228795174,
-    (Point(row=11, col=5), Player.white): 5751966390780106503,
-    (Point(row=11, col=6), Player.black): 14962408555859599623,
-    (Point(row=11, col=6), Player.white): 1019182263773987491,
-    (Point(row=11, col=7), Player.black): 9832284436958459220,
-    (Point(row=11, col=7), Player.white): 11225179606832070369,
-    (Point(row=11, col=8), Player.black): 17309775272005300339,
-    (Point(row=11, col=8), Player.white): 8331091634183318376,
-    (Point(row=11, col=9), Player.black): 10790164584109422312,
-    (Point(row=11, col=9), Player.white): 13699071016769993979,
-    (Point(row=11, col=10), Player.black): 13938202180068076456,
-    (Point(row=11, col=10), Player.white): 13263658567141898379,
-    (Point(row=11, col=11), Player.black): 1299490074473767573,
-    (Point(row=11, col=11), Player.white): 511336108012316024,
-    (Point(row=11, col=12), Player.black): 12595446411805450303,
-    (Point(row=11, col=12), Player.white): 7576963713493202619,
-    (Point(row=11, col=13), Player.black): 806437499448352812,
-    (Point(row=11, col=13), Player.white): 10750900842021748374,
-    (Point(row=11, col=14), Player.black): 12235647778334333410,
-    (Point(row=11, col=14), Player.white): 3987071533871047300,
-    (Point(row=11, col=15), Player.black): 14136399227041140226,
-    (Point(row=11, col=15), Player.white): 9996290836857672571,
-    (Point(row=11, col=16), Player.black): 333091737815579012,
-    (Point(row=11, col=16), Player.white): 8441653459941446,
-    (Point(row=11, col=17), Player.black): 18418701791485723583,
-    (Point(row=11, col=17), Player.white): 12147628229089377388,
-    (Point(row=11, col=18), Player.black): 6921709580381734756,
-    (Point(row=11, col=18), Player.white): 2205459831759899764,
-    (Point(row=11, col=19), Player.black): 14362268080656041972,
-    (Point(row=11, col=19), Player.white): 10459896997631110663,
-    (Point(row=12, col=1), Player.black): 8662308237789861533,
-    (Point(row=12, col=1), Player.white): 666318290632296892,
-    (Point(row=12, col=2), Player.black): 7886158483676006821,
-    (Point(row=12, col=2), Player.white): 14014313370468476409,
-    (Point(row=12, col=3), Player.black): 1097391629981566851,
-    (Point(row=12, col=3), Player.white): 1754610497512900539,
-    (Point(row=12, col=4), Player.black): 14814282055553604680,
-    (Point(row=12, col=4), Player.white): 12207893993927624754,
-    (Point(row=12, col=5), Player.black): 13226174078272306581,
-    (Point(row=12, col=5), Player.white): 16871439424398130099,
-    (Point(row=12, col=6), Player.black): 5812302393874513472,
-    (Point(row=12, col=6), Player.white): 7397961313012115555,
-    (Point(row=12, col=7), Player.black): 18124806322962828311,
-    (Point(row=12, col=7), Player.white): 10847122654724275425,
-    (Point(row=12, col=8), Player.black): 7148683006784211080,
-    (Point(row=12, col=8), Player.white): 14398320966671984247,
-    (Point(row=12, col=9), Player.black): 2844664647733396111,
-    (Point(row=12, col=9), Player.white): 9108010895835972341,
-    (Point(row=12, col=10), Player.black): 256939595092582379,
-    (Point(row=12, col=10), Player.white): 16681783397413000803,
-    (Point(row=12, col=11), Player.black): 14300896518412586965,
-    (Point(row=12, col=11), Player.white): 12227186355964552695,
-    (Point(row=12, col=12), Player.black): 10360841248363026318,
-    (Point(row=12, col=12), Player.white): 17054701002062402526,
-    (Point(row=12, col=13), Player.black): 10339258305939895118,
-    (Point(row=12, col=13), Player.white): 17167578815874604819,
-    (Point(row=12, col=14), Player.black): 15180443429575346269,
-    (Point(row=12, col=14), Player.white): 15580232317347350740,
-    (Point(row=12, col=15), Player.black): 906881429430389548,
-    (Point(row=12, col=15), Player.white): 16196582228331055673,
-    (Point(row=12, col=16), Player.black): 2317087719182544570,
-    (Point(row=12, col=16), Player.white): 10980463551224549183,
-    (Point(row=12, col=17), Player.black): 6498975005238070810,
-    (Point(row=12, col=17), Player.white): 15686911754941716008,
-    (Point(row=12, col=18), Player.black): 18434463563243192101,
-    (Point(row=12, col=18), Player.white): 7091406831982185318,
-    (Point(row=12, col=19), Player.black): 4523362306547461169,
-    (Point(row=12, col=19), Player.white): 9933212091768603694,
-    (Point(row=13, col=1), Player.black): 2140120899482945123,
-    (Point(row=13, col=1), Player.white): 12346403953981107948,
-    (Point(row=13, col=2), Player.black): 11402694232126950012,
-    (Point(row=13, col=2), Player.white): 913135407905559757,
-    (Point(row=13, col=3), Player.black): 12922914355515804319,
-    (Point(row=13, col=3), Player.white): 5188873027642464203,
-    (Point(row=13, col=4), Player.black): 9871517088621582964,
-    (Point(row=13, col=4), Player.white): 1409810685481439759,
-    (Point(row=13, col=5), Player.black): 14291287200944085378,
-    (Point(row=13, col=5), Player.white): 14345125912594394822,
-    (Point(row=13, col=6), Player.black): 16715840798448859427,
-    (Point(row=13, col=6), Player.white): 2472082655005885614,
-    (Point(row=13, col=7), Player.black): 12519846454160519793,
-    (Point(row=13, col=7), Player.white): 4688480298675560182,
-    (Point(row=13, col=8), Player.black): 31222989258314577,
-    (Point(row=13, col=8), Player.white): 6070791907123537879,
-    (Point(row=13, col=9), Player.black): 1397408318467944757,
-    (Point(row=13, col=9), Player.white): 16477039845160470927,
-    (Point(row=13, col=10), Player.black): 12364145888007123651,
-    (Point(row=13, col=10), Player.white): 1435295713581965261,
-    (Point(row=13, col=11), Player.black): 1245147299820600231,
-    (Point(row=13, col=11), Player.white): 13098183839982900960,
-    (Point(row=13, col=12), Player.black): 12826672342929500849,
-    (Point(row=13, col=12), Player.white): 17333557155515971742,
-    (Point(row=13, col=13), Player.black): 10038164057497031838,
-    (Point(row=13, col=13), Player.white): 15078252146317319022,
-    (Point(row=13, col=14), Player.black): 466897014997512559,
-    (Point(row=13, col=14), Player.white): 17671619031416680276,
-    (Point(row=13, col=15), Player.black): 10887301061240534721,
-    (Point(row=13, col=15), Player.white): 14724213322069400539,
-    (Point(row=13, col=16), Player.black): 12379205541076394447,
-    (Point(row=13, col=16), Player.white): 2042027545400759466,
-    (Point(row=13, col=17), Player.black): 3412462994233280568,
-    (Point(row=13, col=17), Player.white): 15110849251657750936,
-    (Point(row=13, col=18), Player.black): 17394927606360463232,
-    (Point(row=13, col=18), Player.white): 2006247316370916885,
-    (Point(row=13, col=19), Player.black): 18205583566181520166,
-    (Point(row=13, col=19), Player.white): 2122461005980079662,
-    (Point(row=14, col=1), Player.black): 13645859090819968524,
-    (Point(row=14, col=1), Player.white): 4466116850028030940,
-    (Point(row=14, col=2), Player.black): 10340983279550307333,
-    (Point(row=14, col=2), Player.white): 10925554065037910616,
-    (Point(row=14, col=3), Player.black): 11386850103041793671,
-    (Point(row=14, col=3), Player.white): 1281775090004022491,
-    (Point(row=14, col=4), Player.black): 1260415455445457662,
-    (Point(row=14, col=4), Player.white): 16102577948643019563,
-    (Point(row=14, col=5), Player.black): 9959231822969173653,
-    (Point(row=14, col=5), Player.white): 8996125596647411861,
-    (Point(row=14, col=6), Player.black): 13004684786905485247,
-    (Point(row=14, col=6), Player.white): 5472383397532097090,
-    (Point(row=14, col=7), Player.black): 8807334316999496436,
-    (Point(row=14, col=7), Player.white): 16637842357834567233,
-    (Point(row=14, col=8), Player.black): 4582254850056739361,
-    (Point(row=14, col=8), Player.white): 12626150751722935461,
-    (Point(row=14, col=9), Player.black): 1267514291453320892,
-    (Point(row=14, col=9), Player.white): 9815009381105659491,
-    (Point(row=14, col=10), Player.black): 10517619005929438944,
-    (Point(row=14, col=10), Player.white): 8571048263012526923,
-    (Point(row=14, col=11), Player.black): 10803129158562082797,
-    (Point(row=14, col=11), Player.white): 4759928499429678233,
-    (Point(row=14, col=12), Player.black): 284477202707505704,
-    (Point(row=14, col=12), Player.white): 10157586634897929562,
-    (Point(row=14, col=13), Player.black): 19361697210448253,
-    (Point(row=14, col=13), Player.white): 3963761344884027816,
-    (Point(row=14, col=14), Player.black): 9529138177081185590,
-    (Point(row=14, col=14), Player.white): 9868774135623227182,
-    (Point(row=14, col=15), Player.black): 5226254911982116526,
-    (Point(row=14, col=15), Player.white): 17011955825853900345,
-    (Point(row=14, col=16), Player.black): 8673490728637300733,
-    (Point(row=14, col=16), Player.white): 13413524773454910649,
-    (Point(row=14, col=17), Player.black): 18408008953647766417,
-    (Point(row=14, col=17), Player.white): 11452444773429426313,
-    (Point(row=14, col=18), Player.black): 5972345901557766671,
-    (Point(row=14, col=18), Player.white): 11142812157407743689,
-    (Point(row=14, col=19), Player.black): 16039903116898573512,
-    (Point(row=14, col=19), Player.white): 4391735607189838690,
-    (Point(row=15, col=1), Player.black): 12061024708109112632,
-    (Point(row=15, col=1), Player.white): 2260786830514892776,
-    (Point(row=15, col=2), Player.black): 3319988973365292410,
-    (Point(row=15, col=2), Player.white): 6638872806775387275,
-    (Point(row=15, col=3), Player.black): 18068778240481848704,
-    (Point(row=15, col=3), Player.white): 7358973906824809435,
-    (Point(row=15, col=4), Player.black): 17399917691778359017,
-    (Point(row=15, col=4), Player.white): 8742691627186742269,
-    (Point(row=15, col=5), Player.black): 17983332697682549322,
-    (Point(row=15, col=5), Player.white): 8897269849914803119,
-    (Point(row=15, col=6), Player.black): 11693595975457778174,
-    (Point(row=15, col=6), Player.white): 1925271774202689750,
-    (Point(row=15, col=7), Player.black): 16069776536703222670,
-    (Point(row=15, col=7), Player.white): 17352945175779504226,
-    (Point(row=15, col=8), Player.black): 4665123342355250112,
-    (Point(row=15, col=8), Player.white): 7423374050826405864,
-    (Point(row=15, col=9), Player.black): 1891236623877294283,
-    (Point(row=15, col=9), Player.white): 7709645081238376037,
-    (Point(row=15, col=10), Player.black): 3248829921155937747,
-    (Point(row=15, col=10), Player.white): 3830284024486078465,
-    (Point(row=15, col=11), Player.black): 5527538847230258275,
-    (Point(row=15, col=11), Player.white): 11622802973813970330,
-    (Point(row=15, col=12), Player.black): 17160619593685242970,
-    (Point(row=15, col=12), Player.white): 9671971395770509826,
-    (Point(row=15, col=13), Player.black): 16510888283135234592,
-    (Point(row=15, col=13), Player.white): 8184165775942079742,
-    (Point(row=15, col=14), Player.black): 16855081352766905435,
-    (Point(row=15, col=14), Player.white): 18322569520669752344,
-    (Point(row=15, col=15), Player.black): 16539098588685694484,
-    (Point(row=15, col=15), Player.white): 12865439480896377455,
-    (Point(row=15, col=16), Player.black): 4719355968425084747,
-    (Point(row=15, col=16), Player.white): 5974132450789817258,
-    (Point(row=15, col=17), Player.black): 2382320488990717280,
-    (Point(row=15, col=17), Player.white): 9493606620082333035,
-    (Point(row=15, col=18), Player.black): 5177356154763391867,
-    (Point(row=15, col=18), Player.white): 3072323055408499635,
-    (Point(row=15, col=19), Player.black): 12277945831353435375,
-    (Point(row=15, col=19), Player.white): 571623462131362306,
-    (Point(row=16, col=1), Player.black): 18421073044124686325,
-    (Point(row=16, col=1), Player.white): 6472248279230687101,
-    (Point(row=16, col=2), Player.black): 11959956618054561076,
-    (Point(row=16, col=2), Player.white): 1420216259733821450,
-    (Point(row=16, col=3), Player.black): 7143949247576213937,
-    (Point(row=16, col=3), Player.white): 2187380745744972249,
-    (Point(row=16, col=4), Player.black): 11740054714637589744,
-    (Point(row=16, col=4), Player.white): 8378277606663150872,
-    (Point(row=16, col=5), Player.black): 16668575073841863745,
-    (Point(row=16, col=5), Player.white): 8018849202865983112,
-    (Point(row=16, col=6), Player.black): 6759845553224615547,
-    (Point(row=16, col=6), Player.white): 3615160684903174062,
-    (Point(row=16, col=7), Player.black): 14651500973458993560,
-    (Point(row=16, col=7), Player.white): 5521208306648083751,
-    (Point(row=16, col=8), Player.black): 12965124121411018606,
-    (Point(row=16, col=8), Player.white): 9699867562127516030,
-    (Point(row=16, col=9), Player.black): 17390134351452525777,
-    (Point(row=16, col=9), Player.white): 4016663573836320015,
-    (Point(row=16, col=10), Player.black): 4761789413521389551,
-    (Point(row=16, col=10), Player.white): 6781264930494419568,
-    (Point(row=16, col=11), Player.black): 16729178485643246452,
-    (Point(row=16, col=11), Player.white): 12753253748052887805,
-    (Point(row=16, col=12), Player.black): 11556499353897468198,
-    (Point(row=16, col=12), Player.white): 8196006474959104884,
-    (Point(row=16, col=13), Player.black): 13778637695584462886,
-    (Point(row=16, col=13), Player.white): 910791758750877119,
-    (Point(row=16, col=14), Player.black): 12128582103953863327,
-    (Point(row=16, col=14), Player.white): 3421268255595455980,
-    (Point(row=16, col=15), Player.black): 1810152872349400164,
-    (Point(row=16, col=15), Player.white): 1391109332448397177,
-    (Point(row=16, col=16), Player.black): 9128226266514783904,
-    (Point(row=16, col=16), Player.white): 10390807893666776471,
-    (Point(row=16, col=17), Player.black): 10385215608530833105,
-    (Point(row=16, col=17), Player.white): 14028378965232959454,
-    (Point(row=16, col=18), Player.black): 17331533282763229359,
-    (Point(row=16, col=18), Player.white): 16500699173325995992,
-    (Point(row=16, col=19), Player.black): 13421500149714420958,
-    (Point(row=16, col=19), Player.white): 10934385633351457586,
-    (Point(row=17, col=1), Player.black): 7537693380234430382,
-    (Point(row=17, col=1), Player.white): 7540513027114693004,
-    (Point(row=17, col=2), Player.black): 12819331664573572428,
-    (Point(row=17, col=2), Player.white): 10895936556539712431,
-    (Point(row=17, col=3), Player.black): 17679197170855430038,
-    (Point(row=17, col=3), Player.white): 7689112914194533721,
-    (Point(row=17, col=4), Player.black): 10397734386565784282,
-    (Point(row=17, col=4), Player.white): 17705459813658535415,
-    (Point(row=17, col=5), Player.black): 11177206190131574075,
-    (Point(row=17, col=5), Player.white): 14034083641311786233,
-    (Point(row=17, col=6), Player.black): 2361382089987969730,
-    (Point(row=17, col=6), Player.white): 2245453463404124282,
-    (Point(row=17, col=7), Player.black): 810855305942153538,
-    (Point(row=17, col=7), Player.white): 15774029964699931669,
-    (Point(row=17, col=8), Player.black): 608067843193052109,
-    (Point(row=17, col=8), Player.white): 5837821711531758333,
-    (Point(row=17, col=9), Player.black): 7154243769346793815,
-    (Point(row=17, col=9), Player.white): 6761441924687270794,
-    (Point(row=17, col=10), Player.black): 15621258390440997029,
-    (Point(row=17, col=10), Player.white): 5696415593302241908,
-    (Point(row=17, col=11), Player.black): 14542583355977957829,
-    (Point(row=17, col=11), Player.white): 6998176170031106290,
-    (Point(row=17, col=12), Player.black): 5256776474856444106,
-    (Point(row=17, col=12), Player.white): 1806635705604751045,
-    (Point(row=17, col=13), Player.black): 17317792576326898094,
-    (Point(row=17, col=13), Player.white): 17469688760605632246,
-    (Point(row=17, col=14), Player.black): 3265661286258022103,
-    (Point(row=17, col=14), Player.white): 14219942454978291385,
-    (Point(row=17, col=15), Player.black): 14685988587708091728,
-    (Point(row=17, col=15), Player.white): 2109695895560366722,
-    (Point(row=17, col=16), Player.black): 6641575209425216619,
-    (Point(row=17, col=16), Player.white): 460266081088179598,
-    (Point(row=17, col=17), Player.black): 8044841968811174946,
-    (Point(row=17, col=17), Player.white): 6423157668447151621,
-    (Point(row=17, col=18), Player.black): 5864981668395925351,
-    (Point(row=17, col=18), Player.white): 9614476183505158995,
-    (Point(row=17, col=19), Player.black): 14974158657426765413,
-    (Point(row=17, col=19), Player.white): 10263419317251012885,
-    (Point(row=18, col=1), Player.black): 2466535222944927401,
-    (Point(row=18, col=1), Player.white): 3588111304585371805,
-    (Point(row=18, col=2), Player.black): 15640788809881310060,
-    (Point(row=18, col=2), Player.white): 8897748733477920926,
-    (Point(row=18, col=3), Player.black): 8493117134186830957,
-    (Point(row=18, col=3), Player.white): 5755480118018135477,
-    (Point(row=18, col=4), Player.black): 12553729341092857664,
-    (Point(row=18, col=4), Player.white): 13940844689551196454,
-    (Point(row=18, col=5), Player.black): 10967383031325520205,
-    (Point(row=18, col=5), Player.white): 2575451054269762368,
-    (Point(row=18, col=6), Player.black): 3045148164264639701,
-    (Point(row=18, col=6), Player.white): 17787849156816564432,
-    (Point(row=18, col=7), Player.black): 7840951418422764095,
-    (Point(row=18, col=7), Player.white): 3311919756331048986,
-    (Point(row=18, col=8), Player.black): 9218174129615494166,
-    (Point(row=18, col=8), Player.white): 3442915735229211874,
-    (Point(row=18, col=9), Player.black): 13833634704320828768,
-    (Point(row=18, col=9), Player.white): 11255453137301820161,
-    (Point(row=18, col=10), Player.black): 16547720093111131350,
-    (Point(row=18, col=10), Player.white): 14838728269314375863,
-    (Point(row=18, col=11), Player.black): 4068364830183500430,
-    (Point(row=18, col=11), Player.white): 3715614832809381100,
-    (Point(row=18, col=12), Player.black): 198261311559574981,
-    (Point(row=18, col=12), Player.white): 15543508312207973765,
-    (Point(row=18, col=13), Player.black): 15694333788512162110,
-    (Point(row=18, col=13), Player.white): 13526552223911759482,
-    (Point(row=18, col=14), Player.black): 8789245385932951402,
-    (Point(row=18, col=14), Player.white): 3603446488595937690,
-    (Point(row=18, col=15), Player.black): 16893901264890504170,
-    (Point(row=18, col=15), Player.white): 5201254719501764008,
-    (Point(row=18, col=16), Player.black): 1116466552251007282,
-    (Point(row=18, col=16), Player.white): 18007808485913166603,
-    (Point(row=18, col=17), Player.black): 5385573212665094083,
-    (Point(row=18, col=17), Player.white): 6223983387826730383,
-    (Point(row=18, col=18), Player.black): 10165899998843990223,
-    (Point(row=18, col=18), Player.white): 17515635516074980794,
-    (Point(row=18, col=19), Player.black): 11819119606101052701,
-    (Point(row=18, col=19), Player.white): 18445260999763230748,
-    (Point(row=19, col=1), Player.black): 13299609927336785508,
-    (Point(row=19, col=1), Player.white): 6684037148101568900,
-    (Point(row=19, col=2), Player.black): 9780578599020702067,
-    (Point(row=19, col=2), Player.white): 4043948385361714897,
-    (Point(row=19, col=3), Player.black): 1428630460970644536,
-    (Point(row=19, col=3), Player.white): 12911174140387544786,
-    (Point(row=19, col=4), Player.black): 207175165135628464,
-    (Point(row=19, col=4), Player.white): 1717681120647278979,
-    (Point(row=19, col=5), Player.black): 7034118690764480274,
-    (Point(row=19, col=5), Player.white): 7080636937977008134,
-    (Point(row=19, col=6), Player.black): 3065495571931312039,
-    (Point(row=19, col=6), Player.white): 1153819959391949451,
-    (Point(row=19, col=7), Player.black): 16149493546343684740,
-    (Point(row=19, col=7), Player.white): 8169586034427817624,
-    (Point(row=19, col=8), Player.black): 8820225890072566627,
-    (Point(row=19, col=8), Player.white): 13902138574540199731,
-    (Point(row=19, col=9), Player.black): 9724053988885881786,
-    (Point(row=19, col=9), Player.white): 15212222213387535553,
-    (Point(row=19, col=10), Player.black): 11714277604513819118,
-    (Point(row=19, col=10), Player.white): 14119696096691068234,
-    (Point(row=19, col=11), Player.black): 15920904246008891584,
-    (Point(row=19, col=11), Player.white): 11492415945411273464,
-    (Point(row=19, col=12), Player.black): 10726374795413015640,
-    (Point(row=19, col=12), Player.white): 10496864834673979602,
-    (Point(row=19, col=13), Player.black): 17821057823677584003,
-    (Point(row=19, col=13), Player.white): 13529190444741197959,
-    (Point(row=19, col=14), Player.black): 7327222921083423379,
-    (Point(row=19, col=14), Player.white): 6443221000202120885,
-    (Point(row=19, col=15), Player.black): 13091597610052190326,
-    (Point(row=19, col=15), Player.white): 8050327053362562424,
-    (Point(row=19, col=16), Player.black): 12741545642282267953,
-    (Point(row=19, col=16), Player.white): 3632576414757500309,
-    (Point(row=19, col=17), Player.black): 9846441381462989839,
-    (Point(row=19, col=17), Player.white): 16157636473855861500,
-    (Point(row=19, col=18), Player.black): 1614260135866547203,
-    (Point(row=19, col=18), Player.white): 8704940015972800067,
-    (Point(row=19, col=19), Player.black): 3050837049015186793,
-    (Point(row=19, col=19), Player.white): 17886424507115285688,
-}
+Codes are random 64 bit numbers drawn, for one board size at a time, from a NumPy generator seeded with SEED and
+the board dimensions, so every process computes the same hashes. They are generated on first use and cached.
+
+A point lives at flat index row * (num_cols + 2) + col, the layout of dlgo.goboard_fast; the border and the EMPTY
+color have code 0. Besides the stones there are codes for the side to move, the simple ko point and a pass as last
+move, to fold a whole situation into one number (dlgo.mcts.transposition.position_key).
+"""
+from __future__ import annotations
+import numpy as np
+
+from typing import Dict, List, Tuple
+from dlgo.gotypes import Player, Point
+
+__all__ = [
+    'EMPTY_BOARD',
+    'SEED',
+    'ZobristCodes',
+    'get_codes',
+]
 
 EMPTY_BOARD = 0
+SEED = 20180601
+
+
+class ZobristCodes:
+    def __init__(self, num_rows: int, num_cols: int):
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.stride = num_cols + 2
+        size = (num_rows + 2) * self.stride
+        on_board = np.zeros((num_rows + 2, self.stride), dtype=bool)
+        on_board[1:-1, 1:-1] = True
+        on_board = on_board.ravel()
+
+        rng = np.random.default_rng([SEED, num_rows, num_cols])
+        self.stones = np.zeros((3, size), dtype=np.uint64)  # stones[color, index], color: Player.value
+        self.stones[1:, on_board] = _draw(rng, (2, num_rows * num_cols))
+        self.ko = np.zeros(size, dtype=np.uint64)  # ko[index]: the simple ko point
+        self.ko[on_board] = _draw(rng, num_rows * num_cols)
+        self.side_to_move, self.last_pass = (int(code) for code in _draw(rng, 2))  # white to move, last move a pass
+
+        # The stone codes as Python ints, for incremental hashing: NumPy scalars are slow to XOR one at a time
+        self.stone_codes: Tuple[List[int], ...] = tuple(self.stones.tolist())
+
+    def index(self, point: Point) -> int:
+        return point.row * self.stride + point.col
+
+    def stone(self, point: Point, player: Player) -> int:
+        return self.stone_codes[player.value][point.row * self.stride + point.col]
+
+
+def _draw(rng: np.random.Generator, shape) -> np.ndarray:
+    return rng.integers(0, 2 ** 64, size=shape, dtype=np.uint64)
+
+
+_codes: Dict[Tuple[int, int], ZobristCodes] = {}
+
+
+def get_codes(num_rows: int, num_cols: int) -> ZobristCodes:
+    codes = _codes.get((num_rows, num_cols))
+    if codes is None:
+        codes = ZobristCodes(num_rows, num_cols)
+        _codes[num_rows, num_cols] = codes
+    return codes
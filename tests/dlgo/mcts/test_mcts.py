@@ -0,0 +1,186 @@
+import random
+import numpy as np
+
+from dlgo import goboard_fast
+from dlgo.agent.helpers import is_point_an_eye
+from dlgo.agent.random_bot import FastRandomAgent
+from dlgo.goboard import Move
+from dlgo.gotypes import Player, Point
+from dlgo.mcts.mcts import MCTSAgent, MCTSNode, SearchBudget, is_decided
+from dlgo.mcts.rollout import ProcessPoolRollouts
+from dlgo.mcts.transposition import TranspositionTable
+
+
+def test_search_modes():
+    game = goboard_fast.GameState.new_game(5)
+    for search_mode, rollouts_per_round in (('serial', 2), ('tree', 1), ('root', 1)):
+        agent = MCTSAgent(60, temperature=1.4, rollout_backend='local', search_mode=search_mode, reuse_tree=False)
+        agent.rollouts = ProcessPoolRollouts(num_workers=2)
+        search = {'serial': agent.search, 'tree': agent.search_tree_parallel, 'root': agent.search_root_parallel}
+        with agent.rollouts:
+            root = search[search_mode](game)
+            assert game.is_valid_move(agent.select_move(game))
+        assert sum(child.num_rollouts for child in root.children) == 60 * rollouts_per_round
+        assert all(child.virtual_losses == 0 for child in root.children)
+
+
+def test_pipelined_tree_search():
+    random.seed(8)
+    game = goboard_fast.GameState.new_game(5)
+    for backend in ('local', 'process'):
+        agent = MCTSAgent(80, temperature=1.4, rollout_backend='local', search_mode='tree', leaves_in_flight=4,
+                          reuse_tree=False, verbose=False)
+        if backend == 'process':
+            agent.rollouts = ProcessPoolRollouts(num_workers=2)
+        with agent.rollouts:
+            root = agent.search_tree_parallel(game)
+        metrics = agent.diagnostics()
+        assert metrics['rounds'] == metrics['rollouts'] == root.num_rollouts == 80
+        nodes = [root]
+        while nodes:
+            node = nodes.pop()
+            assert node.virtual_losses == 0 and not node.edge_virtual_losses.any()
+            nodes.extend(node.children)
+
+
+def test_edge_statistics_match_children():
+    random.seed(9)
+    game = goboard_fast.GameState.new_game(5)
+    for search_mode in ('serial', 'tree'):
+        agent = MCTSAgent(200, temperature=1.4, rollout_backend='local', search_mode=search_mode,
+                          leaves_in_flight=4, reuse_tree=False, verbose=False)
+        root = agent.search(game) if search_mode == 'serial' else agent.search_tree_parallel(game)
+        nodes = [root]
+        while nodes:
+            node = nodes.pop()
+            n = len(node.children)
+            player = node.game_state.next_player
+            assert list(node.edge_rollouts[:n]) == [child.num_rollouts for child in node.children]
+            assert list(node.edge_wins[:n]) == [child.win_counts[player] for child in node.children]
+            assert not node.edge_virtual_losses.any()
+            nodes.extend(node.children)
+
+
+def test_expansion_covers_legal_moves():
+    random.seed(10)
+    bot = FastRandomAgent()
+    game = goboard_fast.GameState.new_game(5)
+    while not game.is_over():
+        node = MCTSNode(game)
+        expanded = []
+        while node.can_add_child():
+            expanded.append(node.add_random_child().last_move)
+        player = game.next_player
+        expected = [move for move in game.legal_moves()
+                    if not move.is_play or not is_point_an_eye(game.board, move.point, player)]
+        assert len(expanded) == len(expected) and set(expanded) == set(expected)
+        game = game.apply_move(bot.select_move(game))
+
+    # Black cannot play anywhere: every empty point is a suicide
+    board = goboard_fast.Board(3, 3)
+    for point in (Point(1, 2), Point(2, 1), Point(2, 2), Point(2, 3), Point(3, 2)):
+        board.place_stone(Player.white, point)
+    node = MCTSNode(goboard_fast.GameState(board, Player.black, None, None))
+    expanded = []
+    while node.can_add_child():
+        expanded.append(node.add_random_child().last_move)
+    assert set(expanded) == {Move.pass_turn(), Move.resign()}
+    assert not node.can_add_child()
+
+
+def test_transposition_table():
+    game = goboard_fast.GameState.new_game(5)
+    a, b, c = (Move.play(Point(1, col)) for col in (1, 2, 3))
+    table = TranspositionTable(2)
+    first = MCTSNode(game.apply_move(a).apply_move(b).apply_move(c))
+    table.put(first)
+    # Same position and player to move through another move order
+    assert table.get(game.apply_move(c).apply_move(b).apply_move(a)) is first
+    assert table.get(game.apply_move(a).apply_move(b)) is None
+    table.put(MCTSNode(game.apply_move(a)))
+    table.put(MCTSNode(game.apply_move(b)))
+    assert len(table) == 2 and table.evictions == 1
+    assert table.get(first.game_state) is None
+
+    random.seed(4)
+    agent = MCTSAgent(300, temperature=1.4, rollout_backend='local', transpositions=1000)
+    root = agent.search(goboard_fast.GameState.new_game(3))
+    assert sum(child.num_rollouts for child in root.children) == 300
+    assert agent.table.hits > 0
+
+
+def test_tree_reuse():
+    random.seed(6)
+    agent = MCTSAgent(400, temperature=1.4, rollout_backend='local')
+    game = goboard_fast.GameState.new_game(5)
+    move = agent.select_move(game)
+    node = agent.root.children[agent.root.child_moves.index(move)]
+    reply = max(zip(node.children, node.child_moves), key=lambda c: c[0].num_rollouts)
+    game = game.apply_move(move).apply_move(reply[1])
+    agent.select_move(game)
+    assert agent.root is reply[0] and agent.root.parent is None
+    assert agent.diagnostics()['reused_rollouts'] == reply[0].num_rollouts - 400
+
+
+def test_rave():
+    random.seed(7)
+    agent = MCTSAgent(200, temperature=1.4, rollout_backend='local', rave=1000)
+    game = goboard_fast.GameState.new_game(5)
+    root = agent.search(game)
+    assert sum(child.num_rollouts for child in root.children) == 200
+    # Each rollout counts once for each point the player to move played first, in the tree or in the playout
+    assert root.amaf_rollouts[-1] == 0
+    assert root.amaf_rollouts.max() <= root.num_rollouts
+    for child, point in zip(root.children, root.edge_points):
+        if point >= 0:
+            assert root.amaf_rollouts[point] >= child.num_rollouts
+    # Leaves learn from their own rollouts as well
+    nodes = list(root.children)
+    while nodes:
+        node = nodes.pop()
+        assert node.amaf_rollouts is not None and node.amaf_rollouts.max() <= node.num_rollouts
+        nodes.extend(node.children)
+    assert game.is_valid_move(agent.select_move(game))
+
+
+def test_search_budget():
+    budget = SearchBudget(100)
+    assert not budget.exhausted(99) and budget.exhausted(100)
+    assert budget.rounds_left(40) == 60
+    assert is_decided(np.array([30, 9, 0]), 20) and not is_decided(np.array([30, 10, 0]), 20)
+
+    game = goboard_fast.GameState.new_game(5)
+    agent = MCTSAgent(0, temperature=1.4, rollout_backend='local', time_limit=0.2)
+    agent.search(game)
+    diagnostics = agent.diagnostics()
+    # The clock stopped the search: it used up the limit; the upper bound only guards against not stopping at all
+    assert diagnostics['rounds'] > 0
+    assert 0.2 <= diagnostics['time'] < 5.0
+
+    random.seed(8)
+    agent = MCTSAgent(3000, temperature=0.5, rollout_backend='local', early_stop=True, reuse_tree=False)
+    root = agent.search(game)
+    diagnostics = agent.diagnostics()
+    assert diagnostics['stopped_early'] and diagnostics['rounds'] < 3000
+    visits = sorted(child.num_rollouts for child in root.children)
+    assert visits[-1] - visits[-2] > 3000 - diagnostics['rounds']
+
+
+def test_diagnostics():
+    random.seed(9)
+    agent = MCTSAgent(200, temperature=1.4, rollout_backend='local', verbose=False)
+    game = goboard_fast.GameState.new_game(5)
+    agent.select_move(game)
+    diagnostics = agent.diagnostics()
+    nodes = [(agent.root, 0)]
+    depths = []
+    while nodes:
+        node, depth = nodes.pop()
+        depths.append(depth)
+        nodes.extend((child, depth + 1) for child in node.children)
+    assert diagnostics['rounds'] == diagnostics['rollouts'] == 200
+    assert diagnostics['tree_size'] == len(depths)
+    assert diagnostics['max_depth'] == max(depths)
+    assert 1 <= diagnostics['avg_depth'] <= diagnostics['max_depth']
+    assert diagnostics['playouts_per_sec'] > 0
+    assert diagnostics['simulate_time'] + diagnostics['select_time'] <= diagnostics['time']
@@ -0,0 +1,41 @@
+import random
+
+from dlgo import goboard_fast
+from dlgo.goboard import Move
+from dlgo.gotypes import Point
+from dlgo.mcts.mcts import MCTSAgent, candidate_moves
+from dlgo.mcts.prior import CAPTURE, SAVE, move_priors, order_by_prior
+
+
+def test_move_priors():
+    game = goboard_fast.GameState.new_game(5)
+    # The white stone in the corner is in atari, black to play next to the last white move
+    for point in (Point(1, 2), Point(1, 1), Point(3, 3), Point(5, 4)):
+        game = game.apply_move(Move.play(point))
+    capture = Move.play(Point(2, 1))
+    moves = candidate_moves(game)
+    priors = dict(zip(moves, move_priors(game, moves)))
+    assert priors[capture] >= CAPTURE
+    assert max(priors, key=priors.get) == capture
+    assert priors[Move.pass_turn()] < 0 and priors[Move.resign()] < 0
+    assert priors[Move.play(Point(4, 4))] > priors[Move.play(Point(1, 5))]
+    assert order_by_prior(game, moves)[-1] == capture
+
+
+def test_move_priors_count_each_string_once():
+    game = goboard_fast.GameState.new_game(5)
+    # The black string in the corner is in atari and touches (2, 1) from above and from the right
+    for point in (Point(1, 1), Point(1, 3), Point(1, 2), Point(2, 3), Point(2, 2), Point(3, 2)):
+        game = game.apply_move(Move.play(point))
+    save = Move.play(Point(2, 1))
+    prior, = move_priors(game, [save])
+    assert SAVE <= prior < 2 * SAVE
+
+
+def test_progressive_widening():
+    random.seed(10)
+    game = goboard_fast.GameState.new_game(9)
+    agent = MCTSAgent(100, temperature=1.4, rollout_backend='local', widening=1.0, verbose=False)
+    root = agent.search(game)
+    assert sum(child.num_rollouts for child in root.children) == 100
+    assert len(root.children) <= 1 + 10
@@ -0,0 +1,30 @@
+import pytest
+
+from dlgo import goboard_fast
+from dlgo.mcts.rollout import LocalRollouts, ProcessPoolRollouts, ZmqRollouts, create_rollout_backend
+
+
+def test_process_pool_rollouts():
+    game = goboard_fast.GameState.new_game(5)
+    for move in game.legal_moves()[:6]:
+        game = game.apply_move(move)
+    with ProcessPoolRollouts(num_workers=2, games_per_task=3) as rollouts:
+        stats = rollouts.simulate(game)
+        assert stats.num_games == 6
+        assert sum(stats.black_owned) + sum(stats.white_owned) <= 6 * 25
+        assert rollouts.submit(game).result().num_games == 3
+        pool = rollouts.pool
+        rollouts.simulate(game)
+        assert rollouts.pool is pool  # the workers stay up between iterations
+    assert rollouts._pool is None
+    assert isinstance(create_rollout_backend('local'), LocalRollouts)
+
+
+def test_zmq_rollouts_close_fails_pending_requests():
+    game = goboard_fast.GameState.new_game(5)
+    rollouts = ZmqRollouts('tcp://127.0.0.1:5599')  # no server: the requests stay unanswered
+    futures = [rollouts.submit(game) for _ in range(3)]
+    rollouts.close()
+    assert all(isinstance(future.exception(timeout=1), RuntimeError) for future in futures)
+    with pytest.raises(RuntimeError):
+        rollouts.submit(game)
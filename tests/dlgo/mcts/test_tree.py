@@ -0,0 +1,38 @@
+import random
+
+from dlgo import goboard_fast
+from dlgo.gotypes import Player
+from dlgo.mcts.tree import CompactMCTSAgent, TreeStore
+from dlgo.playout.playout import RolloutStats
+
+
+def test_tree_store_moves_full_children_blocks():
+    store = TreeStore(Player.black)
+    first = store.add_child(0, 0)
+    path = [0, first]  # held by a pending rollout while the block moves
+    for move in range(1, 10):
+        store.add_child(0, move)
+    # The root's block was moved twice, the old index of the first child forwards to the new one
+    moved = store.resolve(first)
+    assert moved != first and store.move[moved] == 0 and store.parent[moved] == 0
+    assert list(store.move[list(store.children(0))]) == list(range(10))
+    grandchild = store.add_child(moved, 5)
+    assert store.parent[grandchild] == moved and store.player[grandchild] == Player.black.value
+
+    stats = RolloutStats(0)
+    stats.add_winner(Player.white, 3)
+    store.backpropagate(path + [grandchild], stats)
+    assert store.visits[0] == store.visits[moved] == store.visits[grandchild] == 3
+    assert store.black_wins[moved] == 0
+
+
+def test_compact_search():
+    random.seed(3)
+    game = goboard_fast.GameState.new_game(5)
+    for search_mode in ('serial', 'tree'):
+        agent = CompactMCTSAgent(200, temperature=1.4, rollout_backend='local', search_mode=search_mode)
+        assert game.is_valid_move(agent.select_move(game))
+        store = agent.store
+        assert store.visits[0] == 200
+        assert sum(store.visits[list(store.children(0))]) == 200
+        assert not store.virtual_losses.any()
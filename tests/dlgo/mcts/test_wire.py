@@ -0,0 +1,26 @@
+import random
+
+from dlgo import goboard, goboard_fast
+from dlgo.agent.random_bot import FastRandomAgent
+from dlgo.mcts.wire import decode_game_state, decode_task, encode_game_state, encode_task
+
+
+def test_game_state_round_trip():
+    random.seed(5)
+    for game_class in (goboard.GameState, goboard_fast.GameState):
+        game = game_class.new_game(9)
+        bot = FastRandomAgent()
+        while not game.is_over():
+            data = encode_game_state(game)
+            decoded = decode_game_state(data)
+            assert decoded.board.zobrist_hash() == game.board.zobrist_hash()
+            assert decoded.next_player == game.next_player
+            assert decoded.last_move == game.last_move
+            assert decoded.ko_point == game.ko_point
+            assert decoded.legal_moves() == game.legal_moves()
+            game = game.apply_move(bot.select_move(game))
+        assert decode_game_state(encode_game_state(game)).is_over()
+
+    decoded, num_games = decode_task(encode_task(encode_game_state(game), 8))
+    assert num_games == 8
+    assert decoded.board.zobrist_hash() == game.board.zobrist_hash()
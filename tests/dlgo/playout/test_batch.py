@@ -0,0 +1,30 @@
+import numpy as np
+
+from dlgo import goboard_fast
+from dlgo.gotypes import Player
+from dlgo.playout.batch import BatchPlayout
+from dlgo.playout.playout import PlayoutBoard
+
+
+def test_batch_playout():
+    np.random.seed(2)
+    board_size = 9
+    batch = BatchPlayout(goboard_fast.GameState.new_game(board_size), 32)
+    results = batch.run()
+    assert len(results) == 32
+    assert set(r.winner for r in results) == {Player.black, Player.white}
+
+    # Labels were kept up to date move by move, and no string is left without liberties
+    stones = batch.stones
+    is_stone = (stones == 1) | (stones == 2)
+    assert (batch.labels == batch.label_strings())[is_stone].all()
+    assert (batch.count_liberties() > 0)[is_stone].all()
+
+    # Same area score as the single playout board
+    for i, result in enumerate(results):
+        board = PlayoutBoard(board_size, board_size)
+        flat = stones[i].ravel()
+        for p in board.layout.on_board:
+            if flat[p] in (1, 2):
+                board.play(int(flat[p]), p)
+        assert board.score() == result.score
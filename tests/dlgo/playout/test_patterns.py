@@ -0,0 +1,42 @@
+import random
+
+from dlgo import goboard_fast
+from dlgo.goboard import Move
+from dlgo.goboard_fast import BLACK, WHITE
+from dlgo.gotypes import Player, Point
+from dlgo.playout.patterns import HeavyPolicy, matches_pattern
+from dlgo.playout.playout import PlayoutBoard, play_out
+
+
+def board_with(stones):
+    board = PlayoutBoard(5, 5)
+    for color, point in stones:
+        board.play(color, board.layout.index(point))
+    return board
+
+
+def test_patterns():
+    # Hane: the move at (3, 3) under an X O X row, in any orientation and for either color
+    for x, o in ((BLACK, WHITE), (WHITE, BLACK)):
+        board = board_with([(x, Point(2, 2)), (o, Point(2, 3)), (x, Point(2, 4))])
+        assert matches_pattern(board, board.layout.index(Point(3, 3)))
+        board = board_with([(x, Point(2, 2)), (o, Point(3, 2)), (x, Point(4, 2))])
+        assert matches_pattern(board, board.layout.index(Point(3, 3)))
+    assert not matches_pattern(board_with([]), board_with([]).layout.index(Point(3, 3)))
+
+
+def test_heavy_policy():
+    policy = HeavyPolicy()
+    # White's last move put the black stone in the corner in atari: black extends
+    board = board_with([(BLACK, Point(1, 1)), (WHITE, Point(1, 2))])
+    last = board.layout.index(Point(1, 2))
+    assert policy.select_move(board, BLACK, last) == board.layout.index(Point(2, 1))
+    # Black's last move is in atari: white captures it
+    board = board_with([(WHITE, Point(1, 2)), (BLACK, Point(1, 1))])
+    assert policy.select_move(board, WHITE, board.layout.index(Point(1, 1))) == board.layout.index(Point(2, 1))
+
+    random.seed(3)
+    game = goboard_fast.GameState.new_game(9).apply_move(Move.play(Point(5, 5)))
+    result = play_out(game, policy=policy)
+    assert result.winner in (Player.black, Player.white)
+    assert result.score.b + result.score.w > 81 * 0.8
@@ -0,0 +1,64 @@
+import random
+
+from dlgo import goboard_fast
+from dlgo.agent.random_bot import FastRandomAgent
+from dlgo.gotypes import Player
+from dlgo.playout.playout import PlayoutBoard, RolloutStats, play_out
+from dlgo.scoring import compute_game_result
+
+
+def test_playout_board_follows_game():
+    random.seed(5)
+    game = goboard_fast.GameState.new_game(9)
+    board = PlayoutBoard(9, 9)
+    bot = FastRandomAgent()
+    while not game.is_over():
+        move = bot.select_move(game)
+        if move.is_play:
+            p = board.layout.index(move.point)
+            assert p != board.ko
+            assert board.is_legal(game.next_player.value, p)
+            board.play(game.next_player.value, p)
+        game = game.apply_move(move)
+        for p in board.layout.on_board:
+            assert board.stones[p] == game.board.stones[p]
+        assert sorted(board.empties) == [p for p in board.layout.on_board if board.stones[p] == 0]
+        for p in board.empties:
+            for color in (Player.black, Player.white):
+                assert board.is_eye(color.value, p) == game.board.is_eye(color.value, p)
+    assert board.score() == compute_game_result(game)
+
+
+def test_play_out():
+    random.seed(1)
+    for board_size in (5, 9, 19):
+        game = goboard_fast.GameState.new_game(board_size)
+        result = play_out(game)
+        assert result.winner in (Player.black, Player.white)
+        assert result.winner == result.score.winner
+        # Random non-eye play fills the board up to the eyes
+        assert result.score.b + result.score.w > board_size * board_size * 0.8
+        assert result.num_moves > board_size * board_size / 2
+
+
+def test_rollout_stats():
+    random.seed(2)
+    game = goboard_fast.GameState.new_game(5)
+    stats = RolloutStats(25)
+    results = [play_out(game) for _ in range(10)]
+    for result in results:
+        stats.add(result)
+    assert stats.black_wins == sum(r.winner == Player.black for r in results)
+    assert stats.num_games == 10
+    assert stats.black_owned[0] == sum(r.ownership[0] == Player.black.value for r in results)
+    assert sum(stats.black_owned) == sum(r.score.b for r in results)
+    assert stats.black_played[12] == sum(r.first_played[12] == Player.black.value for r in results)
+    assert stats.black_played_wins[12] == sum(r.first_played[12] == Player.black.value and r.winner == Player.black
+                                              for r in results)
+
+    decoded = RolloutStats.from_bytes(stats.to_bytes())
+    decoded.merge(stats)
+    assert decoded.white_wins == 2 * stats.white_wins
+    assert decoded.average_margin == stats.average_margin
+    assert list(decoded.white_owned) == [2 * n for n in stats.white_owned]
+    assert list(decoded.white_played_wins) == [2 * n for n in stats.white_played_wins]
@@ -1,4 +1,8 @@
-from dlgo.goboard import Board
+import random
+
+from dlgo import goboard_fast
+from dlgo.agent.random_bot import FastRandomAgent
+from dlgo.goboard import EMPTY_HISTORY, Board, GameState, Move
 from dlgo.gotypes import Player, Point
 from typing import List
 
@@ -66,3 +70,68 @@ def test_is_self_capture_01():
     assert board.will_capture(Player.white, Point(9, 9))
     assert not board.is_self_capture(Player.white, Point(9, 9))
     assert board.is_self_capture(Player.black, Point(9, 9))
+
+
+def play_ko_position(game_state_class):
+    """
+    Black captures the white stone at Point(2, 2), white may not take back at once
+        '.xo..',
+        'xo.o.',
+        '.xo..',
+    """
+    game = game_state_class.new_game(5)
+    for black, white in [((1, 2), (1, 3)), ((2, 1), (2, 4)), ((3, 2), (3, 3)), ((5, 5), (2, 2))]:
+        game = game.apply_move(Move.play(Point(*black)))
+        game = game.apply_move(Move.play(Point(*white)))
+    return game.apply_move(Move.play(Point(2, 3)))
+
+
+def test_ko():
+    for game_state_class in (GameState, goboard_fast.GameState):
+        game = play_ko_position(game_state_class)
+        assert game.board.get(Point(2, 2)) is None
+        assert game.ko_point == Point(2, 2)
+        retake = Move.play(Point(2, 2))
+        assert not game.is_valid_move(retake)
+
+        game.superko = False
+        assert not game.is_valid_move(retake)
+        game.superko = True
+
+        # Ko threat and answer elsewhere, then the ko can be retaken
+        game = game.apply_move(Move.play(Point(5, 1))).apply_move(Move.play(Point(4, 5)))
+        assert game.ko_point is None
+        assert game.is_valid_move(retake)
+
+        # Situations are remembered along the whole line, one node per state
+        assert len(game.previous_states) == 11
+        assert (Player.black, play_ko_position(game_state_class).previous_state.board.zobrist_hash()) in \
+            game.previous_states
+
+
+def test_hash_after():
+    random.seed(17)
+    for game_state_class in (GameState, goboard_fast.GameState):
+        game = game_state_class.new_game(5)
+        bot = FastRandomAgent()
+        while not game.is_over():
+            before = game.board.zobrist_hash()
+            for move in game.legal_moves()[:-2]:
+                expected = game.apply_move(move).board.zobrist_hash()
+                assert game.board.hash_after(game.next_player, move.point) == expected
+            assert game.board.zobrist_hash() == before
+            game = game.apply_move(bot.select_move(game))
+
+
+def test_situation_history_branches():
+    random.seed(19)
+    situations = [(player, code) for player in Player for code in range(6)]
+    histories = [EMPTY_HISTORY]
+    for _ in range(300):
+        # Mostly extend the newest history, sometimes branch off an older one
+        parent = histories[-1] if random.random() < 0.7 else random.choice(histories)
+        histories.append(parent.extended(random.choice(situations)))
+    for history in histories:
+        assert len(list(history)) == len(history)
+        for situation in situations:
+            assert (situation in history) == (situation in list(history))
@@ -0,0 +1,188 @@
+import copy
+import random
+
+from dlgo import goboard
+from dlgo import goboard_fast
+from dlgo.agent.helpers import is_point_an_eye
+from dlgo.agent.random_bot import FastRandomAgent
+from dlgo.gotypes import Player, Point
+from typing import List
+
+CHAR_TO_PLAYER = {
+    '.': None,
+    'x': Player.black,
+    'o': Player.white,
+}
+
+
+def board_from_list(board_list: List[str]) -> goboard_fast.Board:
+    board = goboard_fast.Board(len(board_list), len(board_list[0]))
+    for row, line in enumerate(board_list, 1):
+        for col, ch in enumerate(line, 1):
+            if ch != '.':
+                board.place_stone(CHAR_TO_PLAYER[ch], Point(row, col))
+    return board
+
+
+def assert_same_position(slow: goboard.Board, fast: goboard_fast.Board):
+    assert slow.zobrist_hash() == fast.zobrist_hash()
+    for r in range(1, slow.num_rows + 1):
+        for c in range(1, slow.num_cols + 1):
+            p = Point(r, c)
+            assert slow.get(p) == fast.get(p)
+            slow_string = slow.get_go_string(p)
+            fast_string = fast.get_go_string(p)
+            if slow_string is None:
+                assert fast_string is None
+            else:
+                assert slow_string.stones == fast_string.stones
+                assert slow_string.liberties == fast_string.liberties
+            for player in (Player.black, Player.white):
+                if slow.get(p) is None:
+                    assert slow.is_self_capture(player, p) == fast.is_self_capture(player, p)
+                    assert slow.will_capture(player, p) == fast.will_capture(player, p)
+
+
+def test_is_self_capture_01():
+    b: List[str] = [
+        '.x.......',
+        'xx.......',
+        '.........',
+        '..o...x..',
+        '.o.o.o.o.',
+        '..o...o..',
+        '........o',
+        'xo.....ox',
+        '.xo...ox.',
+    ]
+    board = board_from_list(b)
+
+    assert board.is_self_capture(Player.white, Point(1, 1))
+    assert not board.is_self_capture(Player.black, Point(1, 1))
+
+    assert board.is_self_capture(Player.black, Point(5, 3))
+    assert not board.is_self_capture(Player.white, Point(5, 3))
+
+    assert not board.is_self_capture(Player.black, Point(5, 7))
+    assert not board.is_self_capture(Player.white, Point(5, 7))
+
+    assert board.will_capture(Player.white, Point(9, 9))
+    assert not board.is_self_capture(Player.white, Point(9, 9))
+    assert board.is_self_capture(Player.black, Point(9, 9))
+
+
+def test_random_games_match_reference_board():
+    random.seed(7)
+    for board_size in (5, 9):
+        for _ in range(3):
+            slow_game = goboard.GameState.new_game(board_size)
+            fast_game = goboard_fast.GameState.new_game(board_size)
+            bot = FastRandomAgent()
+            while not fast_game.is_over():
+                move = bot.select_move(fast_game)
+                assert slow_game.is_valid_move(move)
+                slow_game = slow_game.apply_move(move)
+                fast_game = fast_game.apply_move(move)
+                assert isinstance(fast_game, goboard_fast.GameState)
+                assert_same_position(slow_game.board, fast_game.board)
+                for point in fast_game.board.layout.points:
+                    for player in (Player.black, Player.white):
+                        if point is not None:
+                            assert is_point_an_eye(fast_game.board, point, player) == \
+                                   is_point_an_eye(slow_game.board, point, player)
+            assert slow_game.winner() == fast_game.winner()
+
+
+def test_make_move_undo_redo():
+    random.seed(11)
+    for board_class in (goboard.Board, goboard_fast.Board):
+        game = goboard_fast.GameState.new_game(7)
+        board = board_class(7, 7)
+        bot = FastRandomAgent()
+        history = []
+        while not game.is_over():
+            move = bot.select_move(game)
+            game = game.apply_move(move)
+            if move.is_play:
+                history.append((board.zobrist_hash(), game.next_player.opposite, move.point))
+                board.make_move(game.next_player.opposite, move.point)
+                assert board.zobrist_hash() == game.board.zobrist_hash()
+                assert board.ko_point == game.board.ko_point
+        final = copy.deepcopy(board)
+
+        for expected_hash, _, _ in reversed(history):
+            board.undo()
+            assert board.zobrist_hash() == expected_hash
+        assert board == board_class(7, 7)
+        if board_class is goboard_fast.Board:
+            assert board.surround == goboard_fast.Board(7, 7).surround
+
+        while board.can_redo():
+            board.redo()
+        assert_same_position(final, board)
+
+
+def test_move_ages_follow_copies_and_undo():
+    random.seed(5)
+    for game in (goboard.GameState.new_game(5), goboard_fast.GameState.new_game(5)):
+        bot = FastRandomAgent()
+        expected = {}  # point -> age, the way MoveAge used to count: all ages up by one for every stone
+        states = [game]
+        while not game.is_over():
+            move = bot.select_move(game)
+            game = game.apply_move(move)
+            states.append(game)
+            if move.is_play:
+                expected = {point: age + 1 for point, age in expected.items() if game.board.get(point) is not None}
+                expected[move.point] = 0
+            ages = game.board.move_ages
+            for row in range(1, 6):
+                for col in range(1, 6):
+                    assert ages.get(row - 1, col - 1) == expected.get(Point(row, col), -1)
+        assert (states[0].board.move_ages.move_ages == -1).all()
+
+        search = states[len(states) // 2].clone()
+        before = search.board.move_ages.move_ages
+        for move in search.legal_moves():
+            search.make_move(move)
+            search.unmake_move()
+            assert (search.board.move_ages.move_ages == before).all()
+
+
+def test_game_state_make_unmake_move():
+    random.seed(3)
+    game = goboard_fast.GameState.new_game(5)
+    bot = FastRandomAgent()
+    for _ in range(30):
+        game = game.apply_move(bot.select_move(game))
+    search = game.clone()
+    moves = game.legal_moves()
+    for move in moves:
+        search.make_move(move)
+        assert search.next_player == game.next_player.opposite
+        assert search.last_move == move
+        search.unmake_move()
+        assert search.board == game.board
+        assert search.next_player == game.next_player
+        assert search.legal_moves() == moves
+
+
+def test_legal_moves_match_full_check():
+    random.seed(13)
+    for board_size in (4, 7):
+        for _ in range(3):
+            game = goboard_fast.GameState.new_game(board_size)
+            bot = FastRandomAgent()
+            search = game.clone()
+            while not game.is_over():
+                expected = goboard.GameState.legal_moves(game)
+                assert game.legal_moves() == expected
+                move = bot.select_move(game)
+                game = game.apply_move(move)
+                # make_move / unmake_move keep the bookkeeping too
+                search.make_move(move)
+                assert search.legal_moves() == goboard.GameState.legal_moves(search)
+                if move.is_play:
+                    search.unmake_move()
+                    assert search.legal_moves() == expected
+                    search.make_move(move)
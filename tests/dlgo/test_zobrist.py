@@ -0,0 +1,39 @@
+import numpy as np
+
+from dlgo import goboard, goboard_fast, zobrist
+from dlgo.goboard import Move
+from dlgo.gotypes import Player, Point
+from dlgo.mcts.transposition import position_key
+
+
+def test_codes_are_deterministic():
+    codes = zobrist.get_codes(9, 9)
+    assert zobrist.get_codes(9, 9) is codes
+    again = zobrist.ZobristCodes(9, 9)
+    assert (again.stones == codes.stones).all() and (again.ko == codes.ko).all()
+    assert codes.stones.dtype == np.uint64
+
+    on_board = codes.stones[1:].reshape(2, 11, 11)[:, 1:-1, 1:-1]
+    assert len(np.unique(on_board)) == 2 * 81
+    assert codes.stones[0].sum() == 0 and codes.stones[1].reshape(11, 11)[0].sum() == 0
+    assert codes.stone(Point(3, 4), Player.white) == int(codes.stones[Player.white.value, codes.index(Point(3, 4))])
+
+    assert (zobrist.get_codes(5, 7).stones != 0).sum() == 2 * 35
+
+
+def test_both_boards_hash_alike():
+    for size in (5, 19):
+        slow = goboard.Board(size, size)
+        fast = goboard_fast.Board(size, size)
+        for board in (slow, fast):
+            board.place_stone(Player.black, Point(1, 1))
+            board.place_stone(Player.white, Point(size, size))
+        assert slow.zobrist_hash() == fast.zobrist_hash() != zobrist.EMPTY_BOARD
+
+
+def test_position_key():
+    game = goboard_fast.GameState.new_game(5).apply_move(Move.play(Point(3, 3)))
+    passed = game.apply_move(Move.pass_turn())
+    assert position_key(passed) != position_key(game)  # same stones, other player to move
+    assert position_key(passed.apply_move(Move.pass_turn())) != position_key(game)  # and a pass before
+    assert position_key(game) == position_key(game.clone())